@@ -13,6 +13,7 @@ CREATE TABLE usuario (
     nome_completo VARCHAR(200) NOT NULL,
     nome_social VARCHAR(200) NULL,
     cpf VARCHAR(14) UNIQUE NOT NULL,
+    cpf_digitos VARCHAR(14) AS (REPLACE(REPLACE(REPLACE(cpf, '.', ''), '-', ''), ' ', '')) STORED COMMENT 'CPF só com dígitos, para a busca do admin por índice.',
     email VARCHAR(150) UNIQUE NOT NULL,
     senha VARCHAR(255) NOT NULL COMMENT 'Armazenar hash da senha',
     data_nascimento DATE NULL,
@@ -105,6 +106,7 @@ CREATE TABLE agendamento (
     
     data_hora_inicio DATETIME NOT NULL,
     duracao_minutos INT NOT NULL COMMENT 'Duração do agendamento em minutos.',
+    data_hora_fim DATETIME AS (DATE_ADD(data_hora_inicio, INTERVAL duracao_minutos MINUTE)) STORED COMMENT 'Fim do agendamento (calculado), para buscas de sobreposição por índice.',
     
     assunto_solicitacao TEXT NULL COMMENT 'Breve descrição do cliente sobre o motivo do agendamento.',
     observacoes_cliente TEXT NULL COMMENT 'Observações adicionais do cliente.',
@@ -126,6 +128,7 @@ CREATE TABLE agendamento (
     ) NOT NULL DEFAULT 'SOLICITADO',
     
     id_agendamento_origem INT NULL COMMENT 'Para rastrear remarcações, FK para agendamento.id_agendamento',
+    id_serie CHAR(32) NULL COMMENT 'Identificador comum às ocorrências de uma série recorrente (POST /api/agendamentos/serie).',
     data_criacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     data_modificacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     
@@ -133,6 +136,7 @@ CREATE TABLE agendamento (
     FOREIGN KEY (id_atendente) REFERENCES usuario(id_usuario) ON DELETE CASCADE,
     FOREIGN KEY (id_local_atendimento_presencial) REFERENCES endereco(id_endereco) ON DELETE SET NULL,
     FOREIGN KEY (id_agendamento_origem) REFERENCES agendamento(id_agendamento) ON DELETE SET NULL,
+    KEY idx_agendamento_serie (id_serie),
     
     CONSTRAINT chk_cliente_diferente_atendente CHECK (id_cliente <> id_atendente),
     CONSTRAINT uq_atendente_horario UNIQUE (id_atendente, data_hora_inicio), -- Garante que um atendente não tenha dois agendamentos no mesmo horário de início. Idealmente, verificar sobreposição com duração.
@@ -156,6 +160,25 @@ CREATE TABLE avaliacao (
     CONSTRAINT chk_nota CHECK (nota >= 1 AND nota <= 5)
 ) COMMENT 'Avaliações dos serviços prestados, vinculadas a um agendamento.';
 
+-- Tabela AtendenteAvaliacaoResumo: soma, total e histograma das notas de cada atendente.
+-- Atualizada na mesma transação de cada nova avaliação (utils/avaliacoes.registrar_nota);
+-- `flask reconstruir-avaliacoes` recalcula tudo a partir de avaliacao.
+CREATE TABLE atendente_avaliacao_resumo (
+    id_atendente INT PRIMARY KEY,
+    soma_notas INT NOT NULL DEFAULT 0,
+    total_avaliacoes INT NOT NULL DEFAULT 0,
+    total_nota_1 INT NOT NULL DEFAULT 0,
+    total_nota_2 INT NOT NULL DEFAULT 0,
+    total_nota_3 INT NOT NULL DEFAULT 0,
+    total_nota_4 INT NOT NULL DEFAULT 0,
+    total_nota_5 INT NOT NULL DEFAULT 0,
+    media_avaliacoes DECIMAL(2,1) AS (ROUND(soma_notas / NULLIF(total_avaliacoes, 0), 1)) STORED COMMENT 'Média com uma casa, usada na ordenação das listagens.',
+    data_atualizacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+
+    KEY idx_resumo_media (media_avaliacoes, total_avaliacoes),
+    FOREIGN KEY (id_atendente) REFERENCES usuario(id_usuario) ON DELETE CASCADE
+) COMMENT 'Agregados das avaliações por atendente, mantidos a cada nova avaliação.';
+
 -- Tabela LogUsuarioStatus: Histórico de mudanças de status dos usuários
 CREATE TABLE usuario_status_log (
     id_log INT AUTO_INCREMENT PRIMARY KEY,
@@ -170,6 +193,15 @@ CREATE TABLE usuario_status_log (
     FOREIGN KEY (id_admin_responsavel) REFERENCES usuario(id_usuario) ON DELETE SET NULL -- Garante que o admin exista
 ) COMMENT 'Log de todas as alterações de status dos usuários.';
 
+-- Tabela UsuarioContagem: quantidade de usuários por tipo e situação, mantida pelos triggers de usuario.
+-- Dá o total da listagem do admin sem COUNT(*) na tabela usuario.
+CREATE TABLE usuario_contagem (
+    tipo_usuario ENUM('CLIENTE', 'ATENDENTE', 'ADMIN') NOT NULL,
+    situacao ENUM('ATIVO', 'PENDENTE_APROVACAO', 'BLOQUEADO', 'INATIVO') NOT NULL,
+    total INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (tipo_usuario, situacao)
+) COMMENT 'Contadores de usuários por tipo e situação.';
+
 -- Tabela Notificacoes: Para comunicação com os usuários
 CREATE TABLE notificacao (
     id_notificacao INT AUTO_INCREMENT PRIMARY KEY,
@@ -197,11 +229,19 @@ CREATE TABLE notificacao (
 
 
 -- Índices para otimizar consultas comuns
-CREATE INDEX idx_usuario_tipo_situacao ON usuario(tipo_usuario, situacao);
+-- Páginas de GET /api/usuarios (keyset em data_criacao, id_usuario), com e sem filtros
+CREATE INDEX idx_usuario_tipo_situacao ON usuario(tipo_usuario, situacao, data_criacao);
+CREATE INDEX idx_usuario_tipo_criacao ON usuario(tipo_usuario, data_criacao);
+CREATE INDEX idx_usuario_criacao ON usuario(data_criacao);
 CREATE INDEX idx_usuario_email ON usuario(email);
+CREATE INDEX idx_usuario_cpf_digitos ON usuario(cpf_digitos);
 CREATE INDEX idx_agendamento_cliente ON agendamento(id_cliente, data_hora_inicio);
 CREATE INDEX idx_agendamento_atendente ON agendamento(id_atendente, data_hora_inicio);
 CREATE INDEX idx_agendamento_status ON agendamento(status_agendamento);
+-- Páginas de GET /api/agendamentos do admin (keyset em data_hora_inicio, id_agendamento)
+CREATE INDEX idx_agendamento_inicio ON agendamento(data_hora_inicio);
+-- Sobreposição [inicio, fim) por atendente: faixa em data_hora_inicio e filtro de data_hora_fim no próprio índice
+CREATE INDEX idx_agendamento_atendente_periodo ON agendamento(id_atendente, status_agendamento, data_hora_inicio, data_hora_fim);
 CREATE INDEX idx_atendente_area ON atendente_detalhes(area_atuacao);
 CREATE INDEX idx_notificacao_usuario_lida ON notificacao(id_usuario_destino, lida, data_criacao);
 
@@ -238,6 +278,35 @@ BEGIN
     END IF;
 END$$
 
+-- Triggers: Mantêm usuario_contagem
+CREATE TRIGGER tg_contagem_usuario_insert
+AFTER INSERT ON usuario
+FOR EACH ROW
+BEGIN
+    INSERT INTO usuario_contagem (tipo_usuario, situacao, total) VALUES (NEW.tipo_usuario, NEW.situacao, 1)
+    ON DUPLICATE KEY UPDATE total = total + 1;
+END$$
+
+CREATE TRIGGER tg_contagem_usuario_update
+AFTER UPDATE ON usuario
+FOR EACH ROW
+BEGIN
+    IF NEW.tipo_usuario <> OLD.tipo_usuario OR NEW.situacao <> OLD.situacao THEN
+        UPDATE usuario_contagem SET total = total - 1
+        WHERE tipo_usuario = OLD.tipo_usuario AND situacao = OLD.situacao;
+        INSERT INTO usuario_contagem (tipo_usuario, situacao, total) VALUES (NEW.tipo_usuario, NEW.situacao, 1)
+        ON DUPLICATE KEY UPDATE total = total + 1;
+    END IF;
+END$$
+
+CREATE TRIGGER tg_contagem_usuario_delete
+AFTER DELETE ON usuario
+FOR EACH ROW
+BEGIN
+    UPDATE usuario_contagem SET total = total - 1
+    WHERE tipo_usuario = OLD.tipo_usuario AND situacao = OLD.situacao;
+END$$
+
 -- Trigger: Notificar atendente sobre novo agendamento solicitado
 CREATE TRIGGER tg_notificar_novo_agendamento_solicitado
 AFTER INSERT ON agendamento
@@ -454,14 +523,12 @@ SELECT
     u.id_usuario AS id_atendente,
     u.nome_completo AS nome_atendente,
     ad.area_atuacao,
-    COUNT(aval.id_avaliacao) AS total_avaliacoes,
-    ROUND(AVG(aval.nota), 2) AS media_geral_notas
+    COALESCE(r.total_avaliacoes, 0) AS total_avaliacoes,
+    ROUND(r.soma_notas / r.total_avaliacoes, 2) AS media_geral_notas
 FROM usuario u
 JOIN atendente_detalhes ad ON u.id_usuario = ad.id_usuario
-LEFT JOIN agendamento ag ON u.id_usuario = ag.id_atendente AND ag.status_agendamento = 'REALIZADO'
-LEFT JOIN avaliacao aval ON ag.id_agendamento = aval.id_agendamento
+LEFT JOIN atendente_avaliacao_resumo r ON r.id_atendente = u.id_usuario
 WHERE u.tipo_usuario = 'ATENDENTE' AND u.situacao = 'ATIVO'
-GROUP BY u.id_usuario, u.nome_completo, ad.area_atuacao
 ORDER BY media_geral_notas DESC, total_avaliacoes DESC;
 
 -- Configuração para Functions (se necessário no seu ambiente MySQL)
@@ -492,14 +559,11 @@ BEGIN
     WHERE ag.id_atendente = p_id_atendente
       AND ag.status_agendamento IN ('SOLICITADO', 'CONFIRMADO', 'REALIZADO') -- Considerar também os realizados para evitar duplicação histórica no mesmo slot
       AND (p_id_agendamento_editar IS NULL OR ag.id_agendamento <> p_id_agendamento_editar) -- Ignora o próprio agendamento se estiver editando
-      AND (
-          -- Novo agendamento começa durante um existente
-          (p_data_hora_inicio >= ag.data_hora_inicio AND p_data_hora_inicio < DATE_ADD(ag.data_hora_inicio, INTERVAL ag.duracao_minutos MINUTE)) OR
-          -- Novo agendamento termina durante um existente
-          (p_data_hora_fim > ag.data_hora_inicio AND p_data_hora_fim <= DATE_ADD(ag.data_hora_inicio, INTERVAL ag.duracao_minutos MINUTE)) OR
-          -- Novo agendamento envolve completamente um existente
-          (p_data_hora_inicio <= ag.data_hora_inicio AND p_data_hora_fim >= DATE_ADD(ag.data_hora_inicio, INTERVAL ag.duracao_minutos MINUTE))
-      );
+      -- Sobreposição de intervalos semiabertos [inicio, fim). Agendamentos duram no máximo
+      -- um dia, então o limite inferior em data_hora_inicio mantém a busca em uma faixa do índice.
+      AND ag.data_hora_inicio >= DATE_SUB(p_data_hora_inicio, INTERVAL 1 DAY)
+      AND ag.data_hora_inicio < p_data_hora_fim
+      AND ag.data_hora_fim > p_data_hora_inicio;
 
     IF conflitos > 0 THEN
         RETURN FALSE; -- Não disponível
@@ -515,11 +579,10 @@ DETERMINISTIC
 READS SQL DATA
 BEGIN
     DECLARE media DECIMAL(3,2);
-    SELECT ROUND(AVG(a.nota), 2)
+    SELECT ROUND(r.soma_notas / r.total_avaliacoes, 2)
     INTO media
-    FROM avaliacao a
-    JOIN agendamento ag ON a.id_agendamento = ag.id_agendamento
-    WHERE ag.id_atendente = p_id_atendente AND ag.status_agendamento = 'REALIZADO'; -- Considerar apenas avaliações de atendimentos realizados
+    FROM atendente_avaliacao_resumo r -- Só avaliações de atendimentos realizados, mantidas a cada nova avaliação
+    WHERE r.id_atendente = p_id_atendente;
     RETURN IFNULL(media, 0.00);
 END$$
 
@@ -716,3 +779,58 @@ CREATE TABLE IF NOT EXISTS codigos_recuperacao (
         ON DELETE CASCADE
         ON UPDATE CASCADE
 );
+
+-- Refresh tokens (rotativos). Só o SHA-256 do token é armazenado; todos os
+-- tokens gerados a partir do mesmo login compartilham a mesma família, que é
+-- revogada inteira quando um token já trocado é reutilizado.
+CREATE TABLE IF NOT EXISTS refresh_token (
+    id_refresh_token INT AUTO_INCREMENT PRIMARY KEY,
+    id_usuario INT NOT NULL,
+    familia CHAR(32) NOT NULL,
+    token_hash CHAR(64) NOT NULL,
+    data_criacao DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    data_expiracao DATETIME NOT NULL,
+    data_uso DATETIME NULL,
+    data_revogacao DATETIME NULL,
+    UNIQUE KEY uk_refresh_token_hash (token_hash),
+    KEY idx_refresh_token_familia (familia),
+    KEY idx_refresh_token_usuario (id_usuario),
+    FOREIGN KEY (id_usuario) REFERENCES usuario(id_usuario)
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+);
+
+-- Ocupação da agenda em blocos fixos (AGENDA_BLOCO_MIN, padrão 15 min), usada
+-- com AGENDA_BLOCOS_ENABLED=True. Cada agendamento ativo grava uma linha por
+-- bloco que ocupa (incluindo a folga depois dele); a chave primária recusa
+-- dois agendamentos do mesmo atendente no mesmo bloco. Os blocos são apagados
+-- quando o agendamento é cancelado ou recusado.
+CREATE TABLE IF NOT EXISTS agendamento_bloco (
+    id_atendente INT NOT NULL,
+    inicio_bloco DATETIME NOT NULL,
+    id_agendamento INT NOT NULL,
+    PRIMARY KEY (id_atendente, inicio_bloco),
+    KEY idx_agendamento_bloco_agendamento (id_agendamento),
+    FOREIGN KEY (id_agendamento) REFERENCES agendamento(id_agendamento)
+        ON DELETE CASCADE
+);
+
+-- Reservas temporárias: seguram o horário escolhido por alguns minutos
+-- (AGENDA_RESERVA_TEMPORARIA_TTL) enquanto o cliente preenche a solicitação.
+-- Uma por cliente; as vencidas são ignoradas nas consultas e apagadas na
+-- próxima reserva do mesmo atendente.
+CREATE TABLE IF NOT EXISTS reserva_temporaria (
+    id_reserva_temporaria INT AUTO_INCREMENT PRIMARY KEY,
+    id_cliente INT NOT NULL,
+    id_atendente INT NOT NULL,
+    data_hora_inicio DATETIME NOT NULL,
+    duracao_minutos INT NOT NULL,
+    data_hora_fim DATETIME AS (DATE_ADD(data_hora_inicio, INTERVAL duracao_minutos MINUTE)) STORED,
+    data_expiracao DATETIME NOT NULL,
+    UNIQUE KEY uk_reserva_temporaria_cliente (id_cliente),
+    KEY idx_reserva_temporaria_periodo (id_atendente, data_hora_inicio, data_hora_fim),
+    FOREIGN KEY (id_cliente) REFERENCES usuario(id_usuario)
+        ON DELETE CASCADE,
+    FOREIGN KEY (id_atendente) REFERENCES usuario(id_usuario)
+        ON DELETE CASCADE
+);
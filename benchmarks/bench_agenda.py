@@ -0,0 +1,82 @@
+"""
+Micro-benchmark do cálculo de horários livres de um dia.
+
+Compara o laço aninhado antigo (cada horário candidato contra cada
+agendamento) com utils/agenda.free_slots (intervalos ordenados/fundidos e
+varredura com dois ponteiros) e o teste de conflito por bisect, com 10, 100 e
+1.000 agendamentos no dia. Não precisa de banco.
+
+Uso:
+    python benchmarks/bench_agenda.py --agendamentos 10 100 1000 --granularidade 5
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.agenda import TURNOS_PADRAO, BusyIntervals, free_slots
+
+DIA = date(2030, 1, 7)
+
+
+def gerar_agendamentos(quantidade, seed=42):
+    rnd = random.Random(seed)
+    inicio_dia = datetime.combine(DIA, datetime.min.time())
+    agendamentos = []
+    for _ in range(quantidade):
+        inicio = inicio_dia + timedelta(minutes=rnd.randrange(0, 24 * 60, 5))
+        agendamentos.append((inicio, inicio + timedelta(minutes=rnd.choice([5, 10, 15, 30]))))
+    return agendamentos
+
+
+def laco_aninhado(agendamentos, duracao, passo):
+    livres = []
+    for inicio_turno, fim_turno in TURNOS_PADRAO:
+        slot = datetime.combine(DIA, inicio_turno)
+        fim_turno_dt = datetime.combine(DIA, fim_turno)
+        while slot + duracao <= fim_turno_dt:
+            slot_fim = slot + duracao
+            if not any(max(slot, inicio) < min(slot_fim, fim) for inicio, fim in agendamentos):
+                livres.append(slot)
+            slot += passo
+    return livres
+
+
+def varredura(agendamentos, duracao, passo):
+    return free_slots(DIA, duracao, BusyIntervals(agendamentos), passo)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--agendamentos', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--duracao', type=int, default=30, help='minutos')
+    parser.add_argument('--granularidade', type=int, default=5, help='minutos entre horários candidatos')
+    parser.add_argument('--repeticoes', type=int, default=200)
+    args = parser.parse_args()
+
+    duracao = timedelta(minutes=args.duracao)
+    passo = timedelta(minutes=args.granularidade)
+
+    print(f"{'agendamentos':>12} | {'laço (µs)':>10} | {'varredura (µs)':>14} | {'conflito (µs)':>13}")
+    for quantidade in args.agendamentos:
+        agendamentos = gerar_agendamentos(quantidade)
+        assert laco_aninhado(agendamentos, duracao, passo) == varredura(agendamentos, duracao, passo)
+
+        ocupados = BusyIntervals(agendamentos)
+        candidato = datetime.combine(DIA, TURNOS_PADRAO[0][0])
+
+        def medir(funcao):
+            return min(timeit.repeat(funcao, number=args.repeticoes, repeat=3)) / args.repeticoes * 1e6
+
+        t_laco = medir(lambda: laco_aninhado(agendamentos, duracao, passo))
+        t_varredura = medir(lambda: varredura(agendamentos, duracao, passo))
+        t_conflito = medir(lambda: ocupados.conflita(candidato, candidato + duracao))
+        print(f'{quantidade:>12} | {t_laco:>10.1f} | {t_varredura:>14.1f} | {t_conflito:>13.2f}')
+
+
+if __name__ == '__main__':
+    main()
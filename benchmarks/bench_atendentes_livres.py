@@ -0,0 +1,109 @@
+"""
+Benchmark da busca "quem está livre no horário T".
+
+Compara GET /api/atendentes/livres (uma consulta) com o caminho antigo da
+interface: listar os atendentes da área e chamar /disponibilidade de cada um.
+Com --semear cria N atendentes (e N clientes, um por atendente) com
+agendamentos aleatórios; --limpar remove tudo o que foi semeado. Use um
+banco de testes.
+
+Uso:
+    python benchmarks/bench_atendentes_livres.py --semear 1000 --inicio 2030-01-08T14:00
+    python benchmarks/bench_atendentes_livres.py --limpar
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.db import close_pool, execute_query, insert_many
+
+DOMINIO = '@bench-livres.local'
+
+
+def semear(quantidade, dia, seed=42):
+    rnd = random.Random(seed)
+    usuarios = []
+    for i in range(quantidade):
+        for tipo in ('ATENDENTE', 'CLIENTE'):
+            usuarios.append({
+                'nome_completo': f'Bench {tipo.title()} {i}', 'cpf': f'{9 if tipo == "ATENDENTE" else 8}{i:010d}',
+                'email': f'{tipo.lower()}{i}{DOMINIO}', 'senha': '-', 'tipo_usuario': tipo, 'situacao': 'ATIVO',
+            })
+    insert_many('usuario', usuarios)
+    ids = {linha['email']: linha['id_usuario'] for linha in execute_query(
+        "SELECT id_usuario, email FROM usuario WHERE email LIKE %s", (f'%{DOMINIO}',))}
+
+    areas = ['SAUDE', 'JURIDICO', 'CARREIRA', 'CONTABIL', 'ASSISTENCIA_SOCIAL', 'PSICOLOGIA']
+    insert_many('atendente_detalhes', [
+        {'id_usuario': ids[f'atendente{i}{DOMINIO}'], 'area_atuacao': rnd.choice(areas),
+         'qualificacao_descricao': 'Perfil de benchmark', 'duracao_padrao_atendimento_min': rnd.choice([30, 45, 60])}
+        for i in range(quantidade)
+    ])
+
+    agendamentos = []
+    for i in range(quantidade):
+        horarios = rnd.sample(range(8, 18), rnd.randint(0, 6))
+        for hora in horarios:
+            agendamentos.append({
+                'id_cliente': ids[f'cliente{i}{DOMINIO}'], 'id_atendente': ids[f'atendente{i}{DOMINIO}'],
+                'data_hora_inicio': datetime.combine(dia, datetime.min.time()) + timedelta(hours=hora),
+                'duracao_minutos': 60, 'modalidade': 'ONLINE', 'status_agendamento': rnd.choice(['SOLICITADO', 'CONFIRMADO']),
+            })
+    insert_many('agendamento', agendamentos)
+    print(f'Semeados {quantidade} atendentes e {len(agendamentos)} agendamentos em {dia}')
+
+
+def limpar():
+    execute_query("DELETE FROM usuario WHERE email LIKE %s", (f'%{DOMINIO}',))
+    print('Dados de benchmark removidos')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--semear', type=int, default=0)
+    parser.add_argument('--limpar', action='store_true')
+    parser.add_argument('--inicio', default=(datetime.now() + timedelta(days=1)).strftime('%Y-%m-%dT14:00'))
+    parser.add_argument('--duracao', type=int, default=60)
+    parser.add_argument('--area', default='SAUDE')
+    args = parser.parse_args()
+
+    try:
+        if args.limpar:
+            limpar()
+            return
+        inicio = datetime.fromisoformat(args.inicio)
+        if args.semear:
+            semear(args.semear, inicio.date())
+
+        from app import create_app
+        client = create_app().test_client()
+
+        t0 = time.perf_counter()
+        livres = client.get(f'/api/atendentes/livres?area_atuacao={args.area}&inicio={args.inicio}&duracao={args.duracao}').get_json()
+        t_livres = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        atendentes = client.get(f'/api/atendentes?area_atuacao={args.area}').get_json()['atendentes']
+        horario = inicio.strftime('%H:%M')
+        livres_antigo = []
+        for atendente in atendentes:
+            resposta = client.get(f"/api/atendentes/{atendente['id_usuario']}/disponibilidade"
+                                  f"?data={inicio.date().isoformat()}&duracao={args.duracao}").get_json()
+            if horario in resposta.get('horarios_disponiveis', []):
+                livres_antigo.append(atendente['id_usuario'])
+        t_antigo = time.perf_counter() - t0
+
+        print(f"/livres: {len(livres['atendentes'])} atendentes em {t_livres * 1000:.1f} ms (1 requisição)")
+        print(f'/disponibilidade por atendente: {len(livres_antigo)} atendentes em {t_antigo * 1000:.1f} ms '
+              f'({len(atendentes) + 1} requisições)')
+    finally:
+        close_pool()
+
+
+if __name__ == '__main__':
+    main()
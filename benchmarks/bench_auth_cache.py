@@ -0,0 +1,70 @@
+"""
+Benchmark de throughput de requisições autenticadas com e sem o cache de
+usuários do token_required.
+
+Registra uma rota mínima protegida por token_required e mede requisições por
+segundo com AUTH_USER_CACHE_TTL=0 (toda requisição consulta o banco) e com o
+TTL informado. Cada cenário roda em um subprocesso, já que o TTL é lido na
+importação do Config. Precisa de um banco com o usuário informado.
+
+Uso:
+    python benchmarks/bench_auth_cache.py --usuario 1 --requisicoes 5000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def medir(usuario, requisicoes):
+    from flask import jsonify
+    from app import create_app
+    from utils.auth import generate_token, get_user_cache_stats, token_required
+
+    app = create_app()
+
+    @app.route('/bench/autenticado')
+    @token_required
+    def autenticado():
+        return jsonify({'ok': True})
+
+    client = app.test_client()
+    headers = {'Authorization': f'Bearer {generate_token(usuario, "CLIENTE")}'}
+    if client.get('/bench/autenticado', headers=headers).status_code != 200:
+        raise SystemExit(f'Usuário {usuario} não autenticou; confira o banco.')
+
+    inicio = time.perf_counter()
+    for _ in range(requisicoes):
+        client.get('/bench/autenticado', headers=headers)
+    duracao = time.perf_counter() - inicio
+    stats = get_user_cache_stats()
+    print(f"{requisicoes / duracao:.1f} {stats['hit_rate']}")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--medir':
+        medir(int(sys.argv[2]), int(sys.argv[3]))
+        return
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--usuario', type=int, default=1)
+    parser.add_argument('--requisicoes', type=int, default=5000)
+    parser.add_argument('--ttl', type=float, default=30)
+    args = parser.parse_args()
+
+    print(f"{'TTL (s)':>8} | {'req/s':>9} | {'hit rate':>8}")
+    for ttl in (0, args.ttl):
+        env = dict(os.environ, AUTH_USER_CACHE_TTL=str(ttl), LOG_LEVEL='WARNING')
+        saida = subprocess.run(
+            [sys.executable, __file__, '--medir', str(args.usuario), str(args.requisicoes)],
+            env=env, capture_output=True, text=True, check=True
+        ).stdout.strip().splitlines()[-1]
+        req_s, hit_rate = saida.split()
+        print(f'{ttl:>8} | {float(req_s):>9.1f} | {float(hit_rate):>8.2%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""
+Benchmark da grade de blocos (agendamento_bloco) contra
+fn_verificar_disponibilidade_atendente para um atendente com anos de histórico.
+
+Com --semear cria um atendente e um cliente com `--anos` anos de agendamentos
+(`--por-dia` sessões de 60 min por dia útil) e grava os blocos
+correspondentes. Depois mede, para horários aleatórios:
+  - conflito: SELECT fn_verificar_disponibilidade_atendente(...) contra a
+    busca pontual dos blocos do novo agendamento na chave primária;
+  - disponibilidade do dia: a consulta por faixa em agendamento contra a
+    faixa de blocos em agendamento_bloco.
+--limpar remove tudo o que foi semeado. Use um banco de testes.
+
+Uso:
+    python benchmarks/bench_blocos.py --semear --anos 3
+    python benchmarks/bench_blocos.py --consultas 2000
+    python benchmarks/bench_blocos.py --limpar
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.agenda import TAMANHO_BLOCO, blocos_do_agendamento
+from utils.db import close_pool, execute_query, get_connection, insert_many
+
+DOMINIO = '@bench-blocos.local'
+
+
+def semear(anos, por_dia, seed=42):
+    rnd = random.Random(seed)
+    insert_many('usuario', [
+        {'nome_completo': 'Bench Atendente Blocos', 'cpf': '50000000001', 'email': f'atendente{DOMINIO}',
+         'senha': '-', 'tipo_usuario': 'ATENDENTE', 'situacao': 'ATIVO'},
+        {'nome_completo': 'Bench Cliente Blocos', 'cpf': '50000000002', 'email': f'cliente{DOMINIO}',
+         'senha': '-', 'tipo_usuario': 'CLIENTE', 'situacao': 'ATIVO'},
+    ])
+    id_atendente, id_cliente = ids()
+
+    agendamentos = []
+    dia = date.today() - timedelta(days=365 * anos)
+    while dia < date.today() + timedelta(days=60):
+        if dia.weekday() < 5:
+            for hora in sorted(rnd.sample(range(8, 18), por_dia)):
+                agendamentos.append({
+                    'id_cliente': id_cliente, 'id_atendente': id_atendente,
+                    'data_hora_inicio': datetime.combine(dia, datetime.min.time()) + timedelta(hours=hora),
+                    'duracao_minutos': 60, 'modalidade': 'ONLINE',
+                    'status_agendamento': 'REALIZADO' if dia < date.today() else 'CONFIRMADO',
+                })
+        dia += timedelta(days=1)
+    insert_many('agendamento', agendamentos)
+
+    linhas = execute_query("SELECT id_agendamento, data_hora_inicio, duracao_minutos FROM agendamento WHERE id_atendente = %s",
+                           (id_atendente,))
+    insert_many('agendamento_bloco', [
+        {'id_atendente': id_atendente, 'inicio_bloco': bloco, 'id_agendamento': linha['id_agendamento']}
+        for linha in linhas
+        for bloco in blocos_do_agendamento(linha['data_hora_inicio'], linha['duracao_minutos'])
+    ])
+    execute_query("ANALYZE TABLE agendamento, agendamento_bloco")
+    print(f'Semeados {len(agendamentos)} agendamentos em {anos} ano(s) para o atendente {id_atendente}')
+
+
+def ids():
+    linhas = {linha['email']: linha['id_usuario'] for linha in execute_query(
+        "SELECT id_usuario, email FROM usuario WHERE email LIKE %s", (f'%{DOMINIO}',))}
+    return linhas[f'atendente{DOMINIO}'], linhas[f'cliente{DOMINIO}']
+
+
+def limpar():
+    execute_query("DELETE FROM usuario WHERE email LIKE %s", (f'%{DOMINIO}',))
+    print('Dados de benchmark removidos')
+
+
+def medir(cursor, consultas, query, gerar_params):
+    t0 = time.perf_counter()
+    for params in consultas:
+        cursor.execute(query(params), gerar_params(params))
+        cursor.fetchall()
+    return (time.perf_counter() - t0) / len(consultas) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--semear', action='store_true')
+    parser.add_argument('--limpar', action='store_true')
+    parser.add_argument('--anos', type=int, default=3)
+    parser.add_argument('--por-dia', type=int, default=6)
+    parser.add_argument('--consultas', type=int, default=1000)
+    args = parser.parse_args()
+
+    try:
+        if args.limpar:
+            limpar()
+            return
+        if args.semear:
+            semear(args.anos, args.por_dia)
+        id_atendente, _ = ids()
+
+        rnd = random.Random(7)
+        inicio_historico = datetime.now() - timedelta(days=365 * args.anos)
+        consultas = []
+        for _ in range(args.consultas):
+            inicio = inicio_historico + timedelta(days=rnd.randrange(365 * args.anos + 60), hours=rnd.randrange(8, 18))
+            consultas.append((inicio.replace(minute=0, second=0, microsecond=0), 60))
+
+        connection = get_connection()
+        try:
+            with connection.cursor() as cursor:
+                t_funcao = medir(
+                    cursor, consultas,
+                    lambda _: "SELECT fn_verificar_disponibilidade_atendente(%s, %s, %s, NULL) AS livre",
+                    lambda c: (id_atendente, c[0], c[1]),
+                )
+                t_blocos = medir(
+                    cursor, consultas,
+                    lambda c: "SELECT 1 FROM agendamento_bloco WHERE id_atendente = %s AND inicio_bloco IN ("
+                              + ', '.join(['%s'] * len(blocos_do_agendamento(*c))) + ") LIMIT 1",
+                    lambda c: (id_atendente, *blocos_do_agendamento(*c)),
+                )
+                t_dia_agendamento = medir(
+                    cursor, consultas,
+                    lambda _: """SELECT data_hora_inicio, data_hora_fim FROM agendamento
+                                 WHERE id_atendente = %s AND status_agendamento IN ('SOLICITADO', 'CONFIRMADO', 'REALIZADO')
+                                   AND data_hora_inicio >= %s AND data_hora_inicio < %s AND data_hora_fim > %s""",
+                    lambda c: (id_atendente, c[0].replace(hour=0) - timedelta(days=1), c[0].replace(hour=0) + timedelta(days=1),
+                               c[0].replace(hour=0)),
+                )
+                t_dia_blocos = medir(
+                    cursor, consultas,
+                    lambda _: "SELECT inicio_bloco FROM agendamento_bloco WHERE id_atendente = %s AND inicio_bloco > %s AND inicio_bloco < %s",
+                    lambda c: (id_atendente, c[0].replace(hour=0) - TAMANHO_BLOCO, c[0].replace(hour=0) + timedelta(days=1)),
+                )
+        finally:
+            connection.close()
+
+        print(f'{args.consultas} consultas por cenário (µs por consulta)')
+        print(f'Conflito   | fn_verificar_disponibilidade_atendente: {t_funcao:8.1f} | blocos (busca pontual): {t_blocos:8.1f}')
+        print(f'Dia        | faixa em agendamento:                   {t_dia_agendamento:8.1f} | faixa em blocos:        {t_dia_blocos:8.1f}')
+    finally:
+        close_pool()
+
+
+if __name__ == '__main__':
+    main()
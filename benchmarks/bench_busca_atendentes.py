@@ -0,0 +1,83 @@
+"""
+Benchmark da busca de atendentes.
+
+Compara a varredura com substring (o que o LIKE '%termo%' faz, aqui já sem
+acentos) com utils/busca.IndiceBusca em 10 mil e 100 mil perfis sintéticos.
+Mostra também o tempo para montar o índice e para atualizar um perfil. Não
+precisa de banco.
+
+Uso:
+    python benchmarks/bench_busca_atendentes.py --atendentes 10000 100000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.busca import IndiceBusca, dobrar
+
+NOMES = ['Ana', 'Antônio', 'Beatriz', 'Bruno', 'Camila', 'Cláudio', 'Débora', 'Fábio', 'Gabriela', 'Helena',
+         'Inês', 'João', 'Júlia', 'Lúcia', 'Marcos', 'Márcia', 'Otávio', 'Patrícia', 'Rafael', 'Sônia']
+SOBRENOMES = ['Araújo', 'Barbosa', 'Conceição', 'Gonçalves', 'Lima', 'Magalhães', 'Moreira', 'Simões', 'Souza', 'Toledo']
+ESPECIALIDADES = ['saúde mental', 'psicologia clínica', 'direito trabalhista', 'direito de família', 'orientação de carreira',
+                  'contabilidade para MEI', 'imposto de renda', 'assistência social', 'terapia cognitiva', 'nutrição']
+DESCRICOES = ['Psicóloga com atendimento humanizado', 'Advogado especialista em relações de trabalho',
+              'Contador com foco em pequenas empresas', 'Assistente social com experiência em políticas públicas',
+              'Orientadora profissional para transição de carreira', 'Nutricionista clínica']
+CONSULTAS = ['saude', 'psicologa', 'ana', 'direito trabalhista', 'contab', 'relacoes de trabalho', 'gonçalves']
+CAMPOS = ('nome_completo', 'nome_social', 'qualificacao_descricao', 'especialidades')
+
+
+def gerar_perfis(quantidade, seed=42):
+    rnd = random.Random(seed)
+    return [
+        (i, {
+            'nome_completo': f'{rnd.choice(NOMES)} {rnd.choice(SOBRENOMES)} {rnd.choice(SOBRENOMES)}',
+            'nome_social': rnd.choice(NOMES) if rnd.random() < 0.1 else None,
+            'qualificacao_descricao': rnd.choice(DESCRICOES),
+            'especialidades': ', '.join(rnd.sample(ESPECIALIDADES, 2)),
+        })
+        for i in range(quantidade)
+    ]
+
+
+def varredura(textos, consulta):
+    termo = dobrar(consulta)
+    return [id_doc for id_doc, texto in textos if termo in texto]
+
+
+def medir(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--atendentes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--repeticoes', type=int, default=20)
+    args = parser.parse_args()
+
+    for quantidade in args.atendentes:
+        perfis = gerar_perfis(quantidade)
+        textos = [(id_doc, '\n'.join(dobrar(campos[campo]) for campo in CAMPOS)) for id_doc, campos in perfis]
+
+        inicio = time.perf_counter()
+        indice = IndiceBusca.construir(perfis)
+        t_construir = (time.perf_counter() - inicio) * 1000
+        t_atualizar, _ = medir(lambda: indice.adicionar(0, perfis[1][1]), args.repeticoes)
+
+        print(f'\n{quantidade} atendentes: índice montado em {t_construir:.0f} ms, atualização de um perfil {t_atualizar:.3f} ms')
+        print(f"{'consulta':>22} | {'varredura (ms)':>14} | {'índice (ms)':>11} | {'achados varr.':>13} | {'achados índ.':>12}")
+        for consulta in CONSULTAS:
+            t_varredura, achados_varredura = medir(lambda: varredura(textos, consulta), args.repeticoes)
+            t_indice, achados_indice = medir(lambda: indice.buscar(consulta), args.repeticoes)
+            print(f'{consulta:>22} | {t_varredura:>14.2f} | {t_indice:>11.2f} | {len(achados_varredura):>13} | {len(achados_indice or {}):>12}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Benchmark de inserção em lote: laço de insert_record vs insert_many.
+
+Cria uma tabela temporária de trabalho (bench_insert_many), mede os dois
+caminhos para 10k e 100k linhas e remove a tabela ao final.
+
+Uso:
+    python benchmarks/bench_insert_many.py --linhas 10000 100000 --chunk 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.db import execute_query, insert_record, insert_many, close_pool
+
+TABELA = 'bench_insert_many'
+
+
+def recriar_tabela():
+    execute_query(f"DROP TABLE IF EXISTS {TABELA}")
+    execute_query(f"""
+        CREATE TABLE {TABELA} (
+            id INT AUTO_INCREMENT PRIMARY KEY,
+            id_usuario_destino INT NOT NULL,
+            titulo VARCHAR(100) NOT NULL,
+            mensagem TEXT NOT NULL
+        )
+    """)
+
+
+def gerar_linhas(n):
+    return [
+        {'id_usuario_destino': i % 500, 'titulo': 'Aviso', 'mensagem': f'Mensagem de teste número {i}'}
+        for i in range(n)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--linhas', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--chunk', type=int, default=1000)
+    args = parser.parse_args()
+
+    try:
+        for n in args.linhas:
+            linhas = gerar_linhas(n)
+
+            recriar_tabela()
+            inicio = time.perf_counter()
+            for linha in linhas:
+                insert_record(TABELA, linha)
+            t_loop = time.perf_counter() - inicio
+
+            recriar_tabela()
+            inicio = time.perf_counter()
+            lotes = insert_many(TABELA, linhas, chunk_size=args.chunk)
+            t_lote = time.perf_counter() - inicio
+
+            total = execute_query(f"SELECT COUNT(*) AS total FROM {TABELA}", fetch_all=False)['total']
+            assert total == n, (total, n)
+            print(f'{n:>7} linhas | insert_record: {t_loop:8.2f}s ({n / t_loop:9.0f} linhas/s) '
+                  f'| insert_many: {t_lote:6.2f}s ({n / t_lote:9.0f} linhas/s) '
+                  f'| {t_loop / t_lote:6.1f}x | {len(lotes)} lotes')
+    finally:
+        execute_query(f"DROP TABLE IF EXISTS {TABELA}")
+        close_pool()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark de latência do pipeline de logs.
+
+Dispara POST /api/auth/registrar com dados que falham na validação (nenhum
+acesso ao banco), de forma que o tempo medido é basicamente validação +
+logging. Cada combinação de LOG_LEVEL/LOG_ASYNC roda em um subprocesso
+separado, já que o nível e o modo são lidos na importação do Config.
+
+Uso:
+    python benchmarks/bench_logging.py --requisicoes 2000
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+PAYLOAD = {
+    'nome': 'Benchmark',
+    'sobrenome': 'Logs',
+    'email': 'benchmark@connectplus.com',
+    'cpf': '12345678909',
+    'senha': 'Senha@123',
+    'data_nascimento': '1990-01-01',
+    'genero': 'OUTRO',
+    'tipo_usuario': 'CLIENTE',
+    'telefones': [{'numero': 'invalido'}],
+}
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def medir(requisicoes):
+    from app import create_app
+    from utils.logger import stop_listeners
+
+    client = create_app().test_client()
+    for _ in range(50):
+        client.post('/api/auth/registrar', json=PAYLOAD)
+
+    tempos = []
+    for _ in range(requisicoes):
+        inicio = time.perf_counter()
+        client.post('/api/auth/registrar', json=PAYLOAD)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    stop_listeners()
+    sys.__stderr__.write(f'{percentil(tempos, 50):.3f} {percentil(tempos, 99):.3f}\n')
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == '--medir':
+        medir(int(sys.argv[2]))
+        return
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requisicoes', type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'LOG_LEVEL':>9} | {'LOG_ASYNC':>9} | {'p50 (ms)':>9} | {'p99 (ms)':>9}")
+    for nivel in ('DEBUG', 'INFO'):
+        for assincrono in ('False', 'True'):
+            env = dict(os.environ, LOG_LEVEL=nivel, LOG_ASYNC=assincrono)
+            # stdout/console do app vai para /dev/null; o resultado volta pelo stderr.
+            saida = subprocess.run(
+                [sys.executable, __file__, '--medir', str(args.requisicoes)],
+                env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True
+            ).stderr.strip().splitlines()[-1]
+            p50, p99 = (float(v) for v in saida.split())
+            print(f'{nivel:>9} | {assincrono:>9} | {p50:>9.3f} | {p99:>9.3f}')
+
+
+if __name__ == '__main__':
+    main()
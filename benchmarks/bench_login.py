@@ -0,0 +1,62 @@
+"""
+Benchmark de latência do login sob carga concorrente.
+
+Dispara POST /api/auth/login contra um servidor em execução com N clientes
+simultâneos e mostra p50/p99 e a contagem de respostas por status (503
+indica que a fila de hashing do bcrypt estava cheia). Rode o servidor com
+valores diferentes de BCRYPT_ROUNDS, BCRYPT_MAX_CONCURRENCY e BCRYPT_MAX_QUEUE
+para comparar.
+
+Uso:
+    python benchmarks/bench_login.py --email cliente@teste.com --senha 'Senha@123' --concorrencia 1 8 32
+"""
+import argparse
+import json
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+
+def login(url, corpo):
+    requisicao = urllib.request.Request(url, data=corpo, headers={'Content-Type': 'application/json'}, method='POST')
+    inicio = time.perf_counter()
+    try:
+        with urllib.request.urlopen(requisicao) as resposta:
+            resposta.read()
+            status = resposta.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    return (time.perf_counter() - inicio) * 1000, status
+
+
+def percentil(valores, p):
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--url', default='http://127.0.0.1:5000')
+    parser.add_argument('--email', required=True)
+    parser.add_argument('--senha', required=True)
+    parser.add_argument('--concorrencia', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--requisicoes', type=int, default=200)
+    args = parser.parse_args()
+
+    url = args.url.rstrip('/') + '/api/auth/login'
+    corpo = json.dumps({'email': args.email, 'senha': args.senha}).encode('utf-8')
+
+    print(f"{'clientes':>8} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | status")
+    for clientes in args.concorrencia:
+        with ThreadPoolExecutor(max_workers=clientes) as executor:
+            resultados = list(executor.map(lambda _: login(url, corpo), range(args.requisicoes)))
+        tempos = [tempo for tempo, _ in resultados]
+        status = Counter(codigo for _, codigo in resultados)
+        resumo = ', '.join(f'{codigo}: {qtd}' for codigo, qtd in sorted(status.items()))
+        print(f'{clientes:>8} | {percentil(tempos, 50):>9.1f} | {percentil(tempos, 99):>9.1f} | {resumo}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark do pool de conexões: requisições/s com e sem pool.
+
+Requer um MySQL/MariaDB local com o schema de Connect+DB.sql carregado e as
+variáveis DB_* configuradas no .env.
+
+Uso:
+    python benchmarks/bench_pool.py --threads 8 --requests 2000 --rota /api/atendentes
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import create_app
+from config import Config
+from utils import db
+
+
+def rodar(app, rota, threads, total):
+    def worker(n):
+        client = app.test_client()
+        for _ in range(n):
+            resp = client.get(rota)
+            assert resp.status_code == 200, resp.status_code
+
+    por_thread = total // threads
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        list(executor.map(worker, [por_thread] * threads))
+    return (por_thread * threads) / (time.perf_counter() - inicio)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--rota', default='/api/atendentes')
+    args = parser.parse_args()
+
+    app = create_app()
+
+    Config.DB_POOL_ENABLED = False
+    sem_pool = rodar(app, args.rota, args.threads, args.requests)
+
+    Config.DB_POOL_ENABLED = True
+    rodar(app, args.rota, args.threads, args.threads * 10)  # aquecimento do pool
+    com_pool = rodar(app, args.rota, args.threads, args.requests)
+    stats = db.get_pool().stats()
+    db.close_pool()
+
+    print(f'Rota: {args.rota} | threads: {args.threads} | requisições: {args.requests}')
+    print(f'Sem pool: {sem_pool:8.1f} req/s')
+    print(f'Com pool: {com_pool:8.1f} req/s  ({com_pool / sem_pool:.2f}x)')
+    print(f'Pool: {stats}')
+
+
+if __name__ == '__main__':
+    main()
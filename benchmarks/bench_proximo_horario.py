@@ -0,0 +1,67 @@
+"""
+Micro-benchmark da busca "próximos horários livres" entre muitos atendentes.
+
+Compara calcular a agenda inteira de cada atendente e ordenar tudo com o
+k-way merge de utils/agenda.primeiros_horarios sobre geradores que param
+cedo. Não precisa de banco.
+
+Uso:
+    python benchmarks/bench_proximo_horario.py --atendentes 10 100 1000 --quantidade 5
+"""
+import argparse
+import os
+import random
+import sys
+import timeit
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.agenda import BusyIntervals, free_slots, iter_free_slots, primeiros_horarios
+
+DIA = date(2030, 1, 7)
+
+
+def gerar_agendas(quantidade, seed=42):
+    rnd = random.Random(seed)
+    inicio_dia = datetime.combine(DIA, datetime.min.time())
+    agendas = []
+    for _ in range(quantidade):
+        horas = rnd.sample(range(8, 18), rnd.randint(0, 8))
+        agendamentos = [(inicio_dia + timedelta(hours=h), inicio_dia + timedelta(hours=h, minutes=50)) for h in horas]
+        agendas.append((BusyIntervals(agendamentos), timedelta(minutes=rnd.choice([30, 45, 60]))))
+    return agendas
+
+
+def agendas_completas(agendas, quantidade):
+    todos = [(horario, i) for i, (ocupados, duracao) in enumerate(agendas) for horario in free_slots(DIA, duracao, ocupados)]
+    return sorted(todos)[:quantidade]
+
+
+def merge(agendas, quantidade):
+    fontes = [(i, iter_free_slots(DIA, duracao, ocupados)) for i, (ocupados, duracao) in enumerate(agendas)]
+    return primeiros_horarios(fontes, quantidade)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--atendentes', type=int, nargs='+', default=[10, 100, 1000])
+    parser.add_argument('--quantidade', type=int, default=5)
+    parser.add_argument('--repeticoes', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'atendentes':>10} | {'agendas completas (ms)':>22} | {'k-way merge (ms)':>16}")
+    for quantidade in args.atendentes:
+        agendas = gerar_agendas(quantidade)
+        assert agendas_completas(agendas, args.quantidade) == merge(agendas, args.quantidade)
+
+        def medir(funcao):
+            return min(timeit.repeat(funcao, number=args.repeticoes, repeat=3)) / args.repeticoes * 1e3
+
+        t_completas = medir(lambda: agendas_completas(agendas, args.quantidade))
+        t_merge = medir(lambda: merge(agendas, args.quantidade))
+        print(f'{quantidade:>10} | {t_completas:>22.2f} | {t_merge:>16.2f}')
+
+
+if __name__ == '__main__':
+    main()
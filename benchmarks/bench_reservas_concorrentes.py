@@ -0,0 +1,127 @@
+"""
+Benchmark de reservas concorrentes (POST /api/agendamentos).
+
+Várias threads, cada uma com seu cliente, tentam reservar sessões de
+`--duracao` minutos em horários de uma grade de 15 em 15 minutos, ou seja,
+horários que se sobrepõem sem começar no mesmo instante (o caso que
+uq_atendente_horario não pega). Com --atendentes 1 toda reserva disputa o
+mesmo atendente; com mais atendentes mede a vazão quando a disputa é menor.
+No fim conta, direto no banco, os pares de agendamentos ativos sobrepostos
+(deve ser zero) e mostra reservas/s.
+
+Os dados semeados usam o domínio @bench-reservas.local e são removidos no
+início e no fim. Use um banco de testes.
+
+Uso:
+    python benchmarks/bench_reservas_concorrentes.py --threads 16 --atendentes 1 --tentativas 50
+    python benchmarks/bench_reservas_concorrentes.py --threads 16 --atendentes 16 --tentativas 50
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.db import close_pool, execute_query, insert_many
+
+DOMINIO = '@bench-reservas.local'
+
+
+def semear(atendentes, clientes):
+    usuarios = [
+        {'nome_completo': f'Bench Atendente {i}', 'cpf': f'7{i:010d}', 'email': f'atendente{i}{DOMINIO}',
+         'senha': '-', 'tipo_usuario': 'ATENDENTE', 'situacao': 'ATIVO'}
+        for i in range(atendentes)
+    ] + [
+        {'nome_completo': f'Bench Cliente {i}', 'cpf': f'6{i:010d}', 'email': f'cliente{i}{DOMINIO}',
+         'senha': '-', 'tipo_usuario': 'CLIENTE', 'situacao': 'ATIVO'}
+        for i in range(clientes)
+    ]
+    insert_many('usuario', usuarios)
+    # O trigger de inserção coloca atendentes como PENDENTE_APROVACAO.
+    execute_query("UPDATE usuario SET situacao = 'ATIVO' WHERE email LIKE %s", (f'%{DOMINIO}',))
+    linhas = execute_query("SELECT id_usuario, tipo_usuario FROM usuario WHERE email LIKE %s ORDER BY id_usuario", (f'%{DOMINIO}',))
+    ids_atendentes = [linha['id_usuario'] for linha in linhas if linha['tipo_usuario'] == 'ATENDENTE']
+    insert_many('atendente_detalhes', [
+        {'id_usuario': id_atendente, 'area_atuacao': 'SAUDE', 'qualificacao_descricao': 'Perfil de benchmark'}
+        for id_atendente in ids_atendentes
+    ])
+    return ids_atendentes, [linha['id_usuario'] for linha in linhas if linha['tipo_usuario'] == 'CLIENTE']
+
+
+def limpar():
+    execute_query("DELETE FROM usuario WHERE email LIKE %s", (f'%{DOMINIO}',))
+
+
+def contar_sobreposicoes():
+    return execute_query("""
+        SELECT COUNT(*) AS total
+        FROM agendamento a
+        JOIN agendamento b ON a.id_atendente = b.id_atendente AND a.id_agendamento < b.id_agendamento
+        JOIN usuario u ON u.id_usuario = a.id_atendente
+        WHERE u.email LIKE %s
+          AND a.status_agendamento IN ('SOLICITADO', 'CONFIRMADO', 'REALIZADO')
+          AND b.status_agendamento IN ('SOLICITADO', 'CONFIRMADO', 'REALIZADO')
+          AND a.data_hora_inicio < b.data_hora_fim AND b.data_hora_inicio < a.data_hora_fim
+    """, (f'%{DOMINIO}',), fetch_all=False)['total']
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--atendentes', type=int, default=1)
+    parser.add_argument('--tentativas', type=int, default=50, help='reservas tentadas por thread')
+    parser.add_argument('--duracao', type=int, default=60)
+    parser.add_argument('--dia', default='2030-01-08')
+    args = parser.parse_args()
+
+    from app import create_app
+    from utils.auth import generate_token
+
+    try:
+        limpar()
+        ids_atendentes, ids_clientes = semear(args.atendentes, args.threads)
+        app = create_app()
+        inicio_dia = datetime.fromisoformat(args.dia).replace(hour=8)
+        # Grade de 15 min no dia inteiro: sessões de 60 min em horários vizinhos se sobrepõem.
+        horarios = [inicio_dia + timedelta(minutes=15 * n) for n in range(4 * 10)]
+
+        def cliente(indice):
+            rnd = random.Random(indice)
+            client = app.test_client()
+            headers = {'Authorization': f'Bearer {generate_token(ids_clientes[indice], "CLIENTE")}'}
+            resultados = Counter()
+            for _ in range(args.tentativas):
+                resposta = client.post('/api/agendamentos', headers=headers, json={
+                    'id_atendente': rnd.choice(ids_atendentes),
+                    'data_hora_inicio': rnd.choice(horarios).isoformat(),
+                    'duracao_minutos': args.duracao,
+                    'modalidade': 'ONLINE',
+                })
+                resultados[resposta.status_code] += 1
+            return resultados
+
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            resultados = sum(executor.map(cliente, range(args.threads)), Counter())
+        duracao = time.perf_counter() - t0
+
+        total = sum(resultados.values())
+        sobreposicoes = contar_sobreposicoes()
+        print(f'{args.threads} threads, {args.atendentes} atendente(s), {total} tentativas em {duracao:.2f} s')
+        print(f'Respostas: {dict(sorted(resultados.items()))}')
+        print(f'Requisições/s: {total / duracao:.1f} | reservas criadas/s: {resultados[201] / duracao:.1f}')
+        print(f'Pares de agendamentos sobrepostos: {sobreposicoes}')
+        sys.exit(1 if sobreposicoes else 0)
+    finally:
+        limpar()
+        close_pool()
+
+
+if __name__ == '__main__':
+    main()
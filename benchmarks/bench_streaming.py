@@ -0,0 +1,71 @@
+"""
+Benchmark de memória: execute_query (fetchall) vs iter_query (SSDictCursor).
+
+Cada medição roda em um subprocesso separado para que o pico de RSS
+(ru_maxrss) de uma não contamine a outra. Com iter_query o pico deve se
+manter praticamente constante conforme o número de linhas cresce.
+
+Uso:
+    python benchmarks/bench_streaming.py --linhas 10000 100000 1000000
+"""
+import argparse
+import os
+import resource
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+DIGITOS = "(SELECT 0 n UNION ALL SELECT 1 UNION ALL SELECT 2 UNION ALL SELECT 3 UNION ALL SELECT 4 " \
+          "UNION ALL SELECT 5 UNION ALL SELECT 6 UNION ALL SELECT 7 UNION ALL SELECT 8 UNION ALL SELECT 9)"
+
+QUERY = f"""
+    SELECT a.n + b.n * 10 + c.n * 100 + d.n * 1000 + e.n * 10000 + f.n * 100000 AS id,
+           REPEAT('x', 120) AS payload, NOW() AS data_criacao
+    FROM {DIGITOS} a, {DIGITOS} b, {DIGITOS} c, {DIGITOS} d, {DIGITOS} e, {DIGITOS} f
+    LIMIT %s
+"""
+
+
+def medir(modo, linhas):
+    from flask import json
+    from app import create_app
+    from utils.db import execute_query, iter_query
+
+    app = create_app()
+    with app.app_context():
+        total_bytes = 0
+        if modo == 'fetchall':
+            for linha in execute_query(QUERY, (linhas,)):
+                total_bytes += len(json.dumps(linha))
+        else:
+            for lote in iter_query(QUERY, (linhas,)):
+                for linha in lote:
+                    total_bytes += len(json.dumps(linha))
+    pico_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f'{pico_mb:.1f} {total_bytes}')
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == '--medir':
+        medir(sys.argv[2], int(sys.argv[3]))
+        return
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--linhas', type=int, nargs='+', default=[10000, 100000, 1000000])
+    args = parser.parse_args()
+
+    print(f"{'linhas':>9} | {'fetchall (MB)':>13} | {'iter_query (MB)':>15}")
+    for linhas in args.linhas:
+        resultados = {}
+        for modo in ('fetchall', 'iter_query'):
+            saida = subprocess.run(
+                [sys.executable, __file__, '--medir', modo, str(linhas)],
+                capture_output=True, text=True, check=True
+            ).stdout.strip().splitlines()[-1]
+            resultados[modo] = float(saida.split()[0])
+        print(f"{linhas:>9} | {resultados['fetchall']:>13.1f} | {resultados['iter_query']:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
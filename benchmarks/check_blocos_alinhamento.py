@@ -0,0 +1,89 @@
+"""
+Verificação da grade de blocos (agendamento_bloco) contra a checagem por intervalos.
+
+Com AGENDA_BLOCOS_ENABLED, dois agendamentos só podem disputar um bloco se
+também se sobrepõem (com a folga AGENDA_INTERVALO_MIN), e vice-versa. Isso
+vale porque os inícios precisam estar na grade de AGENDA_BLOCO_MIN, mesmo
+com durações que não são múltiplas do bloco. O script:
+  - mostra o caso de sessões encostadas de 50 min (08:00 e 08:50): a das
+    08:50 é recusada na validação, e 08:00 + 09:00 não disputam bloco;
+  - compara blocos e intervalos para todos os pares de inícios na grade de
+    um dia e várias durações;
+  - confere que free_slots só oferece inícios na grade e que nenhum deles
+    disputa bloco com os agendamentos já feitos.
+Não precisa de banco. Termina com código 1 se houver divergência.
+
+Uso:
+    python benchmarks/check_blocos_alinhamento.py --bloco 15 --intervalo 0
+    python benchmarks/check_blocos_alinhamento.py --bloco 15 --intervalo 10 --duracoes 20 50 70
+"""
+import argparse
+import os
+import sys
+from datetime import date, datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--bloco', type=int, default=15)
+    parser.add_argument('--intervalo', type=int, default=0)
+    parser.add_argument('--duracoes', type=int, nargs='+', default=[10, 15, 20, 30, 45, 50, 60, 70, 90])
+    args = parser.parse_args()
+
+    # A configuração é lida na importação de utils.agenda.
+    os.environ['AGENDA_BLOCOS_ENABLED'] = 'True'
+    os.environ['AGENDA_BLOCO_MIN'] = str(args.bloco)
+    os.environ['AGENDA_INTERVALO_MIN'] = str(args.intervalo)
+    from utils.agenda import BusyIntervals, blocos_do_agendamento, free_slots, inicio_fora_da_grade
+
+    folga = timedelta(minutes=args.intervalo)
+    dia = date(2030, 1, 7)
+    manha = datetime.combine(dia, datetime.min.time()) + timedelta(hours=8)
+    divergencias = []
+
+    # Caso da revisão: duas sessões de 50 min encostadas.
+    print(f'08:50 recusado na validação: {inicio_fora_da_grade(manha + timedelta(minutes=50)) is not None}')
+    comuns = set(blocos_do_agendamento(manha, 50)) & set(blocos_do_agendamento(manha + timedelta(minutes=60), 50))
+    print(f'08:00 e 09:00 (50 min) disputam blocos: {sorted(b.strftime("%H:%M") for b in comuns) or "nenhum"}')
+    if inicio_fora_da_grade(manha + timedelta(minutes=50)) is None or comuns:
+        divergencias.append('sessões de 50 min encostadas')
+
+    inicios = [manha + timedelta(minutes=args.bloco) * n for n in range(10 * 60 // args.bloco)]
+    pares = 0
+    for duracao_a in args.duracoes:
+        for duracao_b in args.duracoes:
+            for inicio_a in inicios[:len(inicios) // 2]:
+                blocos_a = set(blocos_do_agendamento(inicio_a, duracao_a))
+                fim_a = inicio_a + timedelta(minutes=duracao_a)
+                for inicio_b in inicios:
+                    fim_b = inicio_b + timedelta(minutes=duracao_b)
+                    por_blocos = not blocos_a.isdisjoint(blocos_do_agendamento(inicio_b, duracao_b))
+                    por_intervalos = inicio_b < fim_a + folga and inicio_a < fim_b + folga
+                    pares += 1
+                    if por_blocos != por_intervalos:
+                        divergencias.append(f'{inicio_a:%H:%M}+{duracao_a} x {inicio_b:%H:%M}+{duracao_b}: '
+                                            f'blocos={por_blocos} intervalos={por_intervalos}')
+    print(f'{pares} pares comparados')
+
+    # free_slots depois de uma sessão de cada duração às 08:00.
+    turnos = ((manha.time(), (manha + timedelta(hours=10)).time()),)
+    for duracao in args.duracoes:
+        fim = manha + timedelta(minutes=duracao)
+        ocupados = BusyIntervals([(manha - folga, fim + folga)])
+        blocos_ocupados = set(blocos_do_agendamento(manha, duracao))
+        for horario in free_slots(dia, timedelta(minutes=duracao), ocupados, turnos=turnos):
+            if inicio_fora_da_grade(horario):
+                divergencias.append(f'free_slots ofereceu {horario:%H:%M} fora da grade ({duracao} min)')
+            elif not blocos_ocupados.isdisjoint(blocos_do_agendamento(horario, duracao)):
+                divergencias.append(f'free_slots ofereceu {horario:%H:%M}, que disputa bloco ({duracao} min)')
+
+    for divergencia in divergencias[:20]:
+        print(f'  {divergencia}')
+    print(f'Divergências: {len(divergencias)}')
+    sys.exit(1 if divergencias else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,91 @@
+"""
+Verificação de consistência do cache de disponibilidade sob concorrência.
+
+Várias threads de clientes reservam horários livres de um atendente enquanto
+outras threads consultam a disponibilidade. Toda consulta iniciada depois de
+uma reserva bem-sucedida não pode oferecer o horário reservado. No fim mostra
+a taxa de acerto do cache e o número de violações (deve ser zero).
+
+Os agendamentos criados ficam no banco: use um banco de testes.
+
+Uso:
+    python benchmarks/check_disponibilidade_cache.py --atendente 5 --clientes 2 3 4 --dia 2030-01-07
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--atendente', type=int, required=True)
+    parser.add_argument('--clientes', type=int, nargs='+', required=True)
+    parser.add_argument('--dia', required=True, help='YYYY-MM-DD, no futuro')
+    parser.add_argument('--duracao', type=int, default=30)
+    parser.add_argument('--leitores', type=int, default=8)
+    parser.add_argument('--consultas', type=int, default=500)
+    args = parser.parse_args()
+
+    from app import create_app
+    from utils.agenda import disponibilidade_cache
+    from utils.auth import generate_token
+
+    app = create_app()
+    url_disponibilidade = f'/api/atendentes/{args.atendente}/disponibilidade?data={args.dia}&duracao={args.duracao}'
+    reservados = []  # (instante em que a reserva foi confirmada, 'HH:MM')
+    violacoes = []
+    lock = threading.Lock()
+
+    def consultar(_):
+        client = app.test_client()
+        inicio = time.monotonic()
+        horarios = client.get(url_disponibilidade).get_json().get('horarios_disponiveis', [])
+        with lock:
+            ja_reservados = {horario for instante, horario in reservados if instante < inicio}
+        for horario in ja_reservados.intersection(horarios):
+            violacoes.append(horario)
+        return horarios
+
+    def reservar(id_cliente):
+        client = app.test_client()
+        headers = {'Authorization': f'Bearer {generate_token(id_cliente, "CLIENTE")}'}
+        criados = 0
+        while True:
+            horarios = consultar(None)
+            if not horarios:
+                return criados
+            horario = random.choice(horarios)
+            resposta = client.post('/api/agendamentos', headers=headers, json={
+                'id_atendente': args.atendente,
+                'data_hora_inicio': f'{args.dia}T{horario}:00',
+                'duracao_minutos': args.duracao,
+                'modalidade': 'ONLINE',
+                'assunto_solicitacao': 'Verificação do cache de disponibilidade',
+            })
+            if resposta.status_code == 201:
+                with lock:
+                    reservados.append((time.monotonic(), horario))
+                criados += 1
+            elif resposta.status_code not in (409, 500):
+                raise SystemExit(f'Resposta inesperada ao reservar: {resposta.status_code} {resposta.get_json()}')
+
+    with ThreadPoolExecutor(max_workers=len(args.clientes) + args.leitores) as executor:
+        reservas = [executor.submit(reservar, id_cliente) for id_cliente in args.clientes]
+        list(executor.map(consultar, range(args.consultas)))
+        total_reservas = sum(futuro.result() for futuro in reservas)
+
+    stats = disponibilidade_cache.stats()
+    print(f'Reservas criadas: {total_reservas}')
+    print(f"Cache: {stats['hits']} hits, {stats['misses']} misses, taxa de acerto {stats['hit_rate']:.2%}")
+    print(f'Horários já reservados oferecidos: {len(violacoes)}')
+    sys.exit(1 if violacoes else 0)
+
+
+if __name__ == '__main__':
+    main()
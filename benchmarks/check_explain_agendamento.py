@@ -0,0 +1,87 @@
+"""
+Confere com EXPLAIN que as buscas por sobreposição de horário em agendamento
+são faixas (type=range) no índice idx_agendamento_atendente_periodo.
+
+Roda as consultas reais de utils/agenda (carregar_ocupados e
+carregar_ocupados_por_atendente) por um cursor que troca cada SELECT pelo
+seu EXPLAIN, além da consulta de fn_verificar_disponibilidade_atendente.
+Rode com AGENDA_BLOCOS_ENABLED=False (com blocos a leitura é em
+agendamento_bloco). Com tabelas quase vazias o otimizador pode preferir
+varrer a tabela: rode com dados de volume realista (ex.:
+bench_atendentes_livres.py --semear) e depois de ANALYZE TABLE agendamento.
+
+Uso:
+    python benchmarks/check_explain_agendamento.py --atendentes 5 7 9 --dia 2030-01-08
+"""
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.agenda import carregar_ocupados, carregar_ocupados_por_atendente
+from utils.db import close_pool, get_connection
+
+INDICE = 'idx_agendamento_atendente_periodo'
+
+QUERY_FUNCAO = """
+    SELECT COUNT(*) FROM agendamento ag
+    WHERE ag.id_atendente = %s
+      AND ag.status_agendamento IN ('SOLICITADO', 'CONFIRMADO', 'REALIZADO')
+      AND ag.data_hora_inicio >= DATE_SUB(%s, INTERVAL 1 DAY)
+      AND ag.data_hora_inicio < %s
+      AND ag.data_hora_fim > %s
+"""
+
+
+class ExplainCursor:
+    """Executa EXPLAIN no lugar de cada consulta e guarda o plano; fetchall devolve vazio."""
+
+    def __init__(self, cursor):
+        self.cursor = cursor
+        self.planos = []
+
+    def execute(self, query, params=None):
+        self.cursor.execute('EXPLAIN ' + query, params)
+        self.planos.append(self.cursor.fetchall())
+
+    def fetchall(self):
+        return []
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--atendentes', type=int, nargs='+', required=True)
+    parser.add_argument('--dia', required=True, help='YYYY-MM-DD')
+    args = parser.parse_args()
+
+    inicio = datetime.fromisoformat(args.dia)
+    fim = inicio + timedelta(days=1)
+    connection = get_connection()
+    falhas = 0
+    try:
+        with connection.cursor() as cursor:
+            chamadas = (
+                ('carregar_ocupados', lambda c: carregar_ocupados(c, args.atendentes[0], inicio, fim)),
+                ('carregar_ocupados_por_atendente', lambda c: carregar_ocupados_por_atendente(c, args.atendentes, inicio, fim)),
+                ('fn_verificar_disponibilidade', lambda c: c.execute(
+                    QUERY_FUNCAO, (args.atendentes[0], inicio, inicio + timedelta(hours=1), inicio))),
+            )
+            for nome, chamada in chamadas:
+                explain = ExplainCursor(cursor)
+                chamada(explain)
+                # A primeira consulta de cada chamada é a de agendamento; as seguintes são das reservas temporárias.
+                linha = explain.planos[0][0]
+                ok = linha['type'] == 'range' and linha['key'] == INDICE
+                falhas += not ok
+                print(f"{'OK  ' if ok else 'FALHA'} {nome}: type={linha['type']} key={linha['key']} "
+                      f"rows={linha['rows']} Extra={linha.get('Extra')}")
+    finally:
+        connection.close()
+        close_pool()
+    sys.exit(1 if falhas else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+-- Migração: coluna data_hora_fim e índice por período em agendamento.
+--
+-- Para bancos criados com uma versão anterior do Connect+DB.sql. A coluna é
+-- gerada (STORED), então o ALTER já preenche os agendamentos existentes e o
+-- valor se mantém sozinho em INSERT/UPDATE.
+--
+--     mysql -u seu_usuario -p site_agendamento < migrations/001_agendamento_data_hora_fim.sql
+
+USE site_agendamento;
+
+-- Agendamentos com mais de um dia quebrariam o limite inferior usado nas buscas por sobreposição.
+SELECT COUNT(*) AS agendamentos_com_mais_de_um_dia FROM agendamento WHERE duracao_minutos > 24 * 60;
+
+ALTER TABLE agendamento
+    ADD COLUMN data_hora_fim DATETIME AS (DATE_ADD(data_hora_inicio, INTERVAL duracao_minutos MINUTE)) STORED
+        COMMENT 'Fim do agendamento (calculado), para buscas de sobreposição por índice.'
+        AFTER duracao_minutos,
+    ADD INDEX idx_agendamento_atendente_periodo (id_atendente, status_agendamento, data_hora_inicio, data_hora_fim);
+
+DROP FUNCTION IF EXISTS fn_verificar_disponibilidade_atendente;
+
+DELIMITER $$
+
+CREATE FUNCTION fn_verificar_disponibilidade_atendente(
+    p_id_atendente INT,
+    p_data_hora_inicio DATETIME,
+    p_duracao_minutos INT,
+    p_id_agendamento_editar INT
+)
+RETURNS BOOLEAN
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE conflitos INT;
+    DECLARE p_data_hora_fim DATETIME;
+
+    SET p_data_hora_fim = DATE_ADD(p_data_hora_inicio, INTERVAL p_duracao_minutos MINUTE);
+
+    SELECT COUNT(*) INTO conflitos
+    FROM agendamento ag
+    WHERE ag.id_atendente = p_id_atendente
+      AND ag.status_agendamento IN ('SOLICITADO', 'CONFIRMADO', 'REALIZADO')
+      AND (p_id_agendamento_editar IS NULL OR ag.id_agendamento <> p_id_agendamento_editar)
+      AND ag.data_hora_inicio >= DATE_SUB(p_data_hora_inicio, INTERVAL 1 DAY)
+      AND ag.data_hora_inicio < p_data_hora_fim
+      AND ag.data_hora_fim > p_data_hora_inicio;
+
+    IF conflitos > 0 THEN
+        RETURN FALSE;
+    ELSE
+        RETURN TRUE;
+    END IF;
+END$$
+
+DELIMITER ;
+
+ANALYZE TABLE agendamento;
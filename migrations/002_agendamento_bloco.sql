@@ -0,0 +1,19 @@
+-- Migração: tabela agendamento_bloco (grade de ocupação por blocos).
+--
+-- Depois de criar a tabela, preencha os blocos dos agendamentos existentes
+-- antes de ligar AGENDA_BLOCOS_ENABLED=True:
+--
+--     mysql -u seu_usuario -p site_agendamento < migrations/002_agendamento_bloco.sql
+--     flask reconstruir-blocos
+
+USE site_agendamento;
+
+CREATE TABLE IF NOT EXISTS agendamento_bloco (
+    id_atendente INT NOT NULL,
+    inicio_bloco DATETIME NOT NULL,
+    id_agendamento INT NOT NULL,
+    PRIMARY KEY (id_atendente, inicio_bloco),
+    KEY idx_agendamento_bloco_agendamento (id_agendamento),
+    FOREIGN KEY (id_agendamento) REFERENCES agendamento(id_agendamento)
+        ON DELETE CASCADE
+);
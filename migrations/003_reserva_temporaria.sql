@@ -0,0 +1,21 @@
+-- Migração: tabela reserva_temporaria (POST /api/atendentes/<id>/holds).
+--
+--     mysql -u seu_usuario -p site_agendamento < migrations/003_reserva_temporaria.sql
+
+USE site_agendamento;
+
+CREATE TABLE IF NOT EXISTS reserva_temporaria (
+    id_reserva_temporaria INT AUTO_INCREMENT PRIMARY KEY,
+    id_cliente INT NOT NULL,
+    id_atendente INT NOT NULL,
+    data_hora_inicio DATETIME NOT NULL,
+    duracao_minutos INT NOT NULL,
+    data_hora_fim DATETIME AS (DATE_ADD(data_hora_inicio, INTERVAL duracao_minutos MINUTE)) STORED,
+    data_expiracao DATETIME NOT NULL,
+    UNIQUE KEY uk_reserva_temporaria_cliente (id_cliente),
+    KEY idx_reserva_temporaria_periodo (id_atendente, data_hora_inicio, data_hora_fim),
+    FOREIGN KEY (id_cliente) REFERENCES usuario(id_usuario)
+        ON DELETE CASCADE,
+    FOREIGN KEY (id_atendente) REFERENCES usuario(id_usuario)
+        ON DELETE CASCADE
+);
@@ -0,0 +1,9 @@
+-- Migração: coluna id_serie em agendamento (POST /api/agendamentos/serie).
+--
+--     mysql -u seu_usuario -p site_agendamento < migrations/004_agendamento_serie.sql
+
+USE site_agendamento;
+
+ALTER TABLE agendamento
+    ADD COLUMN id_serie CHAR(32) NULL COMMENT 'Identificador comum às ocorrências de uma série recorrente (POST /api/agendamentos/serie).' AFTER id_agendamento_origem,
+    ADD KEY idx_agendamento_serie (id_serie);
@@ -0,0 +1,11 @@
+-- Migração: índice para as páginas de GET /api/agendamentos do admin.
+--
+-- As páginas de cliente e atendente já usam idx_agendamento_cliente e
+-- idx_agendamento_atendente; o InnoDB acrescenta id_agendamento ao fim de
+-- todo índice secundário, o que cobre o desempate do keyset.
+--
+--     mysql -u seu_usuario -p site_agendamento < migrations/005_agendamento_inicio.sql
+
+USE site_agendamento;
+
+CREATE INDEX idx_agendamento_inicio ON agendamento(data_hora_inicio);
@@ -0,0 +1,57 @@
+-- Migração: tabela atendente_avaliacao_resumo (agregados das avaliações).
+--
+-- Depois de criar a tabela, preencha os resumos a partir das avaliações
+-- existentes antes de subir a nova versão da aplicação:
+--
+--     mysql -u seu_usuario -p site_agendamento < migrations/006_atendente_avaliacao_resumo.sql
+--     flask reconstruir-avaliacoes
+
+USE site_agendamento;
+
+CREATE TABLE IF NOT EXISTS atendente_avaliacao_resumo (
+    id_atendente INT PRIMARY KEY,
+    soma_notas INT NOT NULL DEFAULT 0,
+    total_avaliacoes INT NOT NULL DEFAULT 0,
+    total_nota_1 INT NOT NULL DEFAULT 0,
+    total_nota_2 INT NOT NULL DEFAULT 0,
+    total_nota_3 INT NOT NULL DEFAULT 0,
+    total_nota_4 INT NOT NULL DEFAULT 0,
+    total_nota_5 INT NOT NULL DEFAULT 0,
+    media_avaliacoes DECIMAL(2,1) AS (ROUND(soma_notas / NULLIF(total_avaliacoes, 0), 1)) STORED,
+    data_atualizacao TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    KEY idx_resumo_media (media_avaliacoes, total_avaliacoes),
+    FOREIGN KEY (id_atendente) REFERENCES usuario(id_usuario)
+        ON DELETE CASCADE
+);
+
+CREATE OR REPLACE VIEW vw_media_avaliacoes_atendentes AS
+SELECT
+    u.id_usuario AS id_atendente,
+    u.nome_completo AS nome_atendente,
+    ad.area_atuacao,
+    COALESCE(r.total_avaliacoes, 0) AS total_avaliacoes,
+    ROUND(r.soma_notas / r.total_avaliacoes, 2) AS media_geral_notas
+FROM usuario u
+JOIN atendente_detalhes ad ON u.id_usuario = ad.id_usuario
+LEFT JOIN atendente_avaliacao_resumo r ON r.id_atendente = u.id_usuario
+WHERE u.tipo_usuario = 'ATENDENTE' AND u.situacao = 'ATIVO'
+ORDER BY media_geral_notas DESC, total_avaliacoes DESC;
+
+DROP FUNCTION IF EXISTS fn_calcular_media_avaliacao_atendente;
+
+DELIMITER $$
+
+CREATE FUNCTION fn_calcular_media_avaliacao_atendente(p_id_atendente INT)
+RETURNS DECIMAL(3,2)
+DETERMINISTIC
+READS SQL DATA
+BEGIN
+    DECLARE media DECIMAL(3,2);
+    SELECT ROUND(r.soma_notas / r.total_avaliacoes, 2)
+    INTO media
+    FROM atendente_avaliacao_resumo r
+    WHERE r.id_atendente = p_id_atendente;
+    RETURN IFNULL(media, 0.00);
+END$$
+
+DELIMITER ;
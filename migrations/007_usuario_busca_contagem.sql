@@ -0,0 +1,61 @@
+-- Migração: busca e paginação de GET /api/usuarios (admin).
+--
+-- Coluna cpf_digitos com índice, índices para as páginas por data_criacao,
+-- tabela usuario_contagem com os triggers que a mantêm e a carga inicial
+-- dos contadores. Rode com a aplicação parada (ou sem cadastros em
+-- andamento), para a carga não perder usuários criados no meio dela.
+--
+--     mysql -u seu_usuario -p site_agendamento < migrations/007_usuario_busca_contagem.sql
+
+USE site_agendamento;
+
+ALTER TABLE usuario
+    ADD COLUMN cpf_digitos VARCHAR(14) AS (REPLACE(REPLACE(REPLACE(cpf, '.', ''), '-', ''), ' ', '')) STORED COMMENT 'CPF só com dígitos, para a busca do admin por índice.' AFTER cpf,
+    ADD INDEX idx_usuario_cpf_digitos (cpf_digitos),
+    ADD INDEX idx_usuario_tipo_criacao (tipo_usuario, data_criacao),
+    ADD INDEX idx_usuario_criacao (data_criacao),
+    DROP INDEX idx_usuario_tipo_situacao,
+    ADD INDEX idx_usuario_tipo_situacao (tipo_usuario, situacao, data_criacao);
+
+CREATE TABLE IF NOT EXISTS usuario_contagem (
+    tipo_usuario ENUM('CLIENTE', 'ATENDENTE', 'ADMIN') NOT NULL,
+    situacao ENUM('ATIVO', 'PENDENTE_APROVACAO', 'BLOQUEADO', 'INATIVO') NOT NULL,
+    total INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (tipo_usuario, situacao)
+);
+
+DELIMITER $$
+
+CREATE TRIGGER tg_contagem_usuario_insert
+AFTER INSERT ON usuario
+FOR EACH ROW
+BEGIN
+    INSERT INTO usuario_contagem (tipo_usuario, situacao, total) VALUES (NEW.tipo_usuario, NEW.situacao, 1)
+    ON DUPLICATE KEY UPDATE total = total + 1;
+END$$
+
+CREATE TRIGGER tg_contagem_usuario_update
+AFTER UPDATE ON usuario
+FOR EACH ROW
+BEGIN
+    IF NEW.tipo_usuario <> OLD.tipo_usuario OR NEW.situacao <> OLD.situacao THEN
+        UPDATE usuario_contagem SET total = total - 1
+        WHERE tipo_usuario = OLD.tipo_usuario AND situacao = OLD.situacao;
+        INSERT INTO usuario_contagem (tipo_usuario, situacao, total) VALUES (NEW.tipo_usuario, NEW.situacao, 1)
+        ON DUPLICATE KEY UPDATE total = total + 1;
+    END IF;
+END$$
+
+CREATE TRIGGER tg_contagem_usuario_delete
+AFTER DELETE ON usuario
+FOR EACH ROW
+BEGIN
+    UPDATE usuario_contagem SET total = total - 1
+    WHERE tipo_usuario = OLD.tipo_usuario AND situacao = OLD.situacao;
+END$$
+
+DELIMITER ;
+
+DELETE FROM usuario_contagem;
+INSERT INTO usuario_contagem (tipo_usuario, situacao, total)
+SELECT tipo_usuario, situacao, COUNT(*) FROM usuario GROUP BY tipo_usuario, situacao;
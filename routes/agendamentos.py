@@ -1,397 +1,614 @@
-from flask import Blueprint, request, jsonify
-from utils.db import execute_query, get_connection
-from utils.auth import token_required, cliente_required, atendente_required, admin_required
-from utils.validators import validate_agendamento_data, validate_avaliacao_data
-from datetime import datetime, timedelta
-
-agendamentos_bp = Blueprint('agendamentos', __name__)
-
-@agendamentos_bp.route('', methods=['POST'])
-@cliente_required
-def create_agendamento_cliente():
-    data = request.json
-    id_cliente_logado = request.current_user['id_usuario']
-
-    data['id_cliente'] = id_cliente_logado
-
-
-
-    ag_errors = validate_agendamento_data(data)
-    if ag_errors:
-        return jsonify({'message': 'Dados de agendamento inválidos.', 'errors': ag_errors}), 400
-
-    connection = None
-    try:
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT id_usuario FROM usuario WHERE id_usuario = %s AND tipo_usuario = 'ATENDENTE' AND situacao = 'ATIVO'", (data['id_atendente'],))
-            if not cursor.fetchone():
-                return jsonify({'message': 'Atendente inválido ou não disponível.'}), 404
-
-
-
-            cursor.execute(
-                "SELECT fn_verificar_disponibilidade_atendente(%s, %s, %s, NULL) AS disponivel",
-                (data['id_atendente'], data['data_hora_inicio'], data['duracao_minutos'])
-            )
-            disponibilidade = cursor.fetchone()
-            if not disponibilidade or not disponibilidade['disponivel']:
-                return jsonify({'message': 'Horário indisponível para o atendente.'}), 409
-
-            sql_insert_ag = """
-                INSERT INTO agendamento (id_cliente, id_atendente, data_hora_inicio, duracao_minutos,
-                                         assunto_solicitacao, modalidade, status_agendamento)
-                VALUES (%s, %s, %s, %s, %s, %s, 'SOLICITADO')
-            """
-            cursor.execute(sql_insert_ag, (
-                data['id_cliente'], data['id_atendente'], data['data_hora_inicio'], data['duracao_minutos'],
-                data.get('assunto_solicitacao'), data['modalidade']
-            ))
-            id_agendamento_criado = cursor.lastrowid
-
-            cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (data['id_cliente'],))
-            cliente_nome = cursor.fetchone()['nome_completo']
-            msg_notif = f"Nova solicitação de agendamento de {cliente_nome} para {datetime.fromisoformat(data['data_hora_inicio']).strftime('%d/%m/%Y %H:%M')}."
-            cursor.execute("""
-                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (data['id_atendente'], 'Nova Solicitação', msg_notif, 'NOVO_AGENDAMENTO_SOLICITADO', f'/atendente/solicitacoes/{id_agendamento_criado}'))
-
-            connection.commit()
-
-            cursor.execute("SELECT * FROM agendamento WHERE id_agendamento = %s", (id_agendamento_criado,))
-            agendamento_criado_obj = cursor.fetchone()
-
-            return jsonify({
-                'message': 'Solicitação de agendamento enviada com sucesso!',
-                'agendamento_criado': agendamento_criado_obj
-            }), 201
-
-    except Exception as e:
-        if connection: connection.rollback()
-        print(f"Erro ao criar agendamento: {e}")
-        return jsonify({'message': f'Erro interno ao criar agendamento. {str(e)}'}), 500
-    finally:
-        if connection: connection.close()
-
-
-@agendamentos_bp.route('/<int:agendamento_id>/confirmar/atendente', methods=['POST'])
-@atendente_required
-def confirmar_agendamento_pelo_atendente(agendamento_id):
-    id_atendente_logado = request.current_user['id_usuario']
-    data = request.json
-    link_online = data.get('link_atendimento_online')
-    observacoes = data.get('observacoes_atendente')
-    connection = None
-    try:
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT id_atendente, id_cliente, status_agendamento, data_hora_inicio FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
-            ag = cursor.fetchone()
-            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
-            if ag['id_atendente'] != id_atendente_logado: return jsonify({'message': 'Este agendamento não pertence a você.'}), 403
-            if ag['status_agendamento'] != 'SOLICITADO': return jsonify({'message': f'Este agendamento já está {ag["status_agendamento"]}.'}), 400
-
-            cursor.execute("""
-                UPDATE agendamento SET status_agendamento = 'CONFIRMADO',
-                                       link_atendimento_online = %s,
-                                       observacoes_atendente = %s
-                WHERE id_agendamento = %s
-            """, (link_online, observacoes, agendamento_id))
-
-            cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (ag['id_atendente'],))
-            atendente_nome = cursor.fetchone()['nome_completo']
-            msg_notif = f"Seu agendamento com {atendente_nome} para {ag['data_hora_inicio'].strftime('%d/%m/%Y %H:%M')} foi CONFIRMADO."
-            cursor.execute("""
-                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (ag['id_cliente'], 'Agendamento Confirmado!', msg_notif, 'AGENDAMENTO_CONFIRMADO', f'/cliente/meus-agendamentos/#{agendamento_id}'))
-
-            connection.commit()
-        return jsonify({'message': 'Agendamento confirmado com sucesso!'}), 200
-    except Exception as e:
-        if connection: connection.rollback()
-        return jsonify({'message': f'Erro ao confirmar: {str(e)}'}), 500
-    finally:
-        if connection: connection.close()
-
-@agendamentos_bp.route('/<int:agendamento_id>/recusar/atendente', methods=['POST'])
-@atendente_required
-def recusar_agendamento_pelo_atendente(agendamento_id):
-    id_atendente_logado = request.current_user['id_usuario']
-    data = request.json
-    motivo_recusa = data.get('motivo_recusa')
-    if not motivo_recusa:
-        return jsonify({'message': 'Motivo da recusa é obrigatório.'}), 400
-    connection = None
-    try:
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT id_atendente, id_cliente, status_agendamento, data_hora_inicio FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
-            ag = cursor.fetchone()
-            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
-            if ag['id_atendente'] != id_atendente_logado: return jsonify({'message': 'Este agendamento não pertence a você.'}), 403
-            if ag['status_agendamento'] != 'SOLICITADO': return jsonify({'message': f'Este agendamento já está {ag["status_agendamento"]}.'}), 400
-
-            cursor.execute("""
-                UPDATE agendamento SET status_agendamento = 'CANCELADO_ATENDENTE',
-                                       observacoes_atendente = CONCAT('Recusado: ', %s)
-                WHERE id_agendamento = %s
-            """, (motivo_recusa, agendamento_id))
-
-            cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (ag['id_atendente'],))
-            atendente_nome = cursor.fetchone()['nome_completo']
-            msg_notif = f"Sua solicitação de agendamento com {atendente_nome} para {ag['data_hora_inicio'].strftime('%d/%m/%Y %H:%M')} foi recusada. Motivo: {motivo_recusa}"
-            cursor.execute("""
-                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (ag['id_cliente'], 'Solicitação Recusada', msg_notif, 'AGENDAMENTO_CANCELADO', f'/cliente/meus-agendamentos/'))
-
-            connection.commit()
-        return jsonify({'message': 'Agendamento recusado e cliente notificado.'}), 200
-    except Exception as e:
-        if connection: connection.rollback()
-        return jsonify({'message': f'Erro ao recusar: {str(e)}'}), 500
-    finally:
-        if connection: connection.close()
-
-
-@agendamentos_bp.route('/<int:agendamento_id>/cancelar/cliente', methods=['POST'])
-@cliente_required
-def cancelar_agendamento_pelo_cliente(agendamento_id):
-    id_cliente_logado = request.current_user['id_usuario']
-
-
-    connection = None
-    try:
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT id_cliente, id_atendente, status_agendamento, data_hora_inicio FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
-            ag = cursor.fetchone()
-            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
-            if ag['id_cliente'] != id_cliente_logado: return jsonify({'message': 'Este agendamento não pertence a você.'}), 403
-            if ag['status_agendamento'] not in ['SOLICITADO', 'CONFIRMADO']:
-                return jsonify({'message': f'Não é possível cancelar um agendamento {ag["status_agendamento"]}.'}), 400
-
-
-
-            cursor.execute("UPDATE agendamento SET status_agendamento = 'CANCELADO_CLIENTE' WHERE id_agendamento = %s", (agendamento_id,))
-
-            cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (ag['id_cliente'],))
-            cliente_nome = cursor.fetchone()['nome_completo']
-            msg_notif = f"O agendamento com {cliente_nome} para {ag['data_hora_inicio'].strftime('%d/%m/%Y %H:%M')} foi CANCELADO pelo cliente."
-            cursor.execute("""
-                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
-                VALUES (%s, %s, %s, %s, %s)
-            """, (ag['id_atendente'], 'Agendamento Cancelado', msg_notif, 'AGENDAMENTO_CANCELADO', f'/atendente/minha-agenda/'))
-
-            connection.commit()
-        return jsonify({'message': 'Agendamento cancelado com sucesso.'}), 200
-    except Exception as e:
-        if connection: connection.rollback()
-        return jsonify({'message': f'Erro ao cancelar: {str(e)}'}), 500
-    finally:
-        if connection: connection.close()
-
-@agendamentos_bp.route('/<int:agendamento_id>/observacoes', methods=['PUT'])
-@atendente_required
-def update_observacoes_agendamento(agendamento_id):
-    id_atendente_logado = request.current_user['id_usuario']
-    data = request.json
-    observacoes = data.get('observacoes_atendente')
-    connection = None
-    try:
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT id_atendente FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
-            ag = cursor.fetchone()
-            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
-            if ag['id_atendente'] != id_atendente_logado: return jsonify({'message': 'Acesso negado.'}), 403
-
-            cursor.execute("UPDATE agendamento SET observacoes_atendente = %s WHERE id_agendamento = %s", (observacoes, agendamento_id))
-            connection.commit()
-        return jsonify({'message': 'Observações salvas com sucesso.'}), 200
-    except Exception as e:
-        if connection: connection.rollback()
-        return jsonify({'message': f'Erro ao salvar observações: {str(e)}'}), 500
-    finally:
-        if connection: connection.close()
-
-@agendamentos_bp.route('/<int:agendamento_id>/marcar-realizado', methods=['POST'])
-@atendente_required
-def marcar_agendamento_realizado(agendamento_id):
-    id_atendente_logado = request.current_user['id_usuario']
-    connection = None
-    try:
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT id_atendente, status_agendamento, data_hora_inicio FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
-            ag = cursor.fetchone()
-            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
-            if ag['id_atendente'] != id_atendente_logado: return jsonify({'message': 'Acesso negado.'}), 403
-            if ag['status_agendamento'] != 'CONFIRMADO': return jsonify({'message': 'Apenas agendamentos CONFIRMADOS podem ser marcados como realizados.'}), 400
-            if ag['data_hora_inicio'] > datetime.now() : return jsonify({'message': 'Este agendamento ainda não ocorreu.'}), 400
-
-            cursor.execute("UPDATE agendamento SET status_agendamento = 'REALIZADO' WHERE id_agendamento = %s", (agendamento_id,))
-
-
-            connection.commit()
-        return jsonify({'message': 'Agendamento marcado como realizado.'}), 200
-    except Exception as e:
-        if connection: connection.rollback()
-        return jsonify({'message': f'Erro ao marcar como realizado: {str(e)}'}), 500
-    finally:
-        if connection: connection.close()
-
-
-@agendamentos_bp.route('', methods=['GET'])
-@token_required
-def get_meus_agendamentos_filtrados():
-    user_id = request.current_user['id_usuario']
-    user_type = request.current_user['tipo_usuario']
-
-    status_filtro = request.args.get('status')
-
-    base_query = """
-        SELECT
-            ag.id_agendamento, ag.data_hora_inicio, ag.duracao_minutos, ag.modalidade, ag.status_agendamento,
-            ag.assunto_solicitacao, ag.link_atendimento_online, ag.observacoes_atendente,
-            cli.nome_completo AS nome_cliente, cli.id_usuario AS id_cliente,
-            att.nome_completo AS nome_atendente, att.id_usuario AS id_atendente,
-            ad.area_atuacao AS area_atendente,
-            (SELECT COUNT(*) FROM avaliacao av WHERE av.id_agendamento = ag.id_agendamento) > 0 AS avaliacao_existente
-        FROM agendamento ag
-        JOIN usuario cli ON ag.id_cliente = cli.id_usuario
-        JOIN usuario att ON ag.id_atendente = att.id_usuario
-        JOIN atendente_detalhes ad ON att.id_usuario = ad.id_usuario
-        WHERE
-    """
-    params = []
-
-    if user_type == 'CLIENTE':
-        base_query += " ag.id_cliente = %s"
-        params.append(user_id)
-    elif user_type == 'ATENDENTE':
-        base_query += " ag.id_atendente = %s"
-        params.append(user_id)
-    elif user_type == 'ADMIN':
-
-        base_query += " 1=1 "
-    else:
-        return jsonify({'message': 'Tipo de usuário desconhecido.'}), 403
-
-    if status_filtro:
-        base_query += " AND ag.status_agendamento = %s"
-        params.append(status_filtro)
-
-    base_query += " ORDER BY ag.data_hora_inicio DESC"
-
-    agendamentos = execute_query(base_query, tuple(params))
-
-
-    agora = datetime.now()
-    agendamentos_futuros = [ag for ag in agendamentos if ag['data_hora_inicio'] >= agora and ag['status_agendamento'] not in ['REALIZADO', 'CANCELADO_CLIENTE', 'CANCELADO_ATENDENTE', 'NAO_COMPARECEU_CLIENTE', 'NAO_COMPARECEU_ATENDENTE']]
-    agendamentos_passados = [ag for ag in agendamentos if ag['data_hora_inicio'] < agora or ag['status_agendamento'] in ['REALIZADO', 'CANCELADO_CLIENTE', 'CANCELADO_ATENDENTE', 'NAO_COMPARECEU_CLIENTE', 'NAO_COMPARECEU_ATENDENTE']]
-
-
-    return jsonify({
-        'agendamentos_futuros': agendamentos_futuros,
-        'agendamentos_passados': agendamentos_passados
-    }), 200
-
-@agendamentos_bp.route('/avaliacoes', methods=['POST'])
-@cliente_required
-def criar_nova_avaliacao():
-    data = request.json
-    id_cliente_logado = request.current_user['id_usuario']
-
-    data['id_avaliador'] = id_cliente_logado
-
-
-    aval_errors = validate_avaliacao_data(data)
-    if aval_errors:
-        return jsonify({'message': 'Dados de avaliação inválidos.', 'errors': aval_errors}), 400
-
-    connection = None
-    try:
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute("""
-                SELECT id_cliente, id_atendente, status_agendamento
-                FROM agendamento WHERE id_agendamento = %s
-            """, (data['id_agendamento'],))
-            ag = cursor.fetchone()
-
-            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
-            if ag['id_cliente'] != id_cliente_logado: return jsonify({'message': 'Você só pode avaliar seus próprios agendamentos.'}), 403
-            if ag['status_agendamento'] != 'REALIZADO': return jsonify({'message': 'Só é possível avaliar agendamentos realizados.'}), 400
-
-            cursor.execute("SELECT id_avaliacao FROM avaliacao WHERE id_agendamento = %s", (data['id_agendamento'],))
-            if cursor.fetchone():
-                return jsonify({'message': 'Este agendamento já foi avaliado.'}), 409
-
-            sql_insert_aval = """
-                INSERT INTO avaliacao (id_agendamento, id_avaliador, id_avaliado, nota, comentario, anonima)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            cursor.execute(sql_insert_aval, (
-                data['id_agendamento'], id_cliente_logado, ag['id_atendente'], data['nota'],
-                data.get('comentario'), data.get('anonima', False)
-            ))
-            id_avaliacao_criada = cursor.lastrowid
-            connection.commit()
-            return jsonify({'message': 'Avaliação enviada com sucesso!', 'id_avaliacao': id_avaliacao_criada}), 201
-    except Exception as e:
-        if connection: connection.rollback()
-        return jsonify({'message': f'Erro ao enviar avaliação: {str(e)}'}), 500
-    finally:
-        if connection: connection.close()
-
-@agendamentos_bp.route('/<int:agendamento_id>/cancelar/admin', methods=['POST'])
-@admin_required
-def admin_cancelar_agendamento(agendamento_id):
-    data = request.json
-    motivo = data.get('motivo')
-    if not motivo:
-        return jsonify({'message': 'Motivo do cancelamento é obrigatório.'}), 400
-
-    id_admin_logado = request.current_user['id_usuario']
-    connection = None
-    try:
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT id_cliente, id_atendente, status_agendamento, data_hora_inicio FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
-            ag = cursor.fetchone()
-
-            if not ag:
-                return jsonify({'message': 'Agendamento não encontrado.'}), 404
-
-            if ag['status_agendamento'] in ['REALIZADO', 'CANCELADO_CLIENTE', 'CANCELADO_ATENDENTE', 'CANCELADO_ADMIN']:
-                return jsonify({'message': f'Agendamento já está {ag["status_agendamento"]} e não pode ser cancelado novamente.'}), 400
-
-            status_anterior = ag['status_agendamento']
-
-            novo_status = 'CANCELADO_ADMIN'
-            cursor.execute("UPDATE agendamento SET status_agendamento = %s WHERE id_agendamento = %s", (novo_status, agendamento_id))
-
-
-            msg_notif = f"O agendamento para {ag['data_hora_inicio'].strftime('%d/%m/%Y %H:%M')} foi cancelado pelo administrador. Motivo: {motivo}"
-
-            cursor.execute("""
-                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao)
-                VALUES (%s, %s, %s, %s)
-            """, (ag['id_cliente'], 'Agendamento Cancelado', msg_notif, 'AGENDAMENTO_CANCELADO_ADMIN'))
-
-            cursor.execute("""
-                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao)
-                VALUES (%s, %s, %s, %s)
-            """, (ag['id_atendente'], 'Agendamento Cancelado', msg_notif, 'AGENDAMENTO_CANCELADO_ADMIN'))
-
-            connection.commit()
-        return jsonify({'message': 'Agendamento cancelado pelo administrador com sucesso.'}), 200
-    except Exception as e:
-        if connection: connection.rollback()
-        print(f"Erro ao admin cancelar agendamento {agendamento_id}: {e}")
-        return jsonify({'message': f'Erro interno ao cancelar agendamento. {str(e)}'}), 500
-    finally:
-        if connection: connection.close()
+import uuid
+from flask import Blueprint, request, jsonify
+from pymysql.err import IntegrityError
+from utils.db import execute_query, get_connection, iter_query, run_transaction
+from utils.streaming import stream_json_object
+from utils.auth import token_required, cliente_required, atendente_required, admin_required
+from utils.validators import validate_agendamento_data, validate_avaliacao_data
+from utils.avaliacoes import registrar_nota
+from utils.diretorio import diretorio_atendentes
+from utils.agenda import (
+    HorarioIndisponivelError, carregar_ocupados, consumir_reserva_temporaria, inicio_fora_da_grade, invalidar_disponibilidade,
+    liberar_blocos, ocupar_blocos, ocupar_blocos_de_varios,
+)
+from config import Config
+from datetime import datetime, timedelta
+
+agendamentos_bp = Blueprint('agendamentos', __name__)
+
+@agendamentos_bp.route('', methods=['POST'])
+@cliente_required
+def create_agendamento_cliente():
+    data = request.json
+    id_cliente_logado = request.current_user['id_usuario']
+
+    data['id_cliente'] = id_cliente_logado
+
+
+
+    ag_errors = validate_agendamento_data(data)
+    if ag_errors:
+        return jsonify({'message': 'Dados de agendamento inválidos.', 'errors': ag_errors}), 400
+
+    inicio = datetime.fromisoformat(data['data_hora_inicio'])
+    fim = inicio + timedelta(minutes=int(data['duracao_minutos']))
+    erro_grade = inicio_fora_da_grade(inicio)
+    if erro_grade:
+        return jsonify({'message': 'Dados de agendamento inválidos.', 'errors': {'data_hora_inicio': erro_grade}}), 400
+
+    def reservar(cursor):
+        # Trava a linha do atendente até o commit: reservas para o mesmo atendente
+        # passam uma de cada vez pela checagem de conflito; as de atendentes diferentes seguem em paralelo.
+        cursor.execute("SELECT id_usuario FROM usuario WHERE id_usuario = %s AND tipo_usuario = 'ATENDENTE' AND situacao = 'ATIVO' FOR UPDATE", (data['id_atendente'],))
+        if not cursor.fetchone():
+            return None, ('Atendente inválido ou não disponível.', 404)
+
+        # Com uma reserva temporária do cliente para esse horário, o conflito já foi conferido ao criá-la.
+        if not consumir_reserva_temporaria(cursor, data['id_atendente'], data['id_cliente'], inicio, int(data['duracao_minutos'])):
+            # Leitura feita depois do lock: já enxerga as reservas commitadas por quem estava na fila
+            # e as reservas temporárias de outros clientes.
+            ocupados = carregar_ocupados(cursor, data['id_atendente'], inicio, fim,
+                                         status=('SOLICITADO', 'CONFIRMADO', 'REALIZADO'), ignorar_cliente=data['id_cliente'])
+            if ocupados.conflita(inicio, fim):
+                return None, ('Horário indisponível para o atendente.', 409)
+
+        sql_insert_ag = """
+            INSERT INTO agendamento (id_cliente, id_atendente, data_hora_inicio, duracao_minutos,
+                                     assunto_solicitacao, modalidade, status_agendamento)
+            VALUES (%s, %s, %s, %s, %s, %s, 'SOLICITADO')
+        """
+        cursor.execute(sql_insert_ag, (
+            data['id_cliente'], data['id_atendente'], data['data_hora_inicio'], data['duracao_minutos'],
+            data.get('assunto_solicitacao'), data['modalidade']
+        ))
+        id_agendamento_criado = cursor.lastrowid
+        ocupar_blocos(cursor, data['id_atendente'], id_agendamento_criado, inicio, int(data['duracao_minutos']))
+
+        cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (data['id_cliente'],))
+        cliente_nome = cursor.fetchone()['nome_completo']
+        msg_notif = f"Nova solicitação de agendamento de {cliente_nome} para {inicio.strftime('%d/%m/%Y %H:%M')}."
+        cursor.execute("""
+            INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
+            VALUES (%s, %s, %s, %s, %s)
+        """, (data['id_atendente'], 'Nova Solicitação', msg_notif, 'NOVO_AGENDAMENTO_SOLICITADO', f'/atendente/solicitacoes/{id_agendamento_criado}'))
+        return id_agendamento_criado, None
+
+    connection = None
+    try:
+        id_agendamento_criado, erro = run_transaction(reservar)
+        if erro:
+            return jsonify({'message': erro[0]}), erro[1]
+        invalidar_disponibilidade(data['id_atendente'], inicio, int(data['duracao_minutos']))
+
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT * FROM agendamento WHERE id_agendamento = %s", (id_agendamento_criado,))
+            agendamento_criado_obj = cursor.fetchone()
+
+        return jsonify({
+            'message': 'Solicitação de agendamento enviada com sucesso!',
+            'agendamento_criado': agendamento_criado_obj
+        }), 201
+
+    except HorarioIndisponivelError as e:
+        return jsonify({'message': str(e)}), 409
+    except IntegrityError:
+        # uq_atendente_horario / uq_cliente_horario: mesmo horário de início já usado (ex.: agendamento cancelado).
+        return jsonify({'message': 'Já existe um agendamento neste horário de início.'}), 409
+    except Exception as e:
+        print(f"Erro ao criar agendamento: {e}")
+        return jsonify({'message': f'Erro interno ao criar agendamento. {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
+
+
+FREQUENCIAS_SERIE = {'SEMANAL': 7, 'QUINZENAL': 14}
+
+
+@agendamentos_bp.route('/serie', methods=['POST'])
+@cliente_required
+def create_serie_agendamentos_cliente():
+    """
+    Cria uma série de agendamentos (mesmo horário, semanal ou quinzenal) em uma
+    transação: uma consulta de faixa confere conflitos de todas as ocorrências e
+    um INSERT de várias linhas grava as livres. Com ignorar_conflitos=true cria
+    só as ocorrências livres; sem ele, qualquer conflito recusa a série (409).
+    """
+    data = request.json
+    data['id_cliente'] = request.current_user['id_usuario']
+
+    ag_errors = validate_agendamento_data(data)
+    frequencia = str(data.get('frequencia', 'SEMANAL')).upper()
+    if frequencia not in FREQUENCIAS_SERIE:
+        ag_errors['frequencia'] = f"Frequência inválida. Use {' ou '.join(FREQUENCIAS_SERIE)}."
+    try:
+        ocorrencias = int(data.get('ocorrencias', 0))
+    except (TypeError, ValueError):
+        ocorrencias = 0
+    if not 2 <= ocorrencias <= Config.AGENDA_SERIE_MAX_OCORRENCIAS:
+        ag_errors['ocorrencias'] = f'Informe entre 2 e {Config.AGENDA_SERIE_MAX_OCORRENCIAS} ocorrências.'
+    if ag_errors:
+        return jsonify({'message': 'Dados de agendamento inválidos.', 'errors': ag_errors}), 400
+
+    duracao = int(data['duracao_minutos'])
+    passo = timedelta(days=FREQUENCIAS_SERIE[frequencia])
+    primeiro = datetime.fromisoformat(data['data_hora_inicio'])
+    # O passo da série é de dias inteiros: com o primeiro início na grade, todos estão.
+    erro_grade = inicio_fora_da_grade(primeiro)
+    if erro_grade:
+        return jsonify({'message': 'Dados de agendamento inválidos.', 'errors': {'data_hora_inicio': erro_grade}}), 400
+    inicios = [primeiro + passo * i for i in range(ocorrencias)]
+    ignorar_conflitos = bool(data.get('ignorar_conflitos'))
+    id_serie = uuid.uuid4().hex
+
+    def reservar_serie(cursor):
+        cursor.execute("SELECT id_usuario FROM usuario WHERE id_usuario = %s AND tipo_usuario = 'ATENDENTE' AND situacao = 'ATIVO' FOR UPDATE", (data['id_atendente'],))
+        if not cursor.fetchone():
+            return None, ('Atendente inválido ou não disponível.', 404)
+
+        # Uma leitura de faixa cobre a série inteira; cada ocorrência é conferida em memória.
+        ocupados = carregar_ocupados(cursor, data['id_atendente'], inicios[0], inicios[-1] + timedelta(minutes=duracao),
+                                     status=('SOLICITADO', 'CONFIRMADO', 'REALIZADO'), ignorar_cliente=data['id_cliente'])
+        # uq_atendente_horario / uq_cliente_horario também valem para agendamentos cancelados.
+        marcadores = ', '.join(['%s'] * len(inicios))
+        cursor.execute(f"""
+            SELECT data_hora_inicio FROM agendamento
+            WHERE (id_atendente = %s OR id_cliente = %s) AND data_hora_inicio IN ({marcadores})
+        """, (data['id_atendente'], data['id_cliente'], *inicios))
+        inicios_usados = {linha['data_hora_inicio'] for linha in cursor.fetchall()}
+
+        conflitos, livres = [], []
+        for inicio in inicios:
+            if inicio in inicios_usados:
+                conflitos.append({'data_hora_inicio': inicio.isoformat(), 'motivo': 'Já existe um agendamento neste horário de início.'})
+            elif ocupados.conflita(inicio, inicio + timedelta(minutes=duracao)):
+                conflitos.append({'data_hora_inicio': inicio.isoformat(), 'motivo': 'Horário indisponível para o atendente.'})
+            else:
+                livres.append(inicio)
+        if not livres or (conflitos and not ignorar_conflitos):
+            return None, ({'message': 'Há ocorrências da série com horário indisponível.', 'conflitos': conflitos}, 409)
+
+        # O PyMySQL só junta o executemany em um único INSERT de várias linhas se o
+        # VALUES tiver apenas %s; por isso o status também vai como parâmetro.
+        cursor.executemany("""
+            INSERT INTO agendamento (id_cliente, id_atendente, data_hora_inicio, duracao_minutos,
+                                     assunto_solicitacao, modalidade, status_agendamento, id_serie)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        """, [(data['id_cliente'], data['id_atendente'], inicio, duracao,
+               data.get('assunto_solicitacao'), data['modalidade'], 'SOLICITADO', id_serie) for inicio in livres])
+        cursor.execute("SELECT id_agendamento, data_hora_inicio FROM agendamento WHERE id_serie = %s ORDER BY data_hora_inicio", (id_serie,))
+        criados = cursor.fetchall()
+        ocupar_blocos_de_varios(cursor, data['id_atendente'],
+                                [(linha['id_agendamento'], linha['data_hora_inicio'], duracao) for linha in criados])
+
+        msg_notif = (f"Nova solicitação de {len(criados)} agendamentos ({frequencia.lower()}) de "
+                     f"{request.current_user['nome_completo']} a partir de {livres[0].strftime('%d/%m/%Y %H:%M')}.")
+        cursor.execute("""
+            INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
+            VALUES (%s, %s, %s, %s, %s)
+        """, (data['id_atendente'], 'Nova Solicitação', msg_notif, 'NOVO_AGENDAMENTO_SOLICITADO', f"/atendente/solicitacoes/{criados[0]['id_agendamento']}"))
+        return (criados, conflitos), None
+
+    connection = None
+    try:
+        resultado, erro = run_transaction(reservar_serie)
+        if erro:
+            corpo = erro[0] if isinstance(erro[0], dict) else {'message': erro[0]}
+            return jsonify(corpo), erro[1]
+        criados, conflitos = resultado
+        for linha in criados:
+            invalidar_disponibilidade(data['id_atendente'], linha['data_hora_inicio'], duracao)
+
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT * FROM agendamento WHERE id_serie = %s ORDER BY data_hora_inicio", (id_serie,))
+            agendamentos_criados = cursor.fetchall()
+
+        return jsonify({
+            'message': f'Solicitação de {len(agendamentos_criados)} agendamentos enviada com sucesso!',
+            'id_serie': id_serie,
+            'agendamentos_criados': agendamentos_criados,
+            'conflitos': conflitos
+        }), 201
+
+    except HorarioIndisponivelError as e:
+        return jsonify({'message': str(e)}), 409
+    except IntegrityError:
+        return jsonify({'message': 'Já existe um agendamento neste horário de início.'}), 409
+    except Exception as e:
+        print(f"Erro ao criar série de agendamentos: {e}")
+        return jsonify({'message': f'Erro interno ao criar série de agendamentos. {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
+
+
+@agendamentos_bp.route('/<int:agendamento_id>/confirmar/atendente', methods=['POST'])
+@atendente_required
+def confirmar_agendamento_pelo_atendente(agendamento_id):
+    id_atendente_logado = request.current_user['id_usuario']
+    data = request.json
+    link_online = data.get('link_atendimento_online')
+    observacoes = data.get('observacoes_atendente')
+    connection = None
+    try:
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id_atendente, id_cliente, status_agendamento, data_hora_inicio, duracao_minutos FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
+            ag = cursor.fetchone()
+            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
+            if ag['id_atendente'] != id_atendente_logado: return jsonify({'message': 'Este agendamento não pertence a você.'}), 403
+            if ag['status_agendamento'] != 'SOLICITADO': return jsonify({'message': f'Este agendamento já está {ag["status_agendamento"]}.'}), 400
+
+            cursor.execute("""
+                UPDATE agendamento SET status_agendamento = 'CONFIRMADO',
+                                       link_atendimento_online = %s,
+                                       observacoes_atendente = %s
+                WHERE id_agendamento = %s
+            """, (link_online, observacoes, agendamento_id))
+
+            cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (ag['id_atendente'],))
+            atendente_nome = cursor.fetchone()['nome_completo']
+            msg_notif = f"Seu agendamento com {atendente_nome} para {ag['data_hora_inicio'].strftime('%d/%m/%Y %H:%M')} foi CONFIRMADO."
+            cursor.execute("""
+                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
+                VALUES (%s, %s, %s, %s, %s)
+            """, (ag['id_cliente'], 'Agendamento Confirmado!', msg_notif, 'AGENDAMENTO_CONFIRMADO', f'/cliente/meus-agendamentos/#{agendamento_id}'))
+
+            connection.commit()
+            invalidar_disponibilidade(ag['id_atendente'], ag['data_hora_inicio'], ag['duracao_minutos'])
+        return jsonify({'message': 'Agendamento confirmado com sucesso!'}), 200
+    except Exception as e:
+        if connection: connection.rollback()
+        return jsonify({'message': f'Erro ao confirmar: {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
+
+@agendamentos_bp.route('/<int:agendamento_id>/recusar/atendente', methods=['POST'])
+@atendente_required
+def recusar_agendamento_pelo_atendente(agendamento_id):
+    id_atendente_logado = request.current_user['id_usuario']
+    data = request.json
+    motivo_recusa = data.get('motivo_recusa')
+    if not motivo_recusa:
+        return jsonify({'message': 'Motivo da recusa é obrigatório.'}), 400
+    connection = None
+    try:
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id_atendente, id_cliente, status_agendamento, data_hora_inicio, duracao_minutos FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
+            ag = cursor.fetchone()
+            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
+            if ag['id_atendente'] != id_atendente_logado: return jsonify({'message': 'Este agendamento não pertence a você.'}), 403
+            if ag['status_agendamento'] != 'SOLICITADO': return jsonify({'message': f'Este agendamento já está {ag["status_agendamento"]}.'}), 400
+
+            cursor.execute("""
+                UPDATE agendamento SET status_agendamento = 'CANCELADO_ATENDENTE',
+                                       observacoes_atendente = CONCAT('Recusado: ', %s)
+                WHERE id_agendamento = %s
+            """, (motivo_recusa, agendamento_id))
+            liberar_blocos(cursor, agendamento_id)
+
+            cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (ag['id_atendente'],))
+            atendente_nome = cursor.fetchone()['nome_completo']
+            msg_notif = f"Sua solicitação de agendamento com {atendente_nome} para {ag['data_hora_inicio'].strftime('%d/%m/%Y %H:%M')} foi recusada. Motivo: {motivo_recusa}"
+            cursor.execute("""
+                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
+                VALUES (%s, %s, %s, %s, %s)
+            """, (ag['id_cliente'], 'Solicitação Recusada', msg_notif, 'AGENDAMENTO_CANCELADO', f'/cliente/meus-agendamentos/'))
+
+            connection.commit()
+            invalidar_disponibilidade(ag['id_atendente'], ag['data_hora_inicio'], ag['duracao_minutos'])
+        return jsonify({'message': 'Agendamento recusado e cliente notificado.'}), 200
+    except Exception as e:
+        if connection: connection.rollback()
+        return jsonify({'message': f'Erro ao recusar: {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
+
+
+@agendamentos_bp.route('/<int:agendamento_id>/cancelar/cliente', methods=['POST'])
+@cliente_required
+def cancelar_agendamento_pelo_cliente(agendamento_id):
+    id_cliente_logado = request.current_user['id_usuario']
+
+
+    connection = None
+    try:
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id_cliente, id_atendente, status_agendamento, data_hora_inicio, duracao_minutos FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
+            ag = cursor.fetchone()
+            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
+            if ag['id_cliente'] != id_cliente_logado: return jsonify({'message': 'Este agendamento não pertence a você.'}), 403
+            if ag['status_agendamento'] not in ['SOLICITADO', 'CONFIRMADO']:
+                return jsonify({'message': f'Não é possível cancelar um agendamento {ag["status_agendamento"]}.'}), 400
+
+
+
+            cursor.execute("UPDATE agendamento SET status_agendamento = 'CANCELADO_CLIENTE' WHERE id_agendamento = %s", (agendamento_id,))
+            liberar_blocos(cursor, agendamento_id)
+
+            cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (ag['id_cliente'],))
+            cliente_nome = cursor.fetchone()['nome_completo']
+            msg_notif = f"O agendamento com {cliente_nome} para {ag['data_hora_inicio'].strftime('%d/%m/%Y %H:%M')} foi CANCELADO pelo cliente."
+            cursor.execute("""
+                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao, link_referencia)
+                VALUES (%s, %s, %s, %s, %s)
+            """, (ag['id_atendente'], 'Agendamento Cancelado', msg_notif, 'AGENDAMENTO_CANCELADO', f'/atendente/minha-agenda/'))
+
+            connection.commit()
+            invalidar_disponibilidade(ag['id_atendente'], ag['data_hora_inicio'], ag['duracao_minutos'])
+        return jsonify({'message': 'Agendamento cancelado com sucesso.'}), 200
+    except Exception as e:
+        if connection: connection.rollback()
+        return jsonify({'message': f'Erro ao cancelar: {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
+
+@agendamentos_bp.route('/<int:agendamento_id>/observacoes', methods=['PUT'])
+@atendente_required
+def update_observacoes_agendamento(agendamento_id):
+    id_atendente_logado = request.current_user['id_usuario']
+    data = request.json
+    observacoes = data.get('observacoes_atendente')
+    connection = None
+    try:
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id_atendente FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
+            ag = cursor.fetchone()
+            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
+            if ag['id_atendente'] != id_atendente_logado: return jsonify({'message': 'Acesso negado.'}), 403
+
+            cursor.execute("UPDATE agendamento SET observacoes_atendente = %s WHERE id_agendamento = %s", (observacoes, agendamento_id))
+            connection.commit()
+        return jsonify({'message': 'Observações salvas com sucesso.'}), 200
+    except Exception as e:
+        if connection: connection.rollback()
+        return jsonify({'message': f'Erro ao salvar observações: {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
+
+@agendamentos_bp.route('/<int:agendamento_id>/marcar-realizado', methods=['POST'])
+@atendente_required
+def marcar_agendamento_realizado(agendamento_id):
+    id_atendente_logado = request.current_user['id_usuario']
+    connection = None
+    try:
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id_atendente, status_agendamento, data_hora_inicio, duracao_minutos FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
+            ag = cursor.fetchone()
+            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
+            if ag['id_atendente'] != id_atendente_logado: return jsonify({'message': 'Acesso negado.'}), 403
+            if ag['status_agendamento'] != 'CONFIRMADO': return jsonify({'message': 'Apenas agendamentos CONFIRMADOS podem ser marcados como realizados.'}), 400
+            if ag['data_hora_inicio'] > datetime.now() : return jsonify({'message': 'Este agendamento ainda não ocorreu.'}), 400
+
+            cursor.execute("UPDATE agendamento SET status_agendamento = 'REALIZADO' WHERE id_agendamento = %s", (agendamento_id,))
+
+
+            connection.commit()
+            invalidar_disponibilidade(ag['id_atendente'], ag['data_hora_inicio'], ag['duracao_minutos'])
+        return jsonify({'message': 'Agendamento marcado como realizado.'}), 200
+    except Exception as e:
+        if connection: connection.rollback()
+        return jsonify({'message': f'Erro ao marcar como realizado: {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
+
+
+STATUS_ENCERRADOS = ('REALIZADO', 'CANCELADO_CLIENTE', 'CANCELADO_ATENDENTE', 'NAO_COMPARECEU_CLIENTE', 'NAO_COMPARECEU_ATENDENTE')
+AGENDAMENTOS_POR_PAGINA = 20
+MAX_AGENDAMENTOS_POR_PAGINA = 100
+
+
+def _cursor_agendamento(linha):
+    """Cursor opaco da última linha de uma página: '<data_hora_inicio ISO>_<id_agendamento>'."""
+    return f"{linha['data_hora_inicio'].isoformat()}_{linha['id_agendamento']}"
+
+
+def _ler_cursor_agendamento(valor):
+    data_hora, _, id_agendamento = valor.rpartition('_')
+    return datetime.fromisoformat(data_hora), int(id_agendamento)
+
+
+@agendamentos_bp.route('', methods=['GET'])
+@token_required
+def get_meus_agendamentos_filtrados():
+    """
+    Agendamentos do usuário logado (todos, para o admin) em duas janelas
+    paginadas por keyset em (data_hora_inicio, id_agendamento): futuros em
+    ordem crescente e passados em ordem decrescente. Cada janela devolve até
+    `limite` linhas e o cursor da próxima página (null quando acabou);
+    `secao=futuros|passados` busca só uma delas. Com `exportar=1`, o admin
+    recebe as janelas inteiras em streaming, sem `limite` nem cursores de volta.
+    """
+    user_id = request.current_user['id_usuario']
+    user_type = request.current_user['tipo_usuario']
+
+    status_filtro = request.args.get('status')
+    limite = min(max(request.args.get('limite', AGENDAMENTOS_POR_PAGINA, type=int), 1), MAX_AGENDAMENTOS_POR_PAGINA)
+    secao = request.args.get('secao')
+    if secao not in (None, 'futuros', 'passados'):
+        return jsonify({'message': "Seção inválida. Use 'futuros' ou 'passados'."}), 400
+
+    base_query = """
+        SELECT
+            ag.id_agendamento, ag.data_hora_inicio, ag.duracao_minutos, ag.modalidade, ag.status_agendamento,
+            ag.assunto_solicitacao, ag.link_atendimento_online, ag.observacoes_atendente,
+            cli.nome_completo AS nome_cliente, cli.id_usuario AS id_cliente,
+            att.nome_completo AS nome_atendente, att.id_usuario AS id_atendente,
+            ad.area_atuacao AS area_atendente,
+            av.id_avaliacao IS NOT NULL AS avaliacao_existente
+        FROM agendamento ag
+        JOIN usuario cli ON ag.id_cliente = cli.id_usuario
+        JOIN usuario att ON ag.id_atendente = att.id_usuario
+        JOIN atendente_detalhes ad ON att.id_usuario = ad.id_usuario
+        LEFT JOIN avaliacao av ON av.id_agendamento = ag.id_agendamento
+        WHERE
+    """
+    params = []
+
+    if user_type == 'CLIENTE':
+        base_query += " ag.id_cliente = %s"
+        params.append(user_id)
+    elif user_type == 'ATENDENTE':
+        base_query += " ag.id_atendente = %s"
+        params.append(user_id)
+    elif user_type == 'ADMIN':
+
+        base_query += " 1=1 "
+    else:
+        return jsonify({'message': 'Tipo de usuário desconhecido.'}), 403
+
+    if status_filtro:
+        base_query += " AND ag.status_agendamento = %s"
+        params.append(status_filtro)
+
+    agora = datetime.now()
+    filtro_encerrados = ", ".join(["%s"] * len(STATUS_ENCERRADOS))
+    # (filtro da janela, operador do keyset, ordem): cada página continua do cursor
+    # pelo índice (id_cliente|id_atendente, data_hora_inicio), sem OFFSET.
+    janelas = {
+        'futuros': (f"ag.data_hora_inicio >= %s AND ag.status_agendamento NOT IN ({filtro_encerrados})", '>', 'ASC'),
+        'passados': (f"(ag.data_hora_inicio < %s OR ag.status_agendamento IN ({filtro_encerrados}))", '<', 'DESC'),
+    }
+
+    # Exportação do admin: as janelas inteiras (a partir dos cursores), lidas e enviadas em lotes.
+    exportar = user_type == 'ADMIN' and request.args.get('exportar') == '1'
+    secoes = []
+    resposta = {}
+    for nome, (filtro, operador, ordem) in janelas.items():
+        if secao and secao != nome:
+            continue
+        query = base_query + f" AND {filtro}"
+        params_janela = [*params, agora, *STATUS_ENCERRADOS]
+        cursor_pagina = request.args.get(f'cursor_{nome}')
+        if cursor_pagina:
+            try:
+                data_hora, id_agendamento = _ler_cursor_agendamento(cursor_pagina)
+            except ValueError:
+                return jsonify({'message': f'Cursor inválido em cursor_{nome}.'}), 400
+            query += f" AND (ag.data_hora_inicio {operador} %s OR (ag.data_hora_inicio = %s AND ag.id_agendamento {operador} %s))"
+            params_janela += [data_hora, data_hora, id_agendamento]
+        query += f" ORDER BY ag.data_hora_inicio {ordem}, ag.id_agendamento {ordem}"
+        if exportar:
+            secoes.append((f'agendamentos_{nome}', iter_query(query, tuple(params_janela))))
+            continue
+        query += " LIMIT %s"
+        params_janela.append(limite + 1)
+
+        agendamentos = execute_query(query, tuple(params_janela))
+        pagina = agendamentos[:limite]
+        resposta[f'agendamentos_{nome}'] = pagina
+        resposta[f'proximo_cursor_{nome}'] = _cursor_agendamento(pagina[-1]) if len(agendamentos) > limite else None
+
+    if exportar:
+        return stream_json_object(secoes)
+    return jsonify(resposta), 200
+
+@agendamentos_bp.route('/avaliacoes', methods=['POST'])
+@cliente_required
+def criar_nova_avaliacao():
+    data = request.json
+    id_cliente_logado = request.current_user['id_usuario']
+
+    data['id_avaliador'] = id_cliente_logado
+
+
+    aval_errors = validate_avaliacao_data(data)
+    if aval_errors:
+        return jsonify({'message': 'Dados de avaliação inválidos.', 'errors': aval_errors}), 400
+
+    connection = None
+    try:
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT id_cliente, id_atendente, status_agendamento
+                FROM agendamento WHERE id_agendamento = %s
+            """, (data['id_agendamento'],))
+            ag = cursor.fetchone()
+
+            if not ag: return jsonify({'message': 'Agendamento não encontrado.'}), 404
+            if ag['id_cliente'] != id_cliente_logado: return jsonify({'message': 'Você só pode avaliar seus próprios agendamentos.'}), 403
+            if ag['status_agendamento'] != 'REALIZADO': return jsonify({'message': 'Só é possível avaliar agendamentos realizados.'}), 400
+
+            cursor.execute("SELECT id_avaliacao FROM avaliacao WHERE id_agendamento = %s", (data['id_agendamento'],))
+            if cursor.fetchone():
+                return jsonify({'message': 'Este agendamento já foi avaliado.'}), 409
+
+            sql_insert_aval = """
+                INSERT INTO avaliacao (id_agendamento, id_avaliador, id_avaliado, nota, comentario, anonima)
+                VALUES (%s, %s, %s, %s, %s, %s)
+            """
+
+            def gravar(cursor_tx):
+                cursor_tx.execute(sql_insert_aval, (
+                    data['id_agendamento'], id_cliente_logado, ag['id_atendente'], data['nota'],
+                    data.get('comentario'), data.get('anonima', False)
+                ))
+                id_avaliacao = cursor_tx.lastrowid
+                # O resumo do atendente muda no mesmo commit da avaliação: as listagens leem só o resumo.
+                registrar_nota(cursor_tx, ag['id_atendente'], data['nota'])
+                return id_avaliacao
+
+            id_avaliacao_criada = run_transaction(gravar)
+            diretorio_atendentes.atualizar(ag['id_atendente'])
+            return jsonify({'message': 'Avaliação enviada com sucesso!', 'id_avaliacao': id_avaliacao_criada}), 201
+    except Exception as e:
+        if connection: connection.rollback()
+        return jsonify({'message': f'Erro ao enviar avaliação: {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
+
+@agendamentos_bp.route('/<int:agendamento_id>/cancelar/admin', methods=['POST'])
+@admin_required
+def admin_cancelar_agendamento(agendamento_id):
+    data = request.json
+    motivo = data.get('motivo')
+    if not motivo:
+        return jsonify({'message': 'Motivo do cancelamento é obrigatório.'}), 400
+
+    id_admin_logado = request.current_user['id_usuario']
+    connection = None
+    try:
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT id_cliente, id_atendente, status_agendamento, data_hora_inicio, duracao_minutos FROM agendamento WHERE id_agendamento = %s", (agendamento_id,))
+            ag = cursor.fetchone()
+
+            if not ag:
+                return jsonify({'message': 'Agendamento não encontrado.'}), 404
+
+            if ag['status_agendamento'] in ['REALIZADO', 'CANCELADO_CLIENTE', 'CANCELADO_ATENDENTE', 'CANCELADO_ADMIN']:
+                return jsonify({'message': f'Agendamento já está {ag["status_agendamento"]} e não pode ser cancelado novamente.'}), 400
+
+            status_anterior = ag['status_agendamento']
+
+            novo_status = 'CANCELADO_ADMIN'
+            cursor.execute("UPDATE agendamento SET status_agendamento = %s WHERE id_agendamento = %s", (novo_status, agendamento_id))
+            liberar_blocos(cursor, agendamento_id)
+
+
+            msg_notif = f"O agendamento para {ag['data_hora_inicio'].strftime('%d/%m/%Y %H:%M')} foi cancelado pelo administrador. Motivo: {motivo}"
+
+            cursor.execute("""
+                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao)
+                VALUES (%s, %s, %s, %s)
+            """, (ag['id_cliente'], 'Agendamento Cancelado', msg_notif, 'AGENDAMENTO_CANCELADO_ADMIN'))
+
+            cursor.execute("""
+                INSERT INTO notificacao (id_usuario_destino, titulo, mensagem, tipo_notificacao)
+                VALUES (%s, %s, %s, %s)
+            """, (ag['id_atendente'], 'Agendamento Cancelado', msg_notif, 'AGENDAMENTO_CANCELADO_ADMIN'))
+
+            connection.commit()
+            invalidar_disponibilidade(ag['id_atendente'], ag['data_hora_inicio'], ag['duracao_minutos'])
+        return jsonify({'message': 'Agendamento cancelado pelo administrador com sucesso.'}), 200
+    except Exception as e:
+        if connection: connection.rollback()
+        print(f"Erro ao admin cancelar agendamento {agendamento_id}: {e}")
+        return jsonify({'message': f'Erro interno ao cancelar agendamento. {str(e)}'}), 500
+    finally:
+        if connection: connection.close()
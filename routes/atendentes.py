@@ -1,8 +1,19 @@
+import heapq
+import itertools
+from collections import Counter
 from flask import Blueprint, request, jsonify
-from utils.db import execute_query, get_connection
-from utils.auth import token_required, admin_required, atendente_required
+from utils.db import execute_query, get_connection, run_transaction
+from utils.auth import token_required, admin_required, atendente_required, cliente_required, invalidate_user_cache
 from utils.validators import validate_atendente_detalhes_data
+from utils.avaliacoes import resumo_avaliacoes
+from utils.diretorio import CONSULTA_ATENDENTES, diretorio_atendentes
 from datetime import datetime, timedelta
+from config import Config
+from utils.agenda import (
+    DURACAO_MAXIMA_AGENDAMENTO, RESERVA_TEMPORARIA_MAX_MIN, TURNOS_PADRAO, HorarioIndisponivelError, ReservaTemporariaRepetidaError,
+    carregar_ocupados, carregar_ocupados_por_atendente, criar_reserva_temporaria, dentro_de_turno, disponibilidade_cache, free_slots, inicio_fora_da_grade,
+    invalidar_disponibilidade, iter_free_slots, primeiros_horarios,
+)
 
 atendentes_bp = Blueprint('atendentes', __name__)
 
@@ -12,26 +23,24 @@ def get_atendentes_publico():
     area_filtro = request.args.get('area_atuacao')
     busca_filtro = request.args.get('busca')
 
-
-    query = """
-        SELECT
-            u.id_usuario, u.nome_completo, u.nome_social, u.email, u.identidade_genero,
-            ad.area_atuacao, ad.qualificacao_descricao, ad.especialidades,
-            ad.registro_profissional, ad.anos_experiencia, ad.curriculo_link,
-            ad.aceita_atendimento_online, ad.aceita_atendimento_presencial,
-            ad.duracao_padrao_atendimento_min,
-            (SELECT ROUND(AVG(aval.nota), 1) FROM avaliacao aval
-             JOIN agendamento ag_aval ON aval.id_agendamento = ag_aval.id_agendamento
-             WHERE ag_aval.id_atendente = u.id_usuario AND ag_aval.status_agendamento = 'REALIZADO') AS media_avaliacoes,
-            (SELECT COUNT(aval.id_avaliacao) FROM avaliacao aval
-             JOIN agendamento ag_aval ON aval.id_agendamento = ag_aval.id_agendamento
-             WHERE ag_aval.id_atendente = u.id_usuario AND ag_aval.status_agendamento = 'REALIZADO') AS total_avaliacoes,
-            u.data_criacao AS data_criacao_usuario, u.situacao AS situacao_usuario
-
-        FROM usuario u
-        JOIN atendente_detalhes ad ON u.id_usuario = ad.id_usuario
-        WHERE u.tipo_usuario = 'ATENDENTE'
-    """
+    limite = request.args.get('limite')
+    try:
+        limite = int(limite) if limite else None
+    except ValueError:
+        limite = None
+
+    if situacao_filtro == 'ATIVO':
+        # Listagem pública: filtros aplicados sobre o diretório em memória, com ETag para revalidação.
+        atendentes, etag = diretorio_atendentes.listar(
+            area=area_filtro if area_filtro and area_filtro != 'TODAS' else None,
+            busca=busca_filtro, limite=max(limite, 0) if limite is not None else None,
+        )
+        resposta = jsonify({'atendentes': atendentes})
+        resposta.set_etag(etag)
+        resposta.cache_control.no_cache = True
+        return resposta.make_conditional(request)
+
+    query = CONSULTA_ATENDENTES
     params = []
 
     if situacao_filtro and situacao_filtro != 'TODOS':
@@ -47,20 +56,226 @@ def get_atendentes_publico():
         query += " AND (u.nome_completo LIKE %s OR u.nome_social LIKE %s OR ad.qualificacao_descricao LIKE %s OR ad.especialidades LIKE %s)"
         params.extend([term, term, term, term])
 
-    query += " ORDER BY media_avaliacoes DESC, u.nome_completo ASC"
+    query += " ORDER BY notas.media_avaliacoes DESC, u.nome_completo ASC"
 
-    limite = request.args.get('limite')
-    if limite:
-        try:
-            query += " LIMIT %s"
-            params.append(int(limite))
-        except ValueError:
-            pass
+    if limite is not None:
+        query += " LIMIT %s"
+        params.append(limite)
 
     atendentes = execute_query(query, tuple(params))
     return jsonify({'atendentes': atendentes}), 200
 
 
+MAX_SUGESTOES = 20
+
+
+@atendentes_bp.route('/sugestoes', methods=['GET'])
+def get_sugestoes_atendentes():
+    """Autocompletar da busca de atendentes (`q`), a partir do índice do diretório em memória."""
+    texto = request.args.get('q', '').strip()
+    limite = min(max(request.args.get('limite', 8, type=int), 1), MAX_SUGESTOES)
+    sugestoes, etag = diretorio_atendentes.sugerir(texto, limite) if texto else ([], None)
+    resposta = jsonify({'sugestoes': sugestoes})
+    if etag:
+        resposta.set_etag(etag)
+        resposta.cache_control.no_cache = True
+    return resposta.make_conditional(request)
+
+
+@atendentes_bp.route('/livres', methods=['GET'])
+def get_atendentes_livres():
+    """Atendentes ativos livres em [inicio, inicio + duracao), ordenados pela avaliação."""
+    area_filtro = request.args.get('area_atuacao')
+    modalidade = request.args.get('modalidade')
+    try:
+        inicio = datetime.fromisoformat(request.args.get('inicio', ''))
+    except ValueError:
+        return jsonify({'message': 'Parâmetro inicio (YYYY-MM-DDTHH:MM) é obrigatório.'}), 400
+    duracao_min = request.args.get('duracao', type=int)
+    if duracao_min is not None and not 0 < duracao_min <= MAX_DURACAO_MIN:
+        return jsonify({'message': f'Duração inválida. Informe entre 1 e {MAX_DURACAO_MIN} minutos.'}), 400
+    limite = min(max(request.args.get('limite', 50, type=int), 1), 200)
+
+    if inicio < datetime.now():
+        return jsonify({'atendentes': [], 'message': 'Não é possível buscar horários no passado.'}), 200
+    if duracao_min and not dentro_de_turno(inicio, inicio + timedelta(minutes=duracao_min)):
+        return jsonify({'atendentes': [], 'message': 'Horário fora dos turnos de atendimento.'}), 200
+    erro_grade = inicio_fora_da_grade(inicio)
+    if erro_grade:
+        return jsonify({'atendentes': [], 'message': erro_grade}), 200
+
+    # Uma única consulta: o NOT EXISTS é uma faixa no índice idx_agendamento_atendente_periodo de cada atendente
+    # e as médias vêm prontas de atendente_avaliacao_resumo.
+    query = """
+        SELECT
+            u.id_usuario, u.nome_completo, u.nome_social, u.identidade_genero,
+            ad.area_atuacao, ad.qualificacao_descricao, ad.especialidades, ad.anos_experiencia,
+            ad.aceita_atendimento_online, ad.aceita_atendimento_presencial,
+            ad.duracao_padrao_atendimento_min,
+            COALESCE(%s, ad.duracao_padrao_atendimento_min, 60) AS duracao_minutos,
+            notas.media_avaliacoes, COALESCE(notas.total_avaliacoes, 0) AS total_avaliacoes
+        FROM usuario u
+        JOIN atendente_detalhes ad ON u.id_usuario = ad.id_usuario
+        LEFT JOIN atendente_avaliacao_resumo notas ON notas.id_atendente = u.id_usuario
+        WHERE u.tipo_usuario = 'ATENDENTE' AND u.situacao = 'ATIVO'
+          AND NOT EXISTS (
+              SELECT 1 FROM agendamento ag
+              WHERE ag.id_atendente = u.id_usuario
+                AND ag.status_agendamento IN ('SOLICITADO', 'CONFIRMADO')
+                AND ag.data_hora_inicio >= %s
+                AND ag.data_hora_inicio < DATE_ADD(%s, INTERVAL COALESCE(%s, ad.duracao_padrao_atendimento_min, 60) + %s MINUTE)
+                AND ag.data_hora_fim > %s
+          )
+          AND NOT EXISTS (
+              SELECT 1 FROM reserva_temporaria rt
+              WHERE rt.id_atendente = u.id_usuario
+                AND rt.data_hora_inicio >= %s
+                AND rt.data_hora_inicio < DATE_ADD(%s, INTERVAL COALESCE(%s, ad.duracao_padrao_atendimento_min, 60) + %s MINUTE)
+                AND rt.data_hora_fim > %s
+                AND rt.data_expiracao > NOW()
+          )
+    """
+    intervalo = timedelta(minutes=Config.AGENDA_INTERVALO_MIN)
+    sobreposicao = [
+        inicio - intervalo - DURACAO_MAXIMA_AGENDAMENTO,
+        inicio, duracao_min, Config.AGENDA_INTERVALO_MIN, inicio - intervalo
+    ]
+    params = [duracao_min, *sobreposicao, *sobreposicao]
+
+    if area_filtro and area_filtro != 'TODAS':
+        query += " AND ad.area_atuacao = %s"
+        params.append(area_filtro)
+    if modalidade == 'ONLINE':
+        query += " AND ad.aceita_atendimento_online = TRUE"
+    elif modalidade == 'PRESENCIAL':
+        query += " AND ad.aceita_atendimento_presencial = TRUE"
+
+    query += " ORDER BY notas.media_avaliacoes IS NULL, notas.media_avaliacoes DESC, total_avaliacoes DESC, u.nome_completo ASC"
+
+    atendentes = [
+        atendente for atendente in execute_query(query, tuple(params))
+        if dentro_de_turno(inicio, inicio + timedelta(minutes=atendente['duracao_minutos']))
+    ][:limite]
+    return jsonify({'inicio': inicio.isoformat(), 'atendentes': atendentes}), 200
+
+
+LOTE_ATENDENTES_PROXIMO_HORARIO = 500
+MAX_QUANTIDADE_PROXIMO_HORARIO = 50
+
+
+@atendentes_bp.route('/proximo-horario', methods=['GET'])
+def get_proximo_horario():
+    """
+    Os `quantidade` primeiros horários livres entre todos os atendentes ativos
+    que atendem aos filtros, em ordem de horário (empates pela avaliação).
+    Todos os atendentes entram na busca; as agendas são carregadas em lotes
+    de LOTE_ATENDENTES_PROXIMO_HORARIO.
+    """
+    area_filtro = request.args.get('area_atuacao')
+    modalidade = request.args.get('modalidade')
+    duracao_min = request.args.get('duracao', type=int)
+    if duracao_min is not None and not 0 < duracao_min <= MAX_DURACAO_MIN:
+        return jsonify({'message': f'Duração inválida. Informe entre 1 e {MAX_DURACAO_MIN} minutos.'}), 400
+    quantidade = min(max(request.args.get('quantidade', 5, type=int), 1), MAX_QUANTIDADE_PROXIMO_HORARIO)
+    por_atendente = request.args.get('por_atendente', type=int)
+    dias = min(max(request.args.get('dias', 14, type=int), 1), MAX_DIAS_DISPONIBILIDADE)
+
+    query = """
+        SELECT
+            u.id_usuario, u.nome_completo, u.nome_social, ad.area_atuacao,
+            ad.aceita_atendimento_online, ad.aceita_atendimento_presencial,
+            COALESCE(%s, ad.duracao_padrao_atendimento_min, 60) AS duracao_minutos,
+            notas.media_avaliacoes, COALESCE(notas.total_avaliacoes, 0) AS total_avaliacoes
+        FROM usuario u
+        JOIN atendente_detalhes ad ON u.id_usuario = ad.id_usuario
+        LEFT JOIN atendente_avaliacao_resumo notas ON notas.id_atendente = u.id_usuario
+        WHERE u.tipo_usuario = 'ATENDENTE' AND u.situacao = 'ATIVO'
+    """
+    params = [duracao_min]
+    if area_filtro and area_filtro != 'TODAS':
+        query += " AND ad.area_atuacao = %s"
+        params.append(area_filtro)
+    if modalidade == 'ONLINE':
+        query += " AND ad.aceita_atendimento_online = TRUE"
+    elif modalidade == 'PRESENCIAL':
+        query += " AND ad.aceita_atendimento_presencial = TRUE"
+    query += " ORDER BY notas.media_avaliacoes IS NULL, notas.media_avaliacoes DESC, total_avaliacoes DESC, u.id_usuario"
+
+    agora = datetime.now()
+    granularidade = timedelta(minutes=Config.AGENDA_GRANULARIDADE_MIN) if Config.AGENDA_GRANULARIDADE_MIN else None
+    horarios = []
+
+    connection = get_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(query, tuple(params))
+            atendentes = cursor.fetchall()
+
+            # Todo horário de um dia vem antes dos do dia seguinte: basta juntar
+            # as agendas dia a dia e parar no primeiro dia que completar a lista.
+            for n in range(dias):
+                if not atendentes or len(horarios) >= quantidade:
+                    break
+                dia = agora.date() + timedelta(days=n)
+                if por_atendente:
+                    usados = Counter(atendente['id_usuario'] for _, atendente in horarios)
+                    candidatos = [a for a in atendentes if usados[a['id_usuario']] < por_atendente]
+                else:
+                    usados = Counter()
+                    candidatos = atendentes
+
+                faltam = quantidade - len(horarios)
+                mais_cedo = max(agora, datetime.combine(dia, TURNOS_PADRAO[0][0]))
+                do_dia = []
+                for posicao in range(0, len(candidatos), LOTE_ATENDENTES_PROXIMO_HORARIO):
+                    # Os lotes seguintes têm avaliação menor: com a lista cheia no
+                    # primeiro horário possível do dia, eles só perderiam no desempate.
+                    if len(do_dia) == faltam and do_dia[-1][0] <= mais_cedo:
+                        break
+                    lote = candidatos[posicao:posicao + LOTE_ATENDENTES_PROXIMO_HORARIO]
+                    fontes = _fontes_proximo_horario(cursor, lote, dia, agora, granularidade, por_atendente, usados)
+                    # heapq.merge é estável: nos empates, os horários de lotes anteriores ficam na frente.
+                    do_dia = list(itertools.islice(heapq.merge(
+                        do_dia, primeiros_horarios(fontes, faltam), key=lambda item: item[0]
+                    ), faltam))
+                horarios.extend(do_dia)
+    finally:
+        if connection: connection.close()
+
+    return jsonify({'horarios': [
+        dict(atendente, data_hora_inicio=horario.isoformat()) for horario, atendente in horarios
+    ]}), 200
+
+
+def _fontes_proximo_horario(cursor, atendentes, dia, agora, granularidade, por_atendente, usados):
+    """(atendente, gerador de horários livres em `dia`) para cada atendente, com o cache quando houver."""
+    em_cache = {}
+    for atendente in atendentes:
+        slots = disponibilidade_cache.get_slots(atendente['id_usuario'], dia, atendente['duracao_minutos'])
+        if slots is not None:
+            em_cache[atendente['id_usuario']] = slots
+    ocupados = carregar_ocupados_por_atendente(
+        cursor, [a['id_usuario'] for a in atendentes if a['id_usuario'] not in em_cache],
+        datetime.combine(dia, datetime.min.time()),
+        datetime.combine(dia + timedelta(days=1), datetime.min.time())
+    )
+
+    fontes = []
+    for atendente in atendentes:
+        id_atendente = atendente['id_usuario']
+        if id_atendente in em_cache:
+            gerador = (horario for horario in em_cache[id_atendente] if horario >= agora)
+        else:
+            gerador = iter_free_slots(
+                dia, timedelta(minutes=atendente['duracao_minutos']), ocupados[id_atendente],
+                granularidade, nao_antes_de=agora
+            )
+        if por_atendente:
+            gerador = itertools.islice(gerador, por_atendente - usados[id_atendente])
+        fontes.append((atendente, gerador))
+    return fontes
+
+
 @atendentes_bp.route('/<int:atendente_id>/perfil', methods=['GET'])
 @token_required
 def get_perfil_atendente(atendente_id):
@@ -178,6 +393,8 @@ def update_perfil_atendente(atendente_id):
                     cursor.execute(sql_insert, insert_params)
 
             connection.commit()
+            invalidate_user_cache(atendente_id)
+            diretorio_atendentes.atualizar(atendente_id)
             cursor.execute("SELECT nome_completo FROM usuario WHERE id_usuario = %s", (atendente_id,))
             usuario_atualizado_nome = cursor.fetchone()
             return jsonify({'message': 'Perfil profissional atualizado com sucesso!', 'usuario_atualizado': usuario_atualizado_nome}), 200
@@ -220,6 +437,8 @@ def aprovar_atendente_admin(id_atendente):
             """, (id_atendente, 'Cadastro Aprovado!', 'Seu cadastro como atendente foi aprovado.', 'ATENDENTE_CADASTRO_APROVADO'))
 
             connection.commit()
+            invalidate_user_cache(id_atendente)
+            diretorio_atendentes.atualizar(id_atendente)
         return jsonify({'message': 'Atendente aprovado com sucesso!'}), 200
     except Exception as e:
         if connection: connection.rollback()
@@ -260,6 +479,8 @@ def bloquear_atendente_admin(id_atendente):
             """, (id_atendente, 'Aviso sobre sua Conta', f'{tipo_notificacao_msg} Motivo: {motivo}', 'ATENDENTE_CADASTRO_REPROVADO'))
 
             connection.commit()
+            invalidate_user_cache(id_atendente)
+            diretorio_atendentes.atualizar(id_atendente)
         return jsonify({'message': f'Atendente { "reprovado" if status_anterior == "PENDENTE_APROVACAO" else "bloqueado"} com sucesso!'}), 200
     except Exception as e:
         if connection: connection.rollback()
@@ -291,19 +512,15 @@ def get_avaliacoes_do_atendente(id_atendente):
     """
     avaliacoes = execute_query(query_avaliacoes, (id_atendente,))
 
-    query_stats = """
-        SELECT
-            ROUND(AVG(av.nota), 2) AS media_geral,
-            COUNT(av.id_avaliacao) AS total_avaliacoes
-        FROM avaliacao av
-        JOIN agendamento ag ON av.id_agendamento = ag.id_agendamento
-        WHERE ag.id_atendente = %s AND ag.status_agendamento = 'REALIZADO'
-    """
-    stats = execute_query(query_stats, (id_atendente,), fetch_all=False)
+    connection = get_connection()
+    try:
+        with connection.cursor() as cursor:
+            resumo = resumo_avaliacoes(cursor, id_atendente)
+    finally:
+        connection.close()
 
     return jsonify({
-        'media_geral': float(stats['media_geral']) if stats and stats['media_geral'] is not None else 0.0,
-        'total_avaliacoes': stats['total_avaliacoes'] if stats else 0,
+        **resumo,
         'avaliacoes': avaliacoes
     }), 200
 
@@ -341,73 +558,166 @@ def get_agendamentos_atendente(id_atendente):
     return jsonify({'agendamentos': agendamentos}), 200
 
 
+MAX_DIAS_DISPONIBILIDADE = 42
+MAX_DURACAO_MIN = 8 * 60
+
+
+def calcular_disponibilidade(cursor, id_atendente, data_inicio, data_fim, duracao_min=None):
+    """
+    Retorna {'YYYY-MM-DD': ['HH:MM', ...]} com os horários livres do atendente
+    entre data_inicio e data_fim (inclusive). Os dias que não estão no cache de
+    disponibilidade são calculados com uma única consulta por faixa.
+    Sem duracao_min, usa a duração padrão do atendente. Retorna None se o atendente não existir.
+    """
+    dias = [data_inicio + timedelta(days=n) for n in range((data_fim - data_inicio).days + 1)]
+    calculados = {}
+    if duracao_min:
+        calculados = {dia: disponibilidade_cache.get_slots(id_atendente, dia, duracao_min) for dia in dias}
+        calculados = {dia: slots for dia, slots in calculados.items() if slots is not None}
+
+    faltantes = [dia for dia in dias if dia not in calculados]
+    if faltantes:
+        cursor.execute("SELECT duracao_padrao_atendimento_min FROM atendente_detalhes WHERE id_usuario = %s", (id_atendente,))
+        at_det = cursor.fetchone()
+        if not at_det:
+            return None
+
+        duracao_min = duracao_min or at_det['duracao_padrao_atendimento_min'] or 60
+        token = disponibilidade_cache.token()
+        ocupados = carregar_ocupados(
+            cursor, id_atendente,
+            datetime.combine(faltantes[0], datetime.min.time()),
+            datetime.combine(faltantes[-1] + timedelta(days=1), datetime.min.time())
+        )
+        granularidade = timedelta(minutes=Config.AGENDA_GRANULARIDADE_MIN) if Config.AGENDA_GRANULARIDADE_MIN else None
+        for dia in faltantes:
+            slots = free_slots(dia, timedelta(minutes=duracao_min), ocupados, granularidade)
+            # Com reservas temporárias, a entrada vence quando a primeira delas vencer.
+            disponibilidade_cache.set_slots(id_atendente, dia, duracao_min, slots, token, ocupados.validade)
+            calculados[dia] = slots
+
+    agora = datetime.now()
+    return {
+        dia.isoformat(): [horario.strftime("%H:%M") for horario in calculados[dia] if horario >= agora]
+        for dia in dias
+    }
+
+
+@atendentes_bp.route('/disponibilidade/cache', methods=['GET'])
+@admin_required
+def get_disponibilidade_cache_stats():
+    return jsonify(disponibilidade_cache.stats()), 200
+
+
 @atendentes_bp.route('/<int:id_atendente>/disponibilidade', methods=['GET'])
 def get_disponibilidade_atendente_api(id_atendente):
     data_str = request.args.get('data')
+    inicio_str = request.args.get('inicio', data_str)
+    fim_str = request.args.get('fim', inicio_str)
 
-    if not data_str:
-        return jsonify({'message': 'Parâmetro data (YYYY-MM-DD) é obrigatório.'}), 400
+    if not inicio_str:
+        return jsonify({'message': 'Informe data=YYYY-MM-DD ou inicio=YYYY-MM-DD&fim=YYYY-MM-DD.'}), 400
     try:
-        data_obj = datetime.strptime(data_str, '%Y-%m-%d').date()
-        if data_obj < datetime.now().date():
-             return jsonify({'horarios_disponiveis': [], 'message': 'Não é possível ver disponibilidade para datas passadas.'}), 200
-
+        data_inicio = datetime.strptime(inicio_str, '%Y-%m-%d').date()
+        data_fim = datetime.strptime(fim_str, '%Y-%m-%d').date()
     except ValueError:
         return jsonify({'message': 'Formato de data inválido. Use YYYY-MM-DD.'}), 400
 
-    connection = get_connection()
-    try:
-        with connection.cursor() as cursor:
-            cursor.execute("SELECT duracao_padrao_atendimento_min FROM atendente_detalhes WHERE id_usuario = %s", (id_atendente,))
-            at_det = cursor.fetchone()
-            if not at_det: return jsonify({'message': 'Atendente não encontrado ou sem detalhes.'}), 404
-
-            duracao_padrao = at_det['duracao_padrao_atendimento_min']
+    if data_fim < data_inicio:
+        return jsonify({'message': 'A data final deve ser igual ou posterior à inicial.'}), 400
+    if (data_fim - data_inicio).days + 1 > MAX_DIAS_DISPONIBILIDADE:
+        return jsonify({'message': f'O período pode ter no máximo {MAX_DIAS_DISPONIBILIDADE} dias.'}), 400
 
-            duracao_intervalo = timedelta(minutes=duracao_padrao or 60)
+    duracao_min = request.args.get('duracao', type=int)
+    if duracao_min is not None and not 0 < duracao_min <= MAX_DURACAO_MIN:
+        return jsonify({'message': f'Duração inválida. Informe entre 1 e {MAX_DURACAO_MIN} minutos.'}), 400
 
+    hoje = datetime.now().date()
+    if data_fim < hoje:
+        if data_str:
+            return jsonify({'horarios_disponiveis': [], 'message': 'Não é possível ver disponibilidade para datas passadas.'}), 200
+        return jsonify({'dias': {}, 'message': 'Não é possível ver disponibilidade para datas passadas.'}), 200
+    data_inicio = max(data_inicio, hoje)
 
-            cursor.execute("""
-                SELECT data_hora_inicio, duracao_minutos
-                FROM agendamento
-                WHERE id_atendente = %s AND DATE(data_hora_inicio) = %s
-                      AND status_agendamento IN ('CONFIRMADO', 'SOLICITADO')
-            """, (id_atendente, data_str))
-            agendamentos_existentes = cursor.fetchall()
-
-            slots_ocupados = []
-            for ag in agendamentos_existentes:
-                inicio = ag['data_hora_inicio']
-                fim_ocupado = inicio + timedelta(minutes=ag['duracao_minutos'])
-                slots_ocupados.append((inicio, fim_ocupado))
-
-            horarios_trabalho = [
-                (datetime.strptime("08:00", "%H:%M").time(), datetime.strptime("12:00", "%H:%M").time()),
-                (datetime.strptime("14:00", "%H:%M").time(), datetime.strptime("18:00", "%H:%M").time())
-            ]
+    connection = get_connection()
+    try:
+        with connection.cursor() as cursor:
+            disponibilidade = calcular_disponibilidade(cursor, id_atendente, data_inicio, data_fim, duracao_min)
+        if disponibilidade is None:
+            return jsonify({'message': 'Atendente não encontrado ou sem detalhes.'}), 404
 
-            horarios_disponiveis_final = []
+        if data_str:
+            return jsonify({'horarios_disponiveis': disponibilidade[data_inicio.isoformat()]}), 200
+        return jsonify({'dias': disponibilidade}), 200
+    finally:
+        if connection: connection.close()
 
-            for inicio_turno, fim_turno in horarios_trabalho:
-                slot_atual = datetime.combine(data_obj, inicio_turno)
-                fim_turno_dt = datetime.combine(data_obj, fim_turno)
 
-                while slot_atual + duracao_intervalo <= fim_turno_dt:
-                    if slot_atual < datetime.now() and data_obj == datetime.now().date():
-                        slot_atual += duracao_intervalo
-                        continue
+@atendentes_bp.route('/<int:id_atendente>/holds', methods=['POST'])
+@cliente_required
+def criar_reserva_temporaria_api(id_atendente):
+    """Segura um horário para o cliente enquanto ele preenche a solicitação de agendamento."""
+    data = request.json or {}
+    id_cliente = request.current_user['id_usuario']
+    try:
+        inicio = datetime.fromisoformat(data.get('data_hora_inicio', ''))
+        duracao_min = int(data.get('duracao_minutos', 0))
+    except (TypeError, ValueError):
+        return jsonify({'message': 'Informe data_hora_inicio (YYYY-MM-DDTHH:MM:SS) e duracao_minutos.'}), 400
+    if not 0 < duracao_min <= RESERVA_TEMPORARIA_MAX_MIN:
+        return jsonify({'message': f'Duração inválida. Informe entre 1 e {RESERVA_TEMPORARIA_MAX_MIN} minutos.'}), 400
+    if inicio < datetime.now():
+        return jsonify({'message': 'Não é possível reservar horários no passado.'}), 400
+    if not dentro_de_turno(inicio, inicio + timedelta(minutes=duracao_min)):
+        return jsonify({'message': 'Horário fora dos turnos de atendimento.'}), 400
+    erro_grade = inicio_fora_da_grade(inicio)
+    if erro_grade:
+        return jsonify({'message': erro_grade}), 400
+
+    def reservar(cursor):
+        cursor.execute("SELECT id_usuario FROM usuario WHERE id_usuario = %s AND tipo_usuario = 'ATENDENTE' AND situacao = 'ATIVO' FOR UPDATE", (id_atendente,))
+        if not cursor.fetchone():
+            return None, None
+        cursor.execute("SELECT id_atendente, data_hora_inicio, duracao_minutos FROM reserva_temporaria WHERE id_cliente = %s", (id_cliente,))
+        anterior = cursor.fetchone()
+        return criar_reserva_temporaria(cursor, id_atendente, id_cliente, inicio, duracao_min), anterior
 
-                    slot_fim = slot_atual + duracao_intervalo
-                    ocupado = False
-                    for inicio_ocupado, fim_ocupado_existente in slots_ocupados:
-                        if max(slot_atual, inicio_ocupado) < min(slot_fim, fim_ocupado_existente):
-                            ocupado = True
-                            break
-                    if not ocupado:
-                        horarios_disponiveis_final.append(slot_atual.strftime("%H:%M"))
+    try:
+        reserva, anterior = run_transaction(reservar)
+    except HorarioIndisponivelError as e:
+        return jsonify({'message': str(e)}), 409
+    except ReservaTemporariaRepetidaError as e:
+        return jsonify({'message': str(e)}), 429
+    if reserva is None:
+        return jsonify({'message': 'Atendente inválido ou não disponível.'}), 404
+
+    if anterior:
+        invalidar_disponibilidade(anterior['id_atendente'], anterior['data_hora_inicio'], anterior['duracao_minutos'])
+    invalidar_disponibilidade(id_atendente, inicio, duracao_min)
+    expira_em_segundos = max(reserva.pop('expira_em_segundos'), 0)
+    return jsonify({
+        'reserva_temporaria': reserva,
+        'expira_em_segundos': expira_em_segundos,
+    }), 201
 
-                    slot_atual += duracao_intervalo
 
-        return jsonify({'horarios_disponiveis': horarios_disponiveis_final}), 200
+@atendentes_bp.route('/<int:id_atendente>/holds/<int:id_reserva>', methods=['DELETE'])
+@cliente_required
+def liberar_reserva_temporaria_api(id_atendente, id_reserva):
+    connection = get_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT data_hora_inicio, duracao_minutos FROM reserva_temporaria
+                WHERE id_reserva_temporaria = %s AND id_atendente = %s AND id_cliente = %s
+            """, (id_reserva, id_atendente, request.current_user['id_usuario']))
+            reserva = cursor.fetchone()
+            if not reserva:
+                return jsonify({'message': 'Reserva temporária não encontrada.'}), 404
+            # Liberar apaga a reserva: a espera de criar_reserva_temporaria vale só para reservas que venceram.
+            cursor.execute("DELETE FROM reserva_temporaria WHERE id_reserva_temporaria = %s", (id_reserva,))
+            connection.commit()
+        invalidar_disponibilidade(id_atendente, reserva['data_hora_inicio'], reserva['duracao_minutos'])
+        return jsonify({'message': 'Horário liberado.'}), 200
     finally:
         if connection: connection.close()
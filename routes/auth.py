@@ -1,6 +1,7 @@
 from flask import Blueprint, request, jsonify
 from utils.db import get_connection
-from utils.auth import hash_password, check_password, generate_token
+from utils.auth import hash_password, check_password, generate_token, password_needs_rehash, HashingBusyError, hashing_busy_response
+from utils.auth import issue_refresh_token, rotate_refresh_token, revoke_refresh_tokens, revoke_refresh_token_family, RefreshTokenError
 from utils.validators import validate_email, validate_senha, validate_user_data, validate_telefone_data, validate_endereco_data, validate_atendente_detalhes_data
 
 
@@ -143,6 +144,10 @@ def registrar_usuario():
                 'usuario': {'id_usuario': id_usuario_criado, 'tipo_usuario': data['tipo_usuario'], 'situacao': situacao_inicial}
             }), 201
 
+    except HashingBusyError as e:
+        if connection:
+            connection.rollback()
+        return hashing_busy_response(e)
     except Exception as e:
         print("ERRO NO CADASTRO:", str(e))
         print("Tipo do erro:", type(e))
@@ -179,6 +184,15 @@ def login():
         if not user or not check_password(senha_fornecida, user['senha']):
             return jsonify({'message': 'Email ou senha inválidos.'}), 401
 
+        if password_needs_rehash(user['senha']):
+            try:
+                with connection.cursor() as cursor:
+                    cursor.execute("UPDATE usuario SET senha = %s WHERE id_usuario = %s",
+                                   (hash_password(senha_fornecida), user['id_usuario']))
+                connection.commit()
+            except Exception as e:
+                print(f"Não foi possível atualizar o custo do hash da senha: {e}")
+
         if user['tipo_usuario'] != 'ADMIN':
             if user['situacao'] == 'PENDENTE_APROVACAO':
                 pass
@@ -188,10 +202,14 @@ def login():
                 return jsonify({'message': 'Sua conta está inativa. Entre em contato com o suporte.'}), 403
 
         token_gerado = generate_token(user['id_usuario'], user['tipo_usuario'])
+        with connection.cursor() as cursor:
+            refresh_token = issue_refresh_token(cursor, user['id_usuario'])
+        connection.commit()
 
         return jsonify({
             'message': 'Login bem-sucedido!',
             'token': token_gerado,
+            'refresh_token': refresh_token,
             'usuario': {
                 'id_usuario': user['id_usuario'],
                 'nome_completo': user['nome_completo'],
@@ -201,6 +219,8 @@ def login():
                 'situacao': user['situacao']
             }
         }), 200
+    except HashingBusyError as e:
+        return hashing_busy_response(e)
     except Exception as e:
         print(f"Erro no login: {e}")
         return jsonify({'message': 'Erro interno no servidor durante o login.'}), 500
@@ -208,6 +228,58 @@ def login():
         if connection:
             connection.close()
 
+@auth_bp.route('/refresh', methods=['POST'])
+def refresh():
+    data = request.json
+    if not data or not data.get('refresh_token'):
+        return jsonify({'message': 'Refresh token é obrigatório!'}), 400
+
+    connection = get_connection()
+    try:
+        connection.begin()
+        with connection.cursor() as cursor:
+            try:
+                user, novo_refresh_token = rotate_refresh_token(cursor, data['refresh_token'])
+            except RefreshTokenError as e:
+                # Commit para persistir uma eventual revogação da família.
+                connection.commit()
+                return jsonify({'message': str(e)}), e.status
+        connection.commit()
+
+        return jsonify({
+            'message': 'Token renovado.',
+            'token': generate_token(user['id_usuario'], user['tipo_usuario']),
+            'refresh_token': novo_refresh_token,
+            'usuario': user
+        }), 200
+    except Exception as e:
+        print(f"Erro ao renovar token: {e}")
+        if connection:
+            connection.rollback()
+        return jsonify({'message': 'Erro interno ao renovar o token.'}), 500
+    finally:
+        if connection:
+            connection.close()
+
+@auth_bp.route('/logout', methods=['POST'])
+def logout():
+    data = request.json or {}
+    if not data.get('refresh_token'):
+        return jsonify({'message': 'Logout realizado.'}), 200
+
+    connection = get_connection()
+    try:
+        with connection.cursor() as cursor:
+            revoke_refresh_token_family(cursor, data['refresh_token'])
+        connection.commit()
+        return jsonify({'message': 'Logout realizado.'}), 200
+    except Exception as e:
+        print(f"Erro no logout: {e}")
+        return jsonify({'message': 'Erro interno no logout.'}), 500
+    finally:
+        if connection:
+            connection.close()
+
 @auth_bp.route('/reset-password', methods=['POST'])
 def reset_password_request():
     data = request.json
@@ -396,10 +468,15 @@ def redefinir_senha():
             """, (hashed_pw, result['id_usuario']))
 
             cursor.execute("DELETE FROM codigos_recuperacao WHERE id_usuario = %s", (result['id_usuario'],))
+            revoke_refresh_tokens(cursor, user_id=result['id_usuario'])
 
             connection.commit()
             return jsonify({'message': 'Senha alterada com sucesso!'}), 200
 
+    except HashingBusyError as e:
+        if connection:
+            connection.rollback()
+        return hashing_busy_response(e)
     except Exception as e:
         print(f"Erro na redefinição de senha: {str(e)}")
         if connection:
@@ -57,6 +57,8 @@ document.addEventListener('DOMContentLoaded', function() {
     let dataSelecionadaNoCalendario = null;
     let horarioSelecionado = null;
     let calendarioDataAtual = new Date(); // Para navegação do calendário
+    let disponibilidadeDoPeriodo = {}; // { 'YYYY-MM-DD': ['HH:MM', ...] } do mês exibido
+    let reservaTemporaria = null; // horário segurado para o cliente enquanto preenche a solicitação
 
     // Tradutores (Reutilizar ou definir aqui se necessário)
     function traduzirArea(area) {
@@ -73,6 +75,37 @@ document.addEventListener('DOMContentLoaded', function() {
         return map[id] || id || 'Não informado';
     }
 
+    // Autocompletar da busca: sugestões do índice de atendentes enquanto o cliente digita.
+    const sugestoesDatalist = document.getElementById('sugestoes-atendentes');
+    let temporizadorSugestoes = null;
+
+    function carregarSugestoes() {
+        const texto = filtroBuscaNomeInput.value.trim();
+        if (texto.length < 2) {
+            sugestoesDatalist.innerHTML = '';
+            return;
+        }
+        fetch(`/api/atendentes/sugestoes?q=${encodeURIComponent(texto)}`)
+            .then(response => response.ok ? response.json() : { sugestoes: [] })
+            .then(data => {
+                sugestoesDatalist.innerHTML = '';
+                (data.sugestoes || []).forEach(sugestao => {
+                    const opcao = document.createElement('option');
+                    opcao.value = sugestao.nome;
+                    opcao.label = traduzirArea(sugestao.area_atuacao);
+                    sugestoesDatalist.appendChild(opcao);
+                });
+            })
+            .catch(error => console.warn('Erro ao buscar sugestões:', error));
+    }
+
+    if (sugestoesDatalist) {
+        filtroBuscaNomeInput.addEventListener('input', () => {
+            clearTimeout(temporizadorSugestoes);
+            temporizadorSugestoes = setTimeout(carregarSugestoes, 200);
+        });
+    }
+
     function carregarAtendentes() {
         try {
             listaAtendentesContainer.innerHTML = '<p class="loading-message">Buscando atendentes...</p>';
@@ -320,8 +353,52 @@ document.addEventListener('DOMContentLoaded', function() {
                     carregarHorariosDisponiveis();
                 });
             }
+            diaElement.dataset.date = `${ano}-${String(mes + 1).padStart(2, '0')}-${String(dia).padStart(2, '0')}`;
             calendarGrid.appendChild(diaElement);
         }
+
+        carregarDisponibilidadeDoMes(ano, mes);
+    }
+
+    function formatarDataISO(data) {
+        return `${data.getFullYear()}-${String(data.getMonth() + 1).padStart(2, '0')}-${String(data.getDate()).padStart(2, '0')}`;
+    }
+
+    // Busca os horários do mês inteiro em uma única requisição e marca os dias sem vagas.
+    function carregarDisponibilidadeDoMes(ano, mes) {
+        disponibilidadeDoPeriodo = {};
+        if (!window.atendenteSelecionadoParaAgendar) return;
+
+        const hoje = new Date();
+        hoje.setHours(0, 0, 0, 0);
+        const inicio = new Date(Math.max(new Date(ano, mes, 1).getTime(), hoje.getTime()));
+        const fim = new Date(ano, mes + 1, 0);
+        if (inicio > fim) return;
+
+        const atendente = window.atendenteSelecionadoParaAgendar;
+        const duracao = atendente.duracao_padrao_atendimento_min || 60;
+        fetch(`/api/atendentes/${atendente.id_usuario}/disponibilidade?inicio=${formatarDataISO(inicio)}&fim=${formatarDataISO(fim)}&duracao=${duracao}`)
+            .then(response => {
+                if (!response.ok) throw new Error(`Erro ${response.status} ao buscar disponibilidade do mês`);
+                return response.json();
+            })
+            .then(data => {
+                // Ignora a resposta se o usuário já trocou de mês ou de atendente.
+                if (atendente !== window.atendenteSelecionadoParaAgendar ||
+                    calendarioDataAtual.getMonth() !== mes || calendarioDataAtual.getFullYear() !== ano) return;
+
+                disponibilidadeDoPeriodo = data.dias || {};
+                Object.entries(disponibilidadeDoPeriodo).forEach(([dataDia, horarios]) => {
+                    const diaElement = calendarGrid.querySelector(`.calendar-day[data-date="${dataDia}"]`);
+                    if (diaElement) diaElement.classList.toggle('sem-horarios', horarios.length === 0);
+                });
+                if (dataSelecionadaNoCalendario && disponibilidadeDoPeriodo[dataSelecionadaNoCalendario]) {
+                    renderizarHorarios(disponibilidadeDoPeriodo[dataSelecionadaNoCalendario]);
+                }
+            })
+            .catch(error => {
+                console.warn('Disponibilidade do mês indisponível; os horários serão buscados por dia.', error.message);
+            });
     }
 
     prevMonthButton.addEventListener('click', () => {
@@ -342,6 +419,11 @@ document.addEventListener('DOMContentLoaded', function() {
             return;
         }
 
+        if (disponibilidadeDoPeriodo[dataSelecionadaNoCalendario]) {
+            renderizarHorarios(disponibilidadeDoPeriodo[dataSelecionadaNoCalendario]);
+            return;
+        }
+
         timeSlotsGrid.innerHTML = '<p class="loading-message">Verificando horários...</p>';
         const duracao = window.atendenteSelecionadoParaAgendar.duracao_padrao_atendimento_min || 60;
 
@@ -396,12 +478,58 @@ document.addEventListener('DOMContentLoaded', function() {
                 document.querySelectorAll('.time-slot.selected').forEach(s => s.classList.remove('selected'));
                 slot.classList.add('selected');
                 horarioSelecionado = horario;
-                confirmAgendamentoButton.disabled = false; // Habilita o botão de confirmar
+                segurarHorario(horario);
             });
             timeSlotsGrid.appendChild(slot);
         });
     }
 
+    // Segura o horário por alguns minutos; a reserva anterior do cliente é substituída no servidor.
+    function segurarHorario(horario) {
+        const atendente = window.atendenteSelecionadoParaAgendar;
+        confirmAgendamentoButton.disabled = true;
+        fetch(`/api/atendentes/${atendente.id_usuario}/holds`, {
+            method: 'POST',
+            headers: fetchConfig.headers,
+            body: JSON.stringify({
+                data_hora_inicio: `${dataSelecionadaNoCalendario}T${horario}:00`,
+                duracao_minutos: atendente.duracao_padrao_atendimento_min || 60
+            })
+        })
+        .then(response => response.json().then(data => ({ status: response.status, data })))
+        .then(({ status, data }) => {
+            if (horarioSelecionado !== horario) return; // o cliente já escolheu outro horário
+            if (status === 409) {
+                alert('Este horário acabou de ser reservado por outra pessoa. Escolha outro horário.');
+                horarioSelecionado = null;
+                delete disponibilidadeDoPeriodo[dataSelecionadaNoCalendario];
+                carregarHorariosDisponiveis();
+                return;
+            }
+            if (status !== 201) throw new Error(data.message || 'Falha ao segurar o horário');
+            reservaTemporaria = data.reserva_temporaria;
+            confirmAgendamentoButton.disabled = false;
+        })
+        .catch(error => {
+            // Sem a reserva temporária a solicitação ainda pode ser enviada; o servidor confere o conflito.
+            console.warn('Não foi possível segurar o horário:', error.message);
+            if (horarioSelecionado === horario) confirmAgendamentoButton.disabled = false;
+        });
+    }
+
+    function liberarReservaTemporaria() {
+        if (!reservaTemporaria) return;
+        const { id_atendente, id_reserva_temporaria } = reservaTemporaria;
+        reservaTemporaria = null;
+        fetch(`/api/atendentes/${id_atendente}/holds/${id_reserva_temporaria}`, { method: 'DELETE', headers: fetchConfig.headers })
+            .catch(error => console.warn('Não foi possível liberar o horário:', error.message));
+    }
+
+    function fecharModalAgendamento() {
+        agendamentoModal.style.display = 'none';
+        liberarReservaTemporaria();
+    }
+
     confirmAgendamentoButton.addEventListener('click', function() {
         if (!clienteId || !window.atendenteSelecionadoParaAgendar || !dataSelecionadaNoCalendario || !horarioSelecionado) {
             const errorMsg = 'Por favor, complete todos os passos para o agendamento';
@@ -457,6 +585,7 @@ document.addEventListener('DOMContentLoaded', function() {
             });
             const successMsg = 'Solicitação de agendamento enviada com sucesso!';
             alert(successMsg);
+            reservaTemporaria = null; // convertida em agendamento pelo servidor
             agendamentoModal.style.display = 'none';
             mostrarConfirmacaoSolicitacao(data.agendamento_criado);
         })
@@ -501,10 +630,10 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 
     // Event Listeners para fechar modais
-    agendamentoModalClose.addEventListener('click', () => agendamentoModal.style.display = 'none');
+    agendamentoModalClose.addEventListener('click', fecharModalAgendamento);
     confirmacaoSolicitacaoModalClose.addEventListener('click', () => confirmacaoSolicitacaoModal.style.display = 'none');
     window.addEventListener('click', (event) => {
-        if (event.target === agendamentoModal) agendamentoModal.style.display = 'none';
+        if (event.target === agendamentoModal) fecharModalAgendamento();
         if (event.target === confirmacaoSolicitacaoModal) confirmacaoSolicitacaoModal.style.display = 'none';
     });
     
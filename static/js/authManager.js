@@ -1,3 +1,62 @@
+// Renovação silenciosa do token: quando uma requisição autenticada volta 401,
+// troca o refresh token por um novo access token e repete a requisição uma vez.
+(function () {
+    const fetchOriginal = window.fetch.bind(window);
+    let renovacaoEmAndamento = null;
+
+    function renovarToken() {
+        const refreshToken = localStorage.getItem('amadoRefreshToken');
+        if (!refreshToken) {
+            return Promise.resolve(null);
+        }
+        // Várias requisições com 401 ao mesmo tempo compartilham a mesma renovação.
+        if (!renovacaoEmAndamento) {
+            renovacaoEmAndamento = fetchOriginal('/api/auth/refresh', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ refresh_token: refreshToken })
+            })
+                .then(response => response.ok ? response.json() : null)
+                .then(data => {
+                    if (!data || !data.token) {
+                        console.warn('Não foi possível renovar a sessão');
+                        localStorage.removeItem('amadoRefreshToken');
+                        return null;
+                    }
+                    localStorage.setItem('amadoAuthToken', data.token);
+                    localStorage.setItem('amadoRefreshToken', data.refresh_token);
+                    console.log('Token de acesso renovado');
+                    return data.token;
+                })
+                .catch(error => {
+                    console.error('Erro ao renovar token:', error);
+                    return null;
+                })
+                .finally(() => {
+                    renovacaoEmAndamento = null;
+                });
+        }
+        return renovacaoEmAndamento;
+    }
+
+    window.fetch = function (input, init = {}) {
+        return fetchOriginal(input, init).then(response => {
+            const headers = new Headers(init.headers || {});
+            const authorization = headers.get('Authorization');
+            if (response.status !== 401 || !authorization || !authorization.startsWith('Bearer ')) {
+                return response;
+            }
+            return renovarToken().then(novoToken => {
+                if (!novoToken) {
+                    return response;
+                }
+                headers.set('Authorization', `Bearer ${novoToken}`);
+                return fetchOriginal(input, { ...init, headers });
+            });
+        });
+    };
+})();
+
 document.addEventListener('DOMContentLoaded', () => {
     console.log('Iniciando AuthManager');
     
@@ -189,13 +248,22 @@ document.addEventListener('DOMContentLoaded', () => {
             console.log('Iniciando processo de logout');
             
             try {
+                const refreshToken = localStorage.getItem('amadoRefreshToken');
+                if (refreshToken) {
+                    fetch('/api/auth/logout', {
+                        method: 'POST',
+                        headers: { 'Content-Type': 'application/json' },
+                        body: JSON.stringify({ refresh_token: refreshToken }),
+                        keepalive: true
+                    }).catch(error => console.warn('Erro ao revogar sessão no servidor:', error));
+                }
                 localStorage.removeItem('amadoAuthToken');
+                localStorage.removeItem('amadoRefreshToken');
                 localStorage.removeItem('amadoUserType');
                 localStorage.removeItem('amadoUserId');
                 localStorage.removeItem('amadoUserName');
                 localStorage.removeItem('amadoUserEmail');
                 localStorage.removeItem('amadoUserStatus');
-                // Idealmente, chamar um endpoint /api/auth/logout no backend também
                 console.log('Dados de autenticação removidos com sucesso');
                 alert('Logout realizado com sucesso!');
                 
@@ -76,6 +76,7 @@ document.addEventListener('DOMContentLoaded', function() {
                 
                 // Armazenar o token e informações do usuário no localStorage
                 localStorage.setItem('amadoAuthToken', data.token);
+                localStorage.setItem('amadoRefreshToken', data.refresh_token);
                 localStorage.setItem('amadoUserId', data.usuario.id_usuario);
                 localStorage.setItem('amadoUserType', data.usuario.tipo_usuario);
                 localStorage.setItem('amadoUserName', data.usuario.nome_completo);
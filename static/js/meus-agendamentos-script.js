@@ -85,6 +85,9 @@ document.addEventListener('DOMContentLoaded', function() {
     }
 
 
+    // Cursor da próxima página de cada lista (null quando não há mais agendamentos).
+    const proximosCursores = { futuros: null, passados: null };
+
     async function carregarAgendamentos() {
         console.log('Iniciando carregamento de agendamentos...');
         listaFuturosUl.innerHTML = '<p class="loading-message">Carregando...</p>';
@@ -102,6 +105,8 @@ document.addEventListener('DOMContentLoaded', function() {
             
             renderAgendamentos(data.agendamentos_futuros || [], listaFuturosUl, true);
             renderAgendamentos(data.agendamentos_passados || [], listaPassadosUl, false);
+            atualizarBotaoVerMais('futuros', listaFuturosUl, data.proximo_cursor_futuros);
+            atualizarBotaoVerMais('passados', listaPassadosUl, data.proximo_cursor_passados);
             showAlert('Agendamentos atualizados com sucesso', 'success');
 
         } catch (error) {
@@ -112,11 +117,41 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
-    function renderAgendamentos(agendamentos, ulElement, isFuturo) {
+    function atualizarBotaoVerMais(secao, ulElement, cursor) {
+        proximosCursores[secao] = cursor || null;
+        let botao = document.getElementById(`ver-mais-${secao}`);
+        if (!botao) {
+            botao = document.createElement('button');
+            botao.id = `ver-mais-${secao}`;
+            botao.className = 'action-button ver-mais-button';
+            botao.textContent = 'Ver mais';
+            botao.addEventListener('click', () => carregarMaisAgendamentos(secao, ulElement));
+            ulElement.insertAdjacentElement('afterend', botao);
+        }
+        botao.style.display = proximosCursores[secao] ? '' : 'none';
+    }
+
+    async function carregarMaisAgendamentos(secao, ulElement) {
+        const cursor = proximosCursores[secao];
+        if (!cursor) return;
+        console.log(`Carregando mais agendamentos ${secao}...`);
+        try {
+            const response = await fetch(`/api/agendamentos?secao=${secao}&cursor_${secao}=${encodeURIComponent(cursor)}`, fetchConfig);
+            if (!response.ok) throw new Error('Falha ao carregar agendamentos.');
+            const data = await response.json();
+            renderAgendamentos(data[`agendamentos_${secao}`] || [], ulElement, secao === 'futuros', true);
+            atualizarBotaoVerMais(secao, ulElement, data[`proximo_cursor_${secao}`]);
+        } catch (error) {
+            console.error('Erro ao carregar mais agendamentos:', error);
+            showAlert('Erro ao carregar mais agendamentos', 'error');
+        }
+    }
+
+    function renderAgendamentos(agendamentos, ulElement, isFuturo, acrescentar = false) {
         console.log(`Renderizando ${agendamentos.length} agendamentos ${isFuturo ? 'futuros' : 'passados'}`);
-        ulElement.innerHTML = '';
+        if (!acrescentar) ulElement.innerHTML = '';
         
-        if (agendamentos.length === 0) {
+        if (agendamentos.length === 0 && !acrescentar) {
             console.log(`Nenhum agendamento ${isFuturo ? 'futuro' : 'passado'} encontrado`);
             ulElement.innerHTML = `<p class="no-items-message">Nenhum agendamento ${isFuturo ? 'futuro' : 'passado'} encontrado.</p>`;
             return;
@@ -147,13 +182,14 @@ document.addEventListener('DOMContentLoaded', function() {
                 </div>
             `;
             ulElement.appendChild(li);
-        });
 
-        ulElement.querySelectorAll('.cancelar-button').forEach(btn => {
-            btn.addEventListener('click', () => handleCancelarAgendamento(btn.dataset.id));
-        });
-        ulElement.querySelectorAll('.avaliar-button').forEach(btn => {
-            btn.addEventListener('click', () => abrirModalAvaliacao(btn.dataset));
+            // Liga os botões só deste item: com "Ver mais" a lista recebe itens novos sem ser recriada.
+            li.querySelectorAll('.cancelar-button').forEach(btn => {
+                btn.addEventListener('click', () => handleCancelarAgendamento(btn.dataset.id));
+            });
+            li.querySelectorAll('.avaliar-button').forEach(btn => {
+                btn.addEventListener('click', () => abrirModalAvaliacao(btn.dataset));
+            });
         });
     }
 
@@ -0,0 +1,519 @@
+import heapq
+import itertools
+import time as _time
+from bisect import bisect_right
+from datetime import datetime, time, timedelta
+
+from pymysql.err import IntegrityError
+
+from config import Config
+from utils.cache import TTLCache
+
+
+def parse_turnos(texto):
+    """Converte '08:00-12:00,14:00-18:00' em ((time(8), time(12)), (time(14), time(18)))."""
+    turnos = []
+    for faixa in texto.split(','):
+        inicio, fim = (time.fromisoformat(parte.strip()) for parte in faixa.split('-'))
+        if fim <= inicio:
+            raise ValueError(f'Turno inválido: {faixa}')
+        turnos.append((inicio, fim))
+    return tuple(sorted(turnos))
+
+
+TURNOS_PADRAO = parse_turnos(Config.AGENDA_TURNOS)
+INTERVALO_PADRAO = timedelta(minutes=Config.AGENDA_INTERVALO_MIN)
+# Limite validado em validate_agendamento_data; as buscas por sobreposição contam com ele.
+DURACAO_MAXIMA_AGENDAMENTO = timedelta(days=1)
+BLOCOS_ATIVOS = Config.AGENDA_BLOCOS_ENABLED
+TAMANHO_BLOCO = timedelta(minutes=Config.AGENDA_BLOCO_MIN)
+RESERVA_TEMPORARIA_TTL = Config.AGENDA_RESERVA_TEMPORARIA_TTL
+RESERVA_TEMPORARIA_MAX_MIN = Config.AGENDA_RESERVA_TEMPORARIA_MAX_MIN
+
+
+def dentro_de_turno(inicio, fim, turnos=TURNOS_PADRAO):
+    """Indica se [inicio, fim) cabe inteiro em um dos turnos de atendimento do dia."""
+    return any(
+        datetime.combine(inicio.date(), inicio_turno) <= inicio and fim <= datetime.combine(inicio.date(), fim_turno)
+        for inicio_turno, fim_turno in turnos
+    )
+
+
+def merge_intervals(intervalos, intervalo_entre=timedelta(0)):
+    """
+    Ordena e funde intervalos ocupados [(inicio, fim), ...]. Cada intervalo é
+    ampliado por `intervalo_entre` dos dois lados, de modo que um horário livre
+    sempre guarda essa folga em relação às sessões vizinhas.
+    """
+    fundidos = []
+    for inicio, fim in sorted(intervalos):
+        inicio, fim = inicio - intervalo_entre, fim + intervalo_entre
+        if fundidos and inicio <= fundidos[-1][1]:
+            if fim > fundidos[-1][1]:
+                fundidos[-1][1] = fim
+        else:
+            fundidos.append([inicio, fim])
+    return [(inicio, fim) for inicio, fim in fundidos]
+
+
+class BusyIntervals:
+    """
+    Intervalos ocupados já ordenados e fundidos, com consulta de conflito por bisect.
+    `validade` é em quantos segundos a primeira reserva temporária carregada
+    expira (None se não há nenhuma): até lá o resultado pode ser guardado em cache.
+    """
+
+    def __init__(self, intervalos, intervalo_entre=timedelta(0), validade=None):
+        self.intervalos = merge_intervals(intervalos, intervalo_entre)
+        self.validade = validade
+        self._inicios = [inicio for inicio, _ in self.intervalos]
+        self._fins = [fim for _, fim in self.intervalos]
+
+    def __len__(self):
+        return len(self.intervalos)
+
+    def conflita(self, inicio, fim):
+        """Indica se [inicio, fim) se sobrepõe a algum intervalo ocupado. O(log n)."""
+        # Primeiro intervalo que termina depois de `inicio`; os anteriores não podem sobrepor.
+        idx = bisect_right(self._fins, inicio)
+        return idx < len(self._inicios) and self._inicios[idx] < fim
+
+
+def carregar_ocupados(cursor, id_atendente, inicio, fim, status=('SOLICITADO', 'CONFIRMADO'),
+                      ignorar_agendamento=None, ignorar_cliente=None):
+    """
+    Carrega o que ocupa a agenda do atendente em [inicio, fim) e devolve um
+    BusyIntervals já com a folga AGENDA_INTERVALO_MIN aplicada: os agendamentos
+    (consulta por faixa no índice idx_agendamento_atendente_periodo ou, com
+    AGENDA_BLOCOS_ENABLED, os blocos de agendamento_bloco) e as reservas
+    temporárias ainda válidas, exceto as de `ignorar_cliente`.
+    """
+    return carregar_ocupados_por_atendente(
+        cursor, [id_atendente], inicio, fim, status, ignorar_agendamento, ignorar_cliente
+    )[id_atendente]
+
+
+# Sobreposição semiaberta com [inicio, fim) (folga incluída). O limite inferior em
+# data_hora_inicio só existe para a busca ser uma faixa do índice: nenhum
+# agendamento dura mais que DURACAO_MAXIMA_AGENDAMENTO.
+_SOBREPOSICAO_SQL = "AND data_hora_inicio >= %s AND data_hora_inicio < %s AND data_hora_fim > %s"
+
+
+def _parametros_sobreposicao(inicio, fim):
+    return (inicio - INTERVALO_PADRAO - DURACAO_MAXIMA_AGENDAMENTO, fim + INTERVALO_PADRAO, inicio - INTERVALO_PADRAO)
+
+
+def free_slots(dia, duracao, ocupados, granularidade=None, turnos=TURNOS_PADRAO, nao_antes_de=None):
+    """
+    Horários de início livres em `dia` para sessões de `duracao`.
+
+    `ocupados` é um BusyIntervals (a folga entre sessões já vem aplicada nele).
+    Os candidatos seguem uma grade de `granularidade` (padrão: a própria
+    duração) a partir do início de cada turno. Varre candidatos e intervalos
+    ocupados com dois ponteiros: O(horários + agendamentos).
+    """
+    return list(iter_free_slots(dia, duracao, ocupados, granularidade, turnos, nao_antes_de))
+
+
+def iter_free_slots(dia, duracao, ocupados, granularidade=None, turnos=TURNOS_PADRAO, nao_antes_de=None):
+    """Mesma varredura de free_slots, mas gera os horários em ordem e sob demanda."""
+    passo = granularidade or duracao
+    if BLOCOS_ATIVOS:
+        # Com blocos só se reserva início na grade de AGENDA_BLOCO_MIN (ver inicio_fora_da_grade).
+        passo = -(-passo // TAMANHO_BLOCO) * TAMANHO_BLOCO
+    intervalos = ocupados.intervalos
+    i = bisect_right(ocupados._fins, datetime.combine(dia, turnos[0][0])) if turnos else 0
+    for inicio_turno, fim_turno in turnos:
+        inicio_turno_dt = datetime.combine(dia, inicio_turno)
+        if BLOCOS_ATIVOS:
+            inicio_turno_dt = _teto_do_bloco(inicio_turno_dt)
+        fim_turno_dt = datetime.combine(dia, fim_turno)
+        candidato = inicio_turno_dt
+        if nao_antes_de is not None and candidato < nao_antes_de:
+            candidato = _proximo_na_grade(inicio_turno_dt, passo, nao_antes_de)
+
+        while candidato + duracao <= fim_turno_dt:
+            fim_candidato = candidato + duracao
+            while i < len(intervalos) and intervalos[i][1] <= candidato:
+                i += 1
+            if i < len(intervalos) and intervalos[i][0] < fim_candidato:
+                # Pula direto para o primeiro ponto da grade depois do intervalo ocupado.
+                candidato = _proximo_na_grade(inicio_turno_dt, passo, intervalos[i][1])
+                continue
+            yield candidato
+            candidato += passo
+
+
+def carregar_ocupados_por_atendente(cursor, ids_atendentes, inicio, fim, status=('SOLICITADO', 'CONFIRMADO'),
+                                    ignorar_agendamento=None, ignorar_cliente=None):
+    """
+    Como carregar_ocupados, mas para vários atendentes com uma consulta por fonte.
+    Retorna {id_atendente: BusyIntervals}.
+    """
+    intervalos = {id_atendente: [] for id_atendente in ids_atendentes}
+    if not intervalos:
+        return {}
+    if BLOCOS_ATIVOS:
+        _carregar_blocos(cursor, intervalos, inicio, fim, ignorar_agendamento)
+    else:
+        _carregar_agendamentos(cursor, intervalos, inicio, fim, status, ignorar_agendamento)
+    validades = _carregar_reservas_temporarias(cursor, intervalos, inicio, fim, ignorar_cliente)
+    # Os intervalos já chegam com a folga aplicada.
+    return {
+        id_atendente: BusyIntervals(lista, validade=validades.get(id_atendente))
+        for id_atendente, lista in intervalos.items()
+    }
+
+
+def _carregar_agendamentos(cursor, intervalos, inicio, fim, status, ignorar_agendamento=None):
+    query = f"""
+        SELECT id_atendente, data_hora_inicio, data_hora_fim
+        FROM agendamento
+        WHERE id_atendente IN ({', '.join(['%s'] * len(intervalos))})
+              AND status_agendamento IN ({', '.join(['%s'] * len(status))})
+              {_SOBREPOSICAO_SQL}
+    """
+    params = [*intervalos, *status, *_parametros_sobreposicao(inicio, fim)]
+    if ignorar_agendamento is not None:
+        query += " AND id_agendamento <> %s"
+        params.append(ignorar_agendamento)
+    cursor.execute(query, params)
+    for ag in cursor.fetchall():
+        intervalos[ag['id_atendente']].append(
+            (ag['data_hora_inicio'] - INTERVALO_PADRAO, ag['data_hora_fim'] + INTERVALO_PADRAO)
+        )
+
+
+def _carregar_reservas_temporarias(cursor, intervalos, inicio, fim, ignorar_cliente=None):
+    # Retorna {id_atendente: segundos até a primeira reserva expirar}; a conta usa o relógio do banco.
+    query = f"""
+        SELECT id_atendente, data_hora_inicio, data_hora_fim,
+               TIMESTAMPDIFF(SECOND, NOW(), data_expiracao) AS segundos_restantes
+        FROM reserva_temporaria
+        WHERE id_atendente IN ({', '.join(['%s'] * len(intervalos))})
+              {_SOBREPOSICAO_SQL}
+              AND data_expiracao > NOW()
+    """
+    params = [*intervalos, *_parametros_sobreposicao(inicio, fim)]
+    if ignorar_cliente is not None:
+        query += " AND id_cliente <> %s"
+        params.append(ignorar_cliente)
+    cursor.execute(query, params)
+    validades = {}
+    for reserva in cursor.fetchall():
+        intervalos[reserva['id_atendente']].append(
+            (reserva['data_hora_inicio'] - INTERVALO_PADRAO, reserva['data_hora_fim'] + INTERVALO_PADRAO)
+        )
+        restantes = max(reserva['segundos_restantes'], 0)
+        validades[reserva['id_atendente']] = min(validades.get(reserva['id_atendente'], restantes), restantes)
+    return validades
+
+
+class HorarioIndisponivelError(Exception):
+    """O agendamento ocuparia um bloco que já pertence a outro agendamento do atendente."""
+
+
+class ReservaTemporariaRepetidaError(Exception):
+    """O cliente tentou segurar um horário logo depois que o prazo da sua reserva temporária acabou."""
+
+
+def _inicio_do_bloco(instante):
+    meia_noite = datetime.combine(instante.date(), time())
+    return meia_noite + (instante - meia_noite) // TAMANHO_BLOCO * TAMANHO_BLOCO
+
+
+def _teto_do_bloco(instante):
+    inicio = _inicio_do_bloco(instante)
+    return inicio if inicio == instante else inicio + TAMANHO_BLOCO
+
+
+def inicio_fora_da_grade(inicio):
+    """
+    Com AGENDA_BLOCOS_ENABLED, retorna a mensagem de erro se `inicio` não cai
+    na grade de AGENDA_BLOCO_MIN; senão None.
+
+    Os blocos só equivalem à checagem por intervalos com inícios na grade: o
+    último bloco de um agendamento pode ser parcial (duração qualquer), mas o
+    próximo agendamento começa no bloco seguinte. Com um início fora da grade,
+    duas sessões encostadas (ex.: 08:00 e 08:50, de 50 min) disputariam o bloco
+    das 08:45 e a segunda seria recusada sem haver sobreposição.
+    """
+    if BLOCOS_ATIVOS and _inicio_do_bloco(inicio) != inicio:
+        return f'O horário de início deve estar na grade de {Config.AGENDA_BLOCO_MIN} em {Config.AGENDA_BLOCO_MIN} minutos da agenda.'
+    return None
+
+
+def blocos_do_agendamento(inicio, duracao_minutos):
+    """
+    Inícios dos blocos da grade cobertos por [inicio, fim + folga). Com a folga
+    só no fim de cada agendamento, dois agendamentos a menos de
+    AGENDA_INTERVALO_MIN um do outro sempre disputam algum bloco. O último
+    bloco pode ser parcial; o início deve estar na grade (inicio_fora_da_grade).
+    """
+    fim = inicio + timedelta(minutes=duracao_minutos) + INTERVALO_PADRAO
+    bloco = _inicio_do_bloco(inicio)
+    blocos = []
+    while bloco < fim:
+        blocos.append(bloco)
+        bloco += TAMANHO_BLOCO
+    return blocos
+
+
+def ocupar_blocos(cursor, id_atendente, id_agendamento, inicio, duracao_minutos):
+    """
+    Grava os blocos do agendamento na mesma transação do INSERT em agendamento.
+    A chave primária (id_atendente, inicio_bloco) recusa sobreposições: nesse
+    caso levanta HorarioIndisponivelError e a transação deve ser desfeita.
+    Sem AGENDA_BLOCOS_ENABLED não faz nada.
+    """
+    ocupar_blocos_de_varios(cursor, id_atendente, [(id_agendamento, inicio, duracao_minutos)])
+
+
+def ocupar_blocos_de_varios(cursor, id_atendente, agendamentos):
+    """Como ocupar_blocos, para uma lista de (id_agendamento, inicio, duracao_minutos) em um único INSERT."""
+    if not BLOCOS_ATIVOS:
+        return
+    for _, inicio, _ in agendamentos:
+        erro = inicio_fora_da_grade(inicio)
+        if erro:
+            raise ValueError(erro)
+    try:
+        # Só com %s no VALUES o PyMySQL junta o executemany em um INSERT de várias linhas.
+        cursor.executemany(
+            "INSERT INTO agendamento_bloco (id_atendente, inicio_bloco, id_agendamento) VALUES (%s, %s, %s)",
+            [
+                (id_atendente, bloco, id_agendamento)
+                for id_agendamento, inicio, duracao_minutos in agendamentos
+                for bloco in blocos_do_agendamento(inicio, duracao_minutos)
+            ]
+        )
+    except IntegrityError as e:
+        if e.args[0] == 1062:  # ER_DUP_ENTRY
+            raise HorarioIndisponivelError('Horário indisponível para o atendente.') from e
+        raise
+
+
+def liberar_blocos(cursor, id_agendamento):
+    """Libera os blocos de um agendamento que deixou de ocupar a agenda (cancelado/recusado)."""
+    if BLOCOS_ATIVOS:
+        cursor.execute("DELETE FROM agendamento_bloco WHERE id_agendamento = %s", (id_agendamento,))
+
+
+def _carregar_blocos(cursor, intervalos, inicio, fim, ignorar_agendamento=None):
+    # Faixa da chave primária de agendamento_bloco. Cada bloco já inclui a folga
+    # depois do agendamento; a folga antes dele entra no intervalo.
+    query = f"""
+        SELECT id_atendente, inicio_bloco
+        FROM agendamento_bloco
+        WHERE id_atendente IN ({', '.join(['%s'] * len(intervalos))})
+              AND inicio_bloco > %s AND inicio_bloco < %s
+    """
+    params = [*intervalos, inicio - TAMANHO_BLOCO, fim + INTERVALO_PADRAO]
+    if ignorar_agendamento is not None:
+        query += " AND id_agendamento <> %s"
+        params.append(ignorar_agendamento)
+    cursor.execute(query, params)
+    for linha in cursor.fetchall():
+        intervalos[linha['id_atendente']].append(
+            (linha['inicio_bloco'] - INTERVALO_PADRAO, linha['inicio_bloco'] + TAMANHO_BLOCO)
+        )
+
+
+def reconstruir_blocos(cursor):
+    """
+    Recria agendamento_bloco a partir dos agendamentos que ocupam a agenda.
+    Blocos disputados por agendamentos já sobrepostos no histórico ficam com o
+    mais antigo. Retorna (agendamentos, blocos gravados, blocos em conflito).
+    """
+    cursor.execute("DELETE FROM agendamento_bloco")
+    cursor.execute("""
+        SELECT id_agendamento, id_atendente, data_hora_inicio, duracao_minutos
+        FROM agendamento
+        WHERE status_agendamento IN ('SOLICITADO', 'CONFIRMADO', 'REALIZADO')
+        ORDER BY id_agendamento
+    """)
+    agendamentos = cursor.fetchall()
+    linhas = [
+        (ag['id_atendente'], bloco, ag['id_agendamento'])
+        for ag in agendamentos
+        for bloco in blocos_do_agendamento(ag['data_hora_inicio'], ag['duracao_minutos'])
+    ]
+    gravados = 0
+    for n in range(0, len(linhas), 1000):
+        gravados += cursor.executemany(
+            "INSERT IGNORE INTO agendamento_bloco (id_atendente, inicio_bloco, id_agendamento) VALUES (%s, %s, %s)",
+            linhas[n:n + 1000]
+        )
+    return len(agendamentos), gravados, len(linhas) - gravados
+
+
+def criar_reserva_temporaria(cursor, id_atendente, id_cliente, inicio, duracao_minutos):
+    """
+    Segura [inicio, inicio + duracao) para o cliente. Cada cliente tem no
+    máximo uma reserva: a nova substitui a anterior. Deve rodar em transação
+    com a linha do atendente travada (como a reserva definitiva). Levanta
+    HorarioIndisponivelError se o horário já estiver ocupado. Retorna a linha
+    gravada, com os segundos que ainda faltam (expira_em_segundos).
+
+    O prazo é do cliente, não do horário: a primeira reserva vale por
+    RESERVA_TEMPORARIA_TTL segundos e as trocas de horário (ou o mesmo pedido
+    repetido) mantêm esse prazo. Se ela vence sem virar agendamento, o cliente
+    só segura outro horário passado mais um TTL (ReservaTemporariaRepetidaError).
+    Assim ninguém mantém a agenda de um atendente presa renovando a reserva.
+    A reserva liberada pelo cliente (fechar a tela) é apagada e não conta.
+    """
+    cursor.execute("""
+        SELECT id_atendente, data_hora_inicio, duracao_minutos, data_expiracao > NOW() AS valida
+        FROM reserva_temporaria
+        WHERE id_cliente = %s AND data_expiracao > DATE_SUB(NOW(), INTERVAL %s SECOND)
+        FOR UPDATE
+    """, (id_cliente, RESERVA_TEMPORARIA_TTL))
+    atual = cursor.fetchone()
+    if atual and not atual['valida']:
+        raise ReservaTemporariaRepetidaError('O prazo para segurar horários acabou. Envie a solicitação ou tente de novo em alguns minutos.')
+    mesmo_horario = atual and (atual['id_atendente'], atual['data_hora_inicio'], atual['duracao_minutos']) == (id_atendente, inicio, duracao_minutos)
+
+    if not mesmo_horario:
+        fim = inicio + timedelta(minutes=duracao_minutos)
+        ocupados = carregar_ocupados(cursor, id_atendente, inicio, fim,
+                                     status=('SOLICITADO', 'CONFIRMADO', 'REALIZADO'), ignorar_cliente=id_cliente)
+        if ocupados.conflita(inicio, fim):
+            raise HorarioIndisponivelError('Horário indisponível para o atendente.')
+
+        # As vencidas ficam um TTL a mais na tabela: é o intervalo em que o cliente não segura outro horário.
+        cursor.execute("DELETE FROM reserva_temporaria WHERE id_atendente = %s AND data_expiracao <= DATE_SUB(NOW(), INTERVAL %s SECOND)",
+                       (id_atendente, RESERVA_TEMPORARIA_TTL))
+        # Com uma reserva válida, a troca de horário herda o prazo dela.
+        cursor.execute("""
+            INSERT INTO reserva_temporaria (id_cliente, id_atendente, data_hora_inicio, duracao_minutos, data_expiracao)
+            VALUES (%s, %s, %s, %s, DATE_ADD(NOW(), INTERVAL %s SECOND))
+            ON DUPLICATE KEY UPDATE id_atendente = VALUES(id_atendente), data_hora_inicio = VALUES(data_hora_inicio),
+                                    duracao_minutos = VALUES(duracao_minutos),
+                                    data_expiracao = IF(data_expiracao > NOW(), data_expiracao, VALUES(data_expiracao))
+        """, (id_cliente, id_atendente, inicio, duracao_minutos, RESERVA_TEMPORARIA_TTL))
+    cursor.execute("""
+        SELECT id_reserva_temporaria, id_atendente, data_hora_inicio, duracao_minutos, data_expiracao,
+               TIMESTAMPDIFF(SECOND, NOW(), data_expiracao) AS expira_em_segundos
+        FROM reserva_temporaria WHERE id_cliente = %s
+    """, (id_cliente,))
+    return cursor.fetchone()
+
+
+def consumir_reserva_temporaria(cursor, id_atendente, id_cliente, inicio, duracao_minutos):
+    """
+    Apaga a reserva temporária válida do cliente para exatamente esse horário.
+    Retorna True se havia uma: o horário já foi conferido quando ela foi criada
+    e, desde então, nenhuma outra reserva pôde ocupá-lo.
+    """
+    cursor.execute("""
+        DELETE FROM reserva_temporaria
+        WHERE id_cliente = %s AND id_atendente = %s AND data_hora_inicio = %s
+              AND duracao_minutos = %s AND data_expiracao > NOW()
+    """, (id_cliente, id_atendente, inicio, duracao_minutos))
+    return cursor.rowcount == 1
+
+
+def primeiros_horarios(fontes, quantidade):
+    """
+    Junta (k-way merge com heap) geradores de horários já ordenados e para nos
+    `quantidade` primeiros. `fontes` é uma lista de (rotulo, gerador); empates
+    no mesmo horário ficam na ordem das fontes. Só avança cada gerador o
+    necessário, então o custo é O((quantidade + k) log k) e não o das agendas inteiras.
+    """
+    rotulados = [_rotular(indice, horarios) for indice, (_, horarios) in enumerate(fontes)]
+    # A tupla (horario, indice) desempata pela ordem das fontes sem comparar os rótulos.
+    primeiros = itertools.islice(heapq.merge(*rotulados), max(quantidade, 0))
+    return [(horario, fontes[indice][0]) for horario, indice in primeiros]
+
+
+def _rotular(indice, horarios):
+    for horario in horarios:
+        yield horario, indice
+
+
+def _proximo_na_grade(origem, passo, minimo):
+    passos = -((origem - minimo) // passo)  # teto de (minimo - origem) / passo
+    return origem + passos * passo
+
+
+class DisponibilidadeCache(TTLCache):
+    """
+    Cache dos horários livres por (id_atendente, dia), com uma lista por duração.
+
+    Guarda os horários sem o filtro de "agora", então vale para o dia inteiro.
+    Uma entrada calculada com reservas temporárias vence junto com a primeira
+    delas (`validade` de set_slots), para o horário não seguir ocupado no cache.
+    Para não gravar um resultado calculado antes de uma escrita concorrente,
+    quem calcula pega um token com `token()` antes de ler o banco e `set_slots`
+    descarta o valor se o dia foi invalidado depois desse token.
+    """
+
+    def __init__(self, maxsize=5000, ttl=300):
+        super().__init__(maxsize, ttl, name='disponibilidade')
+        self._contador = itertools.count(1)
+        self._ultimo_token = 0
+        # Maior marca de invalidação já descartada do LRU; tokens anteriores a ela não gravam.
+        self._marca_descartada = 0
+
+    def token(self):
+        with self._lock:
+            return self._ultimo_token
+
+    def get_slots(self, id_atendente, dia, chave_duracao):
+        agora = _time.monotonic()
+        with self._lock:
+            entrada = self._dados.get((id_atendente, dia))
+            if entrada is not None and entrada[1] > agora and chave_duracao in entrada[0]:
+                self._dados.move_to_end((id_atendente, dia))
+                self.hits += 1
+                return entrada[0][chave_duracao]
+            self.misses += 1
+            return None
+
+    def set_slots(self, id_atendente, dia, chave_duracao, slots, token, validade=None):
+        agora = _time.monotonic()
+        chave = (id_atendente, dia)
+        expira_em = agora + (self.ttl if validade is None else min(self.ttl, validade))
+        with self._lock:
+            if token < self._marca_descartada:
+                return
+            entrada = self._dados.get(chave)
+            if entrada is not None and entrada[2] > token:
+                return
+            if entrada is None or entrada[1] <= agora:
+                entrada = ({}, expira_em, 0)
+                self._dados[chave] = entrada
+            elif expira_em < entrada[1]:
+                entrada = (entrada[0], expira_em, entrada[2])
+                self._dados[chave] = entrada
+            entrada[0][chave_duracao] = slots
+            self._dados.move_to_end(chave)
+            self._descartar_excedentes()
+
+    def invalidate_dia(self, id_atendente, dia):
+        with self._lock:
+            self._ultimo_token = next(self._contador)
+            # Fica um marcador vazio com a marca da invalidação para barrar gravações atrasadas.
+            self._dados[(id_atendente, dia)] = ({}, _time.monotonic() + self.ttl, self._ultimo_token)
+            self._dados.move_to_end((id_atendente, dia))
+            self._descartar_excedentes()
+
+    def _descartar_excedentes(self):
+        while len(self._dados) > self.maxsize:
+            _, (_, _, marca) = self._dados.popitem(last=False)
+            self._marca_descartada = max(self._marca_descartada, marca)
+
+
+disponibilidade_cache = DisponibilidadeCache(Config.AGENDA_CACHE_SIZE, Config.AGENDA_CACHE_TTL)
+
+
+def invalidar_disponibilidade(id_atendente, inicio, duracao_minutos):
+    """
+    Invalida o cache de disponibilidade dos dias afetados por um agendamento
+    (incluindo a folga entre sessões). Chamar depois do commit.
+    """
+    dia = (inicio - INTERVALO_PADRAO).date()
+    ultimo_dia = (inicio + timedelta(minutes=duracao_minutos) + INTERVALO_PADRAO).date()
+    while dia <= ultimo_dia:
+        disponibilidade_cache.invalidate_dia(id_atendente, dia)
+        dia += timedelta(days=1)
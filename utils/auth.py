@@ -1,159 +1,304 @@
-import bcrypt
-import jwt
-from datetime import datetime, timedelta
-from functools import wraps
-from flask import request, jsonify
-from config import Config
-from utils.db import execute_query
-from utils.logger import setup_logger
-
-
-logger = setup_logger(__name__)
-
-def hash_password(password):
-    """Cria um hash da senha fornecida."""
-    logger.debug('Iniciando hash de senha')
-    try:
-        salt = bcrypt.gensalt()
-        hashed = bcrypt.hashpw(password.encode('utf-8'), salt).decode('utf-8')
-        logger.debug('Hash de senha criado com sucesso')
-        return hashed
-    except Exception as e:
-        logger.error(f'Erro ao criar hash de senha: {str(e)}')
-        raise
-
-def check_password(password, hashed_password):
-    """Verifica se a senha corresponde ao hash armazenado."""
-    logger.debug('Verificando senha')
-    try:
-        result = bcrypt.checkpw(password.encode('utf-8'), hashed_password.encode('utf-8'))
-        logger.debug('Verificação de senha concluída')
-        return result
-    except Exception as e:
-        logger.error(f'Erro ao verificar senha: {str(e)}')
-        return False
-
-def generate_token(user_id, tipo_usuario):
-    """Gera um token JWT para o usuário."""
-    logger.debug(f'Gerando token JWT para usuário {user_id} do tipo {tipo_usuario}')
-    try:
-        payload = {
-            'user_id': user_id,
-            'tipo_usuario': tipo_usuario,
-            'exp': datetime.utcnow() + timedelta(seconds=Config.JWT_ACCESS_TOKEN_EXPIRES)
-        }
-        token = jwt.encode(payload, Config.JWT_SECRET_KEY, algorithm='HS256')
-        logger.info(f'Token JWT gerado com sucesso para usuário {user_id}')
-        return token
-    except Exception as e:
-        logger.error(f'Erro ao gerar token JWT: {str(e)}')
-        raise
-
-def decode_token(token):
-    """Decodifica um token JWT."""
-    logger.debug('Tentando decodificar token JWT')
-    try:
-        payload = jwt.decode(token, Config.JWT_SECRET_KEY, algorithms=['HS256'])
-        logger.debug(f'Token JWT decodificado com sucesso para usuário {payload.get("user_id")}')
-        return payload
-    except jwt.ExpiredSignatureError:
-        logger.warning('Token JWT expirado')
-        return None
-    except jwt.InvalidTokenError as e:
-        logger.warning(f'Token JWT inválido: {str(e)}')
-        return None
-    except Exception as e:
-        logger.error(f'Erro ao decodificar token JWT: {str(e)}')
-        return None
-
-def token_required(f):
-    """Decorador para verificar se o token JWT é válido."""
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        logger.debug('Verificando token de autenticação')
-        token = None
-        if 'Authorization' in request.headers:
-            auth_header = request.headers['Authorization']
-            if auth_header.startswith('Bearer '):
-                token = auth_header.split(' ')[1]
-        
-        if not token:
-            logger.warning('Tentativa de acesso sem token de autenticação')
-            return jsonify({'message': 'Token de autenticação não fornecido!'}), 401
-        
-        payload = decode_token(token)
-        if not payload:
-            logger.warning('Tentativa de acesso com token inválido ou expirado')
-            return jsonify({'message': 'Token inválido ou expirado!'}), 401
-        
-        logger.debug(f'Buscando dados do usuário {payload["user_id"]}')
-        user_data = execute_query(
-            "SELECT id_usuario, nome_completo, email, tipo_usuario, situacao FROM usuario WHERE id_usuario = %s",
-            (payload['user_id'],),
-            fetch_all=False
-        )
-        
-        if not user_data:
-            logger.warning(f'Usuário {payload["user_id"]} do token não encontrado no banco')
-            return jsonify({'message': 'Usuário do token não encontrado!'}), 401
-        
-        if user_data['tipo_usuario'] != 'ADMIN' and user_data['situacao'] != 'ATIVO':
-            if user_data['situacao'] == 'PENDENTE_APROVACAO':
-                logger.info(f'Usuário {user_data["id_usuario"]} pendente de aprovação tentando acessar')
-                pass
-            elif user_data['situacao'] == 'BLOQUEADO':
-                logger.warning(f'Usuário bloqueado {user_data["id_usuario"]} tentando acessar')
-                return jsonify({'message': 'Sua conta está bloqueada.'}), 403
-            elif user_data['situacao'] == 'INATIVO':
-                logger.warning(f'Usuário inativo {user_data["id_usuario"]} tentando acessar')
-                return jsonify({'message': 'Sua conta está inativa.'}), 403
-
-        logger.debug(f'Usuário {user_data["id_usuario"]} autenticado com sucesso')
-        request.current_user = user_data
-        return f(*args, **kwargs)
-    
-    return decorated
-
-def admin_required(f):
-    @wraps(f)
-    @token_required
-    def decorated(*args, **kwargs):
-        logger.debug('Verificando permissão de administrador')
-        if not request.current_user or request.current_user['tipo_usuario'] != 'ADMIN':
-            logger.warning(f'Usuário {request.current_user["id_usuario"]} tentou acessar rota de admin sem permissão')
-            return jsonify({'message': 'Acesso restrito a administradores!'}), 403
-        logger.debug(f'Admin {request.current_user["id_usuario"]} autorizado')
-        return f(*args, **kwargs)
-    return decorated
-
-def atendente_required(f):
-    @wraps(f)
-    @token_required
-    def decorated(*args, **kwargs):
-        logger.debug('Verificando permissão de atendente')
-        if not request.current_user or request.current_user['tipo_usuario'] != 'ATENDENTE':
-            logger.warning(f'Usuário {request.current_user["id_usuario"]} tentou acessar rota de atendente sem permissão')
-            return jsonify({'message': 'Acesso restrito a atendentes!'}), 403
-        
-        if request.current_user['situacao'] != 'ATIVO':
-            logger.info(f'Atendente {request.current_user["id_usuario"]} não ativo tentando acessar')
-            pass
-            
-        logger.debug(f'Atendente {request.current_user["id_usuario"]} autorizado')
-        return f(*args, **kwargs)
-    return decorated
-
-def cliente_required(f):
-    @wraps(f)
-    @token_required
-    def decorated(*args, **kwargs):
-        logger.debug('Verificando permissão de cliente')
-        if not request.current_user or request.current_user['tipo_usuario'] != 'CLIENTE':
-            logger.warning(f'Usuário {request.current_user["id_usuario"]} tentou acessar rota de cliente sem permissão')
-            return jsonify({'message': 'Acesso restrito a clientes!'}), 403
-        if request.current_user['situacao'] != 'ATIVO':
-            logger.warning(f'Cliente {request.current_user["id_usuario"]} não ativo tentando acessar')
-            return jsonify({'message': 'Sua conta não está ativa.'}), 403
-        logger.debug(f'Cliente {request.current_user["id_usuario"]} autorizado')
-        return f(*args, **kwargs)
+import bcrypt
+import hashlib
+import jwt
+import secrets
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import wraps
+from flask import request, jsonify
+from config import Config
+from utils.cache import TTLCache
+from utils.db import execute_query
+from utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+_user_cache = TTLCache(Config.AUTH_USER_CACHE_SIZE, Config.AUTH_USER_CACHE_TTL, name='usuarios')
+
+def invalidate_user_cache(user_id):
+    """Remove o usuário do cache de autenticação. Chamar após o commit que altera situação ou perfil."""
+    _user_cache.invalidate(user_id)
+
+def get_user_cache_stats():
+    """Retorna hits, misses e ocupação do cache de usuários autenticados."""
+    return _user_cache.stats()
+
+def _get_authenticated_user(user_id):
+    user_data = _user_cache.get(user_id)
+    if user_data is None:
+        logger.debug('Buscando dados do usuário %s', user_id)
+        user_data = execute_query(
+            "SELECT id_usuario, nome_completo, email, tipo_usuario, situacao FROM usuario WHERE id_usuario = %s",
+            (user_id,),
+            fetch_all=False
+        )
+        if user_data:
+            _user_cache.set(user_id, user_data)
+    # Cópia para que a view não altere o registro compartilhado pelo cache.
+    return dict(user_data) if user_data else None
+
+class HashingBusyError(Exception):
+    """Fila de hashing de senhas cheia; a requisição deve responder 503."""
+
+_hash_executor = ThreadPoolExecutor(max_workers=Config.BCRYPT_MAX_CONCURRENCY, thread_name_prefix='bcrypt')
+# Vagas = hashes em execução + hashes aguardando na fila do executor.
+_hash_slots = threading.BoundedSemaphore(Config.BCRYPT_MAX_CONCURRENCY + Config.BCRYPT_MAX_QUEUE)
+
+def _run_bcrypt(func, *args):
+    """
+    Executa a operação de bcrypt no executor limitado. O bcrypt libera o GIL,
+    então no máximo BCRYPT_MAX_CONCURRENCY hashes consomem CPU ao mesmo tempo
+    e o excedente aguarda na fila; com a fila cheia levanta HashingBusyError.
+    """
+    if not _hash_slots.acquire(blocking=False):
+        logger.warning('Fila de hashing de senhas cheia; recusando requisição')
+        raise HashingBusyError('Servidor ocupado processando senhas. Tente novamente em instantes.')
+    try:
+        future = _hash_executor.submit(func, *args)
+    except Exception:
+        _hash_slots.release()
+        raise
+    future.add_done_callback(lambda _: _hash_slots.release())
+    return future.result()
+
+def hashing_busy_response(error):
+    """Resposta 503 padrão para HashingBusyError."""
+    return jsonify({'message': str(error)}), 503, {'Retry-After': str(Config.BCRYPT_RETRY_AFTER)}
+
+def hash_password(password):
+    """Cria um hash da senha fornecida com o custo BCRYPT_ROUNDS."""
+    logger.debug('Iniciando hash de senha')
+    try:
+        salt = bcrypt.gensalt(rounds=Config.BCRYPT_ROUNDS)
+        hashed = _run_bcrypt(bcrypt.hashpw, password.encode('utf-8'), salt).decode('utf-8')
+        logger.debug('Hash de senha criado com sucesso')
+        return hashed
+    except HashingBusyError:
+        raise
+    except Exception as e:
+        logger.error('Erro ao criar hash de senha: %s', e)
+        raise
+
+def check_password(password, hashed_password):
+    """Verifica se a senha corresponde ao hash armazenado."""
+    logger.debug('Verificando senha')
+    try:
+        result = _run_bcrypt(bcrypt.checkpw, password.encode('utf-8'), hashed_password.encode('utf-8'))
+        logger.debug('Verificação de senha concluída')
+        return result
+    except HashingBusyError:
+        raise
+    except Exception as e:
+        logger.error('Erro ao verificar senha: %s', e)
+        return False
+
+def password_needs_rehash(hashed_password):
+    """Indica se o hash foi gerado com um custo diferente de BCRYPT_ROUNDS."""
+    try:
+        return int(hashed_password.split('$')[2]) != Config.BCRYPT_ROUNDS
+    except (AttributeError, IndexError, ValueError):
+        return False
+
+def generate_token(user_id, tipo_usuario):
+    """Gera um token JWT para o usuário."""
+    logger.debug('Gerando token JWT para usuário %s do tipo %s', user_id, tipo_usuario)
+    try:
+        payload = {
+            'user_id': user_id,
+            'tipo_usuario': tipo_usuario,
+            'exp': datetime.utcnow() + timedelta(seconds=Config.JWT_ACCESS_TOKEN_EXPIRES)
+        }
+        token = jwt.encode(payload, Config.JWT_SECRET_KEY, algorithm='HS256')
+        logger.info('Token JWT gerado com sucesso para usuário %s', user_id)
+        return token
+    except Exception as e:
+        logger.error('Erro ao gerar token JWT: %s', e)
+        raise
+
+class RefreshTokenError(Exception):
+    """Refresh token recusado; `status` é o código HTTP da resposta."""
+
+    def __init__(self, message, status=401):
+        super().__init__(message)
+        self.status = status
+
+def _hash_refresh_token(token):
+    # O token tem 384 bits aleatórios: SHA-256 basta e não custa bcrypt a cada refresh.
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+def issue_refresh_token(cursor, user_id, familia=None):
+    """
+    Gera um refresh token para o usuário e grava o hash na tabela refresh_token.
+    Sem `familia`, inicia uma nova (um login); a rotação mantém a família do token trocado.
+    """
+    token = secrets.token_urlsafe(48)
+    cursor.execute("""
+        INSERT INTO refresh_token (id_usuario, familia, token_hash, data_expiracao)
+        VALUES (%s, %s, %s, %s)
+    """, (user_id, familia or uuid.uuid4().hex, _hash_refresh_token(token),
+          datetime.now() + timedelta(seconds=Config.JWT_REFRESH_TOKEN_EXPIRES)))
+    return token
+
+def revoke_refresh_tokens(cursor, user_id=None, familia=None):
+    """Revoga os refresh tokens ativos de um usuário ou de uma família."""
+    coluna, valor = ('familia', familia) if familia else ('id_usuario', user_id)
+    cursor.execute(
+        f"UPDATE refresh_token SET data_revogacao = NOW() WHERE {coluna} = %s AND data_revogacao IS NULL",
+        (valor,)
+    )
+
+def revoke_refresh_token_family(cursor, token):
+    """Revoga a família do refresh token informado (logout em um dispositivo)."""
+    cursor.execute("SELECT familia FROM refresh_token WHERE token_hash = %s", (_hash_refresh_token(token),))
+    registro = cursor.fetchone()
+    if registro:
+        revoke_refresh_tokens(cursor, familia=registro['familia'])
+
+def rotate_refresh_token(cursor, token):
+    """
+    Troca um refresh token válido por um novo da mesma família e retorna
+    (usuario, novo_token). Deve rodar dentro de uma transação.
+
+    Reapresentar um token já trocado (fora de JWT_REFRESH_REUSE_GRACE) indica
+    vazamento: a família inteira é revogada e RefreshTokenError é levantado;
+    quem chamou deve fazer commit mesmo assim para persistir a revogação.
+    """
+    cursor.execute("""
+        SELECT rt.id_refresh_token, rt.familia, rt.data_expiracao, rt.data_uso, rt.data_revogacao,
+               u.id_usuario, u.nome_completo, u.nome_social, u.email, u.tipo_usuario, u.situacao
+        FROM refresh_token rt
+        JOIN usuario u ON u.id_usuario = rt.id_usuario
+        WHERE rt.token_hash = %s
+        FOR UPDATE
+    """, (_hash_refresh_token(token),))
+    registro = cursor.fetchone()
+    agora = datetime.now()
+
+    if not registro or registro['data_revogacao'] is not None:
+        raise RefreshTokenError('Refresh token inválido.')
+    if registro['data_uso'] is not None and \
+            registro['data_uso'] + timedelta(seconds=Config.JWT_REFRESH_REUSE_GRACE) < agora:
+        logger.warning('Reuso de refresh token detectado para usuário %s; revogando a família %s',
+                       registro['id_usuario'], registro['familia'])
+        revoke_refresh_tokens(cursor, familia=registro['familia'])
+        raise RefreshTokenError('Refresh token inválido.')
+    if registro['data_expiracao'] < agora:
+        raise RefreshTokenError('Refresh token expirado.')
+    if registro['tipo_usuario'] != 'ADMIN' and registro['situacao'] in ('BLOQUEADO', 'INATIVO'):
+        revoke_refresh_tokens(cursor, familia=registro['familia'])
+        raise RefreshTokenError('Sua conta não está ativa.', status=403)
+
+    if registro['data_uso'] is None:
+        cursor.execute("UPDATE refresh_token SET data_uso = %s WHERE id_refresh_token = %s",
+                       (agora, registro['id_refresh_token']))
+    novo_token = issue_refresh_token(cursor, registro['id_usuario'], registro['familia'])
+    usuario = {chave: registro[chave] for chave in
+               ('id_usuario', 'nome_completo', 'nome_social', 'email', 'tipo_usuario', 'situacao')}
+    return usuario, novo_token
+
+def decode_token(token):
+    """Decodifica um token JWT."""
+    logger.debug('Tentando decodificar token JWT')
+    try:
+        payload = jwt.decode(token, Config.JWT_SECRET_KEY, algorithms=['HS256'])
+        logger.debug('Token JWT decodificado com sucesso para usuário %s', payload.get('user_id'))
+        return payload
+    except jwt.ExpiredSignatureError:
+        logger.warning('Token JWT expirado')
+        return None
+    except jwt.InvalidTokenError as e:
+        logger.warning('Token JWT inválido: %s', e)
+        return None
+    except Exception as e:
+        logger.error('Erro ao decodificar token JWT: %s', e)
+        return None
+
+def token_required(f):
+    """Decorador para verificar se o token JWT é válido."""
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        logger.debug('Verificando token de autenticação')
+        token = None
+        if 'Authorization' in request.headers:
+            auth_header = request.headers['Authorization']
+            if auth_header.startswith('Bearer '):
+                token = auth_header.split(' ')[1]
+        
+        if not token:
+            logger.warning('Tentativa de acesso sem token de autenticação')
+            return jsonify({'message': 'Token de autenticação não fornecido!'}), 401
+        
+        payload = decode_token(token)
+        if not payload:
+            logger.warning('Tentativa de acesso com token inválido ou expirado')
+            return jsonify({'message': 'Token inválido ou expirado!'}), 401
+        
+        user_data = _get_authenticated_user(payload['user_id'])
+        
+        if not user_data:
+            logger.warning('Usuário %s do token não encontrado no banco', payload['user_id'])
+            return jsonify({'message': 'Usuário do token não encontrado!'}), 401
+        
+        if user_data['tipo_usuario'] != 'ADMIN' and user_data['situacao'] != 'ATIVO':
+            if user_data['situacao'] == 'PENDENTE_APROVACAO':
+                logger.info('Usuário %s pendente de aprovação tentando acessar', user_data['id_usuario'])
+                pass
+            elif user_data['situacao'] == 'BLOQUEADO':
+                logger.warning('Usuário bloqueado %s tentando acessar', user_data['id_usuario'])
+                return jsonify({'message': 'Sua conta está bloqueada.'}), 403
+            elif user_data['situacao'] == 'INATIVO':
+                logger.warning('Usuário inativo %s tentando acessar', user_data['id_usuario'])
+                return jsonify({'message': 'Sua conta está inativa.'}), 403
+
+        logger.debug('Usuário %s autenticado com sucesso', user_data['id_usuario'])
+        request.current_user = user_data
+        return f(*args, **kwargs)
+    
+    return decorated
+
+def admin_required(f):
+    @wraps(f)
+    @token_required
+    def decorated(*args, **kwargs):
+        logger.debug('Verificando permissão de administrador')
+        if not request.current_user or request.current_user['tipo_usuario'] != 'ADMIN':
+            logger.warning('Usuário %s tentou acessar rota de admin sem permissão', request.current_user['id_usuario'])
+            return jsonify({'message': 'Acesso restrito a administradores!'}), 403
+        logger.debug('Admin %s autorizado', request.current_user['id_usuario'])
+        return f(*args, **kwargs)
+    return decorated
+
+def atendente_required(f):
+    @wraps(f)
+    @token_required
+    def decorated(*args, **kwargs):
+        logger.debug('Verificando permissão de atendente')
+        if not request.current_user or request.current_user['tipo_usuario'] != 'ATENDENTE':
+            logger.warning('Usuário %s tentou acessar rota de atendente sem permissão', request.current_user['id_usuario'])
+            return jsonify({'message': 'Acesso restrito a atendentes!'}), 403
+        
+        if request.current_user['situacao'] != 'ATIVO':
+            logger.info('Atendente %s não ativo tentando acessar', request.current_user['id_usuario'])
+            pass
+            
+        logger.debug('Atendente %s autorizado', request.current_user['id_usuario'])
+        return f(*args, **kwargs)
+    return decorated
+
+def cliente_required(f):
+    @wraps(f)
+    @token_required
+    def decorated(*args, **kwargs):
+        logger.debug('Verificando permissão de cliente')
+        if not request.current_user or request.current_user['tipo_usuario'] != 'CLIENTE':
+            logger.warning('Usuário %s tentou acessar rota de cliente sem permissão', request.current_user['id_usuario'])
+            return jsonify({'message': 'Acesso restrito a clientes!'}), 403
+        if request.current_user['situacao'] != 'ATIVO':
+            logger.warning('Cliente %s não ativo tentando acessar', request.current_user['id_usuario'])
+            return jsonify({'message': 'Sua conta não está ativa.'}), 403
+        logger.debug('Cliente %s autorizado', request.current_user['id_usuario'])
+        return f(*args, **kwargs)
     return decorated
\ No newline at end of file
@@ -0,0 +1,57 @@
+NOTAS = range(1, 6)
+COLUNAS_HISTOGRAMA = ', '.join(f'total_nota_{nota}' for nota in NOTAS)
+
+
+def registrar_nota(cursor, id_atendente, nota):
+    """
+    Soma uma avaliação ao resumo do atendente (atendente_avaliacao_resumo), na
+    mesma transação do INSERT em avaliacao. A linha do resumo fica travada até
+    o commit, então avaliações simultâneas do mesmo atendente não se perdem.
+    """
+    nota = int(nota)
+    if nota not in NOTAS:
+        raise ValueError(f'Nota inválida: {nota}')
+    cursor.execute(f"""
+        INSERT INTO atendente_avaliacao_resumo (id_atendente, soma_notas, total_avaliacoes, total_nota_{nota})
+        VALUES (%s, %s, 1, 1)
+        ON DUPLICATE KEY UPDATE
+            soma_notas = soma_notas + VALUES(soma_notas),
+            total_avaliacoes = total_avaliacoes + 1,
+            total_nota_{nota} = total_nota_{nota} + 1
+    """, (id_atendente, nota))
+
+
+def resumo_avaliacoes(cursor, id_atendente):
+    """Média (2 casas), total e quantidade de avaliações por nota, lidos do resumo."""
+    cursor.execute(f"""
+        SELECT soma_notas, total_avaliacoes, {COLUNAS_HISTOGRAMA}
+        FROM atendente_avaliacao_resumo WHERE id_atendente = %s
+    """, (id_atendente,))
+    linha = cursor.fetchone()
+    if not linha or not linha['total_avaliacoes']:
+        return {'media_geral': 0.0, 'total_avaliacoes': 0, 'distribuicao_notas': {str(nota): 0 for nota in NOTAS}}
+    return {
+        'media_geral': round(linha['soma_notas'] / linha['total_avaliacoes'], 2),
+        'total_avaliacoes': linha['total_avaliacoes'],
+        'distribuicao_notas': {str(nota): linha[f'total_nota_{nota}'] for nota in NOTAS},
+    }
+
+
+def reconstruir_resumo_avaliacoes(cursor):
+    """
+    Recalcula atendente_avaliacao_resumo a partir de avaliacao (só atendimentos
+    REALIZADO, como antes). Retorna (atendentes, avaliações).
+    """
+    cursor.execute("DELETE FROM atendente_avaliacao_resumo")
+    contagens = ', '.join(f'SUM(av.nota = {nota})' for nota in NOTAS)
+    cursor.execute(f"""
+        INSERT INTO atendente_avaliacao_resumo (id_atendente, soma_notas, total_avaliacoes, {COLUNAS_HISTOGRAMA})
+        SELECT ag.id_atendente, SUM(av.nota), COUNT(*), {contagens}
+        FROM avaliacao av
+        JOIN agendamento ag ON av.id_agendamento = ag.id_agendamento
+        WHERE ag.status_agendamento = 'REALIZADO'
+        GROUP BY ag.id_atendente
+    """)
+    atendentes = cursor.rowcount
+    cursor.execute("SELECT COALESCE(SUM(total_avaliacoes), 0) AS total FROM atendente_avaliacao_resumo")
+    return atendentes, int(cursor.fetchone()['total'])
@@ -0,0 +1,151 @@
+import math
+import re
+from functools import lru_cache
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+
+# Peso de cada campo do perfil na relevância: o nome pesa mais que a descrição.
+PESOS_CAMPOS = {
+    'nome_completo': 3.0,
+    'nome_social': 3.0,
+    'especialidades': 2.0,
+    'qualificacao_descricao': 1.0,
+}
+STOPWORDS = frozenset(
+    'a o as os e de da do das dos em na no nas nos um uma uns umas para por com sem ao aos '
+    'que se ou sua seu suas seus pela pelo pelas pelos'.split()
+)
+# Prefixos menores que isso só casam com o termo exato (evita expandir 'a' para meio vocabulário).
+MIN_PREFIXO = 2
+PESO_PREFIXO = 0.5
+
+_PALAVRA = re.compile(r'\w+')
+_ACENTOS = re.compile('[\u0300-\u036f]')  # marcas combinantes que sobram do NFKD
+
+
+def dobrar(texto):
+    """Minúsculas e sem acentos, como a collation utf8mb4_unicode_ci compara ('Saúde' -> 'saude')."""
+    return _ACENTOS.sub('', unicodedata.normalize('NFKD', texto or '')).casefold()
+
+
+@lru_cache(maxsize=65536)
+def _singular(termo):
+    # Radicalização leve: só o plural, para 'psicologas' achar 'psicologa' e 'relacoes' achar 'relacao'.
+    if len(termo) <= 3:
+        return termo
+    for sufixo, troca in (('oes', 'ao'), ('aes', 'ao'), ('ais', 'al'), ('eis', 'el'), ('ns', 'm')):
+        if termo.endswith(sufixo):
+            return termo[:-len(sufixo)] + troca
+    if termo.endswith('s') and not termo.endswith('ss'):
+        return termo[:-1]
+    return termo
+
+
+def tokenizar(texto):
+    """Termos normalizados de um texto: sem acento, minúsculos, no singular e sem stopwords."""
+    return [_singular(palavra) for palavra in _PALAVRA.findall(dobrar(texto)) if palavra not in STOPWORDS]
+
+
+class IndiceBusca:
+    """
+    Índice invertido em memória dos perfis de atendentes.
+
+    `buscar` exige todos os termos da consulta (E lógico). Cada termo casa com
+    o termo exato do índice ou, com peso menor, com termos que começam por ele;
+    a pontuação soma peso do campo x idf do melhor termo casado de cada termo
+    da consulta. Adições e remoções são incrementais e seguras entre threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._termos = []          # vocabulário ordenado, para as faixas de prefixo
+        self._postings = {}        # termo -> {id: peso}
+        self._termos_do_doc = {}   # id -> termos, para remover sem varrer o índice
+
+    @classmethod
+    def construir(cls, documentos):
+        """Monta o índice de uma vez a partir de pares (id, campos)."""
+        indice = cls()
+        for id_doc, campos in documentos:
+            indice._adicionar(id_doc, campos, ordenar=False)
+        indice._termos = sorted(indice._postings)
+        return indice
+
+    def __len__(self):
+        return len(self._termos_do_doc)
+
+    def adicionar(self, id_doc, campos):
+        with self._lock:
+            self._remover(id_doc)
+            self._adicionar(id_doc, campos, ordenar=True)
+
+    def remover(self, id_doc):
+        with self._lock:
+            self._remover(id_doc)
+
+    def _adicionar(self, id_doc, campos, ordenar):
+        pesos = {}
+        for campo, peso in PESOS_CAMPOS.items():
+            for termo in tokenizar(campos.get(campo)):
+                pesos[termo] = pesos.get(termo, 0.0) + peso
+        for termo, peso in pesos.items():
+            postings = self._postings.get(termo)
+            if postings is None:
+                postings = self._postings[termo] = {}
+                if ordenar:
+                    insort(self._termos, termo)
+            postings[id_doc] = peso
+        self._termos_do_doc[id_doc] = tuple(pesos)
+
+    def _remover(self, id_doc):
+        for termo in self._termos_do_doc.pop(id_doc, ()):
+            postings = self._postings[termo]
+            del postings[id_doc]
+            if not postings:
+                del self._postings[termo]
+                del self._termos[bisect_left(self._termos, termo)]
+
+    def _expandir(self, termo):
+        if len(termo) < MIN_PREFIXO:
+            return [termo] if termo in self._postings else []
+        inicio = bisect_left(self._termos, termo)
+        fim = bisect_left(self._termos, termo + '\uffff', inicio)
+        return self._termos[inicio:fim]
+
+    def buscar(self, consulta):
+        """
+        Retorna {id: pontuação} dos documentos que casam com todos os termos da
+        consulta, ou None se a consulta não tem termos (só stopwords/pontuação).
+        """
+        termos_consulta = list(dict.fromkeys(tokenizar(consulta)))
+        if not termos_consulta:
+            return None
+        with self._lock:
+            total_docs = len(self._termos_do_doc) or 1
+            expansoes = [(termo_consulta, self._expandir(termo_consulta)) for termo_consulta in termos_consulta]
+            # O termo mais raro primeiro: os seguintes só conferem os documentos que sobraram.
+            expansoes.sort(key=lambda item: sum(len(self._postings[termo]) for termo in item[1]))
+            pontuacoes = None
+            for termo_consulta, termos in expansoes:
+                melhores = {}
+                for termo in termos:
+                    postings = self._postings[termo]
+                    fator = math.log(1 + total_docs / len(postings)) * (1.0 if termo == termo_consulta else PESO_PREFIXO)
+                    if pontuacoes is None:
+                        pares = postings.items()
+                    elif len(pontuacoes) < len(postings):
+                        pares = ((id_doc, postings[id_doc]) for id_doc in pontuacoes.keys() & postings.keys())
+                    else:
+                        pares = ((id_doc, peso) for id_doc, peso in postings.items() if id_doc in pontuacoes)
+                    for id_doc, peso in pares:
+                        valor = peso * fator
+                        if valor > melhores.get(id_doc, 0.0):
+                            melhores[id_doc] = valor
+                if pontuacoes is None:
+                    pontuacoes = melhores
+                else:
+                    pontuacoes = {id_doc: pontuacoes[id_doc] + valor for id_doc, valor in melhores.items()}
+                if not pontuacoes:
+                    break
+            return pontuacoes
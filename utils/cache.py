@@ -0,0 +1,73 @@
+import threading
+import time
+from collections import OrderedDict
+
+from utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+_AUSENTE = object()
+
+
+class TTLCache:
+    """
+    Cache LRU em memória com expiração por tempo (TTL), seguro entre threads.
+
+    Cada processo tem o seu cache; por isso quem altera o dado deve chamar
+    invalidate() e o TTL limita por quanto tempo outros processos podem
+    continuar vendo o valor antigo.
+    """
+
+    def __init__(self, maxsize=1024, ttl=30, name='cache'):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.name = name
+        self._dados = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, default=None):
+        agora = time.monotonic()
+        with self._lock:
+            entrada = self._dados.get(key, _AUSENTE)
+            if entrada is not _AUSENTE:
+                valor, expira_em = entrada
+                if expira_em > agora:
+                    self._dados.move_to_end(key)
+                    self.hits += 1
+                    return valor
+                del self._dados[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        with self._lock:
+            self._dados[key] = (value, time.monotonic() + self.ttl)
+            self._dados.move_to_end(key)
+            while len(self._dados) > self.maxsize:
+                self._dados.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            removido = self._dados.pop(key, None) is not None
+        if removido:
+            logger.debug('Cache %s: chave %s invalidada', self.name, key)
+
+    def clear(self):
+        with self._lock:
+            self._dados.clear()
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'nome': self.name,
+                'tamanho': len(self._dados),
+                'max': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            }
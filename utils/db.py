@@ -1,191 +1,627 @@
-import pymysql
-from pymysql.cursors import DictCursor
-from config import Config
-from utils.logger import setup_logger
-
-
-logger = setup_logger(__name__)
-
-def get_connection():
-    """Estabelece e retorna uma conexão com o banco de dados."""
-    logger.debug('Tentando estabelecer conexão com o banco de dados')
-    try:
-        connection = pymysql.connect(
-            host=Config.DB_HOST,
-            user=Config.DB_USER,
-            password=Config.DB_PASSWORD,
-            db=Config.DB_NAME,
-            charset='utf8mb4',
-            cursorclass=DictCursor,
-            autocommit=True
-        )
-        logger.info('Conexão com o banco de dados estabelecida com sucesso')
-        return connection
-    except Exception as e:
-        logger.error(f'Erro ao conectar ao banco de dados: {str(e)}')
-        raise
-
-def execute_query(query, params=None, fetch_all=True):
-    """Executa uma consulta SQL e retorna os resultados."""
-    connection = None
-    try:
-        logger.debug(f'Executando query: {query}')
-        if params:
-            logger.debug(f'Parâmetros: {params}')
-        
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute(query, params or ())
-            if fetch_all:
-                result = cursor.fetchall()
-                logger.debug(f'Query retornou {len(result)} registros')
-            else:
-                result = cursor.fetchone()
-                logger.debug('Query retornou um registro' if result else 'Query não retornou registros')
-            return result
-    except Exception as e:
-        logger.error(f'Erro ao executar query: {str(e)}')
-        raise
-    finally:
-        if connection:
-            connection.close()
-            logger.debug('Conexão com o banco de dados fechada')
-
-def execute_procedure(procedure_name, params=None):
-    """Executa uma stored procedure e retorna os resultados."""
-    connection = None
-    try:
-        logger.debug(f'Executando procedure: {procedure_name}')
-        if params:
-            logger.debug(f'Parâmetros: {params}')
-        
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.callproc(procedure_name, params or ())
-            result = cursor.fetchall()
-            logger.debug(f'Procedure retornou {len(result)} registros')
-            return result
-    except Exception as e:
-        logger.error(f'Erro ao executar procedure: {str(e)}')
-        raise
-    finally:
-        if connection:
-            connection.close()
-            logger.debug('Conexão com o banco de dados fechada')
-
-def execute_transaction(queries):
-    """Executa múltiplas consultas em uma transação."""
-    connection = None
-    try:
-        logger.debug(f'Iniciando transação com {len(queries)} queries')
-        connection = get_connection()
-        connection.begin()
-        
-        with connection.cursor() as cursor:
-            results = []
-            for i, (query, params) in enumerate(queries):
-                logger.debug(f'Executando query {i+1}/{len(queries)}: {query}')
-                if params:
-                    logger.debug(f'Parâmetros: {params}')
-                
-                cursor.execute(query, params or ())
-                if cursor.rowcount > 0:
-                    result = cursor.fetchall()
-                    results.append(result)
-                    logger.debug(f'Query {i+1} retornou {len(result)} registros')
-                else:
-                    results.append(None)
-                    logger.debug(f'Query {i+1} não retornou registros')
-            
-            connection.commit()
-            logger.info('Transação commitada com sucesso')
-            return results
-    except Exception as e:
-        if connection:
-            connection.rollback()
-            logger.error(f'Erro na transação, realizando rollback: {str(e)}')
-        raise
-    finally:
-        if connection:
-            connection.close()
-            logger.debug('Conexão com o banco de dados fechada')
-
-def insert_record(table, data):
-    """Insere um registro em uma tabela e retorna o ID inserido."""
-    connection = None
-    try:
-        columns = ', '.join(data.keys())
-        placeholders = ', '.join(['%s'] * len(data))
-        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
-        
-        logger.debug(f'Inserindo registro na tabela {table}')
-        logger.debug(f'Query: {query}')
-        logger.debug(f'Dados: {data}')
-        
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute(query, list(data.values()))
-            last_id = cursor.lastrowid
-            logger.info(f'Registro inserido com sucesso na tabela {table}. ID: {last_id}')
-            return last_id
-    except Exception as e:
-        logger.error(f'Erro ao inserir registro na tabela {table}: {str(e)}')
-        raise
-    finally:
-        if connection:
-            connection.close()
-            logger.debug('Conexão com o banco de dados fechada')
-
-def update_record(table, data, condition):
-    """Atualiza registros em uma tabela com base em uma condição."""
-    connection = None
-    try:
-        set_clause = ', '.join([f"{key} = %s" for key in data.keys()])
-        where_clause = ' AND '.join([f"{key} = %s" for key in condition.keys()])
-        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
-        
-        logger.debug(f'Atualizando registros na tabela {table}')
-        logger.debug(f'Query: {query}')
-        logger.debug(f'Dados: {data}')
-        logger.debug(f'Condição: {condition}')
-        
-        params = list(data.values()) + list(condition.values())
-        
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute(query, params)
-            affected_rows = cursor.rowcount
-            logger.info(f'{affected_rows} registros atualizados na tabela {table}')
-            return affected_rows
-    except Exception as e:
-        logger.error(f'Erro ao atualizar registros na tabela {table}: {str(e)}')
-        raise
-    finally:
-        if connection:
-            connection.close()
-            logger.debug('Conexão com o banco de dados fechada')
-
-def delete_record(table, condition):
-    """Exclui registros de uma tabela com base em uma condição."""
-    connection = None
-    try:
-        where_clause = ' AND '.join([f"{key} = %s" for key in condition.keys()])
-        query = f"DELETE FROM {table} WHERE {where_clause}"
-        
-        logger.debug(f'Excluindo registros da tabela {table}')
-        logger.debug(f'Query: {query}')
-        logger.debug(f'Condição: {condition}')
-        
-        connection = get_connection()
-        with connection.cursor() as cursor:
-            cursor.execute(query, list(condition.values()))
-            affected_rows = cursor.rowcount
-            logger.info(f'{affected_rows} registros excluídos da tabela {table}')
-            return affected_rows
-    except Exception as e:
-        logger.error(f'Erro ao excluir registros da tabela {table}: {str(e)}')
-        raise
-    finally:
-        if connection:
-            connection.close()
+import functools
+import random
+import threading
+import time
+import pymysql
+from flask import g, has_request_context, request
+from pymysql.constants import SERVER_STATUS
+from config import Config
+from utils.logger import setup_logger
+from utils.pool import ConnectionPool, PooledConnection
+from utils.query_stats import InstrumentedDictCursor, InstrumentedSSDictCursor
+from utils.replicas import ReplicaSet, is_read_query, parse_dsn
+
+
+logger = setup_logger(__name__)
+
+_pool = None
+_replicas = None
+_pool_lock = threading.Lock()
+_max_allowed_packet = None  # @@max_allowed_packet do servidor, lido na primeira inserção em lote
+
+# Cookie que mantém as leituras de um cliente no primário logo após uma escrita.
+PRIMARY_STICKY_COOKIE = 'db_primario_ate'
+
+# ER_LOCK_DEADLOCK e ER_LOCK_WAIT_TIMEOUT: a transação pode ser repetida do zero.
+RETRYABLE_LOCK_ERRORS = (1213, 1205)
+
+def create_connection(dsn=None):
+    """
+    Abre uma conexão nova com o banco de dados, sem passar pelo pool.
+
+    Sem `dsn` conecta ao primário (Config.DB_PRIMARY_DSN ou DB_HOST/DB_USER/...).
+    Usuário, senha e banco ausentes no DSN são herdados da configuração padrão.
+    """
+    logger.debug('Tentando estabelecer conexão com o banco de dados')
+    try:
+        params = {'host': Config.DB_HOST, 'user': Config.DB_USER, 'password': Config.DB_PASSWORD, 'db': Config.DB_NAME}
+        dsn = dsn or Config.DB_PRIMARY_DSN
+        if dsn:
+            params.update(parse_dsn(dsn))
+        connection = pymysql.connect(
+            **params,
+            charset='utf8mb4',
+            cursorclass=InstrumentedDictCursor,
+            autocommit=True
+        )
+        logger.info("Conexão com o banco de dados estabelecida com sucesso (%s)", params['host'])
+        return connection
+    except Exception as e:
+        logger.error('Erro ao conectar ao banco de dados: %s', e)
+        raise
+
+def _create_pool(factory, name):
+    return ConnectionPool(
+        factory,
+        min_size=Config.DB_POOL_MIN_SIZE,
+        max_size=Config.DB_POOL_MAX_SIZE,
+        idle_timeout=Config.DB_POOL_IDLE_TIMEOUT,
+        max_lifetime=Config.DB_POOL_MAX_LIFETIME,
+        checkout_timeout=Config.DB_POOL_CHECKOUT_TIMEOUT,
+        name=name,
+    )
+
+def get_pool():
+    """Retorna o pool de conexões do primário, criando-o no primeiro uso."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _create_pool(create_connection, 'primario')
+                logger.info('Pool de conexões criado (min=%s, max=%s)', Config.DB_POOL_MIN_SIZE, Config.DB_POOL_MAX_SIZE)
+    return _pool
+
+def get_replica_set():
+    """Retorna o conjunto de réplicas de leitura, ou None se não houver réplicas configuradas."""
+    global _replicas
+    if not Config.DB_REPLICA_DSNS or not Config.DB_POOL_ENABLED:
+        return None
+    if _replicas is None:
+        with _pool_lock:
+            if _replicas is None:
+                pools = [
+                    _create_pool(functools.partial(create_connection, dsn), f"replica-{parse_dsn(dsn)['host']}")
+                    for dsn in Config.DB_REPLICA_DSNS
+                ]
+                _replicas = ReplicaSet(pools, retry_interval=Config.DB_REPLICA_RETRY_INTERVAL)
+                logger.info('%s réplica(s) de leitura configurada(s)', len(pools))
+    return _replicas
+
+def close_pool():
+    """Fecha os pools de conexões (usado no encerramento da aplicação e em benchmarks)."""
+    global _pool, _replicas
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
+        if _replicas is not None:
+            _replicas.close()
+            _replicas = None
+
+def _acquire_connection():
+    """Obtém uma conexão do pool (ou uma conexão nova se o pool estiver desligado)."""
+    if not Config.DB_POOL_ENABLED:
+        return create_connection()
+    return get_pool().acquire()
+
+def _acquire_read_connection():
+    """Obtém uma conexão de réplica; sem réplica disponível, usa o primário."""
+    replicas = get_replica_set()
+    connection = replicas.acquire() if replicas else None
+    return connection or _acquire_connection()
+
+class _SessionCursor:
+    """Cursor da sessão da requisição; conta os statements executados e marca escritas."""
+
+    def __init__(self, cursor, track_writes=True):
+        self._cursor = cursor
+        self._track_writes = track_writes
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._cursor.close()
+
+    def _registrar(self, query):
+        _request_db_stats()['statements'] += 1
+        if self._track_writes and (query is None or not is_read_query(query)):
+            g.db_wrote = True
+
+    def execute(self, query, args=None):
+        self._registrar(query)
+        return self._cursor.execute(query, args)
+
+    def executemany(self, query, args):
+        self._registrar(query)
+        return self._cursor.executemany(query, args)
+
+    def callproc(self, procname, args=()):
+        self._registrar(None)
+        return self._cursor.callproc(procname, args)
+
+class _SessionConnection:
+    """
+    Conexão compartilhada pela requisição inteira.
+
+    close() não faz nada: a conexão só é finalizada (commit/rollback) e
+    devolvida ao pool no teardown da requisição.
+    """
+
+    def __init__(self, raw, replica=False):
+        self._raw = raw
+        self._replica = replica
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def cursor(self, *args, **kwargs):
+        return _SessionCursor(self._raw.cursor(*args, **kwargs), track_writes=not self._replica)
+
+    def close(self):
+        pass
+
+def _request_db_stats():
+    if 'db_stats' not in g:
+        g.db_stats = {'conexoes': 0, 'statements': 0}
+    return g.db_stats
+
+def get_request_db_stats():
+    """Retorna o contador de conexões/statements da requisição atual."""
+    return dict(_request_db_stats())
+
+def get_db():
+    """Retorna a sessão de banco (primário) da requisição, abrindo a conexão na primeira chamada."""
+    connection = g.get('_db_session')
+    if connection is None:
+        connection = _SessionConnection(_acquire_connection())
+        g._db_session = connection
+        _request_db_stats()['conexoes'] += 1
+        logger.debug('Sessão de banco da requisição aberta')
+    return connection
+
+def get_read_db():
+    """Retorna a sessão de leitura (réplica) da requisição; sem réplica disponível, usa get_db()."""
+    connection = g.get('_db_read_session')
+    if connection is None:
+        raw = get_replica_set().acquire()
+        if raw is None:
+            return get_db()
+        connection = _SessionConnection(raw, replica=True)
+        g._db_read_session = connection
+        _request_db_stats()['conexoes'] += 1
+        logger.debug('Sessão de leitura (réplica) da requisição aberta')
+    return connection
+
+def _reads_pinned_to_primary():
+    """
+    Leituras vão para o primário quando a requisição já escreveu, está no meio
+    de uma transação ou o cliente escreveu há menos de DB_READ_YOUR_WRITES_WINDOW segundos.
+    """
+    if not has_request_context():
+        return False
+    if g.get('db_wrote'):
+        return True
+    session = g.get('_db_session')
+    if session is not None and session.open and session.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+        return True
+    try:
+        return float(request.cookies.get(PRIMARY_STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+def get_read_connection():
+    """
+    Retorna uma conexão para leitura: uma réplica (round-robin) quando há
+    réplicas configuradas e a leitura não precisa ver escritas recentes;
+    caso contrário, a mesma conexão de get_connection().
+    """
+    if get_replica_set() is None or _reads_pinned_to_primary():
+        return get_connection()
+    if has_request_context():
+        return get_read_db()
+    return _acquire_read_connection()
+
+def _finalize_session(connection, exc):
+    raw = connection._raw
+    try:
+        if raw.open and raw.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+            if exc is None:
+                raw.commit()
+            else:
+                logger.warning('Rollback da sessão de banco por erro na requisição: %s', exc)
+                raw.rollback()
+    except Exception as e:
+        logger.error('Erro ao finalizar sessão de banco da requisição: %s', e)
+    finally:
+        raw.close()
+
+def _teardown_db_session(exc):
+    encerrou = False
+    for chave in ('_db_session', '_db_read_session'):
+        connection = g.pop(chave, None)
+        if connection is not None:
+            _finalize_session(connection, exc)
+            encerrou = True
+    if encerrou:
+        stats = g.get('db_stats', {})
+        logger.debug("Sessão de banco encerrada: %s conexão(ões), %s statements", stats.get('conexoes', 0), stats.get('statements', 0))
+
+def _add_db_stats_headers(response):
+    if 'db_stats' in g:
+        response.headers['X-DB-Connections'] = str(g.db_stats['conexoes'])
+        response.headers['X-DB-Statements'] = str(g.db_stats['statements'])
+    if g.get('db_wrote') and get_replica_set() is not None and Config.DB_READ_YOUR_WRITES_WINDOW > 0:
+        janela = Config.DB_READ_YOUR_WRITES_WINDOW
+        response.set_cookie(PRIMARY_STICKY_COOKIE, str(time.time() + janela), max_age=janela, httponly=True, samesite='Lax')
+    return response
+
+def init_db_session(app):
+    """Registra na aplicação o ciclo de vida da sessão de banco por requisição."""
+    app.after_request(_add_db_stats_headers)
+    app.teardown_request(_teardown_db_session)
+
+def get_connection():
+    """
+    Retorna uma conexão com o banco de dados primário.
+
+    Dentro de uma requisição Flask devolve a sessão da requisição (get_db),
+    compartilhada por decoradores, helpers e pela view. Fora de uma requisição
+    a conexão vem do pool e `close()` a devolve para reuso.
+    """
+    if has_request_context():
+        return get_db()
+    return _acquire_connection()
+
+def execute_query(query, params=None, fetch_all=True):
+    """Executa uma consulta SQL e retorna os resultados. Leituras podem ser atendidas por uma réplica."""
+    connection = None
+    try:
+        logger.debug('Executando query: %s', query)
+        if params:
+            logger.debug('Parâmetros: %s', params)
+        
+        connection = get_read_connection() if is_read_query(query) else get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(query, params or ())
+            if fetch_all:
+                result = cursor.fetchall()
+                logger.debug('Query retornou %s registros', len(result))
+            else:
+                result = cursor.fetchone()
+                logger.debug('Query retornou um registro' if result else 'Query não retornou registros')
+            return result
+    except Exception as e:
+        logger.error('Erro ao executar query: %s', e)
+        raise
+    finally:
+        if connection:
+            connection.close()
+            logger.debug('Conexão com o banco de dados fechada')
+
+def iter_query(query, params=None, batch_size=500):
+    """
+    Executa uma consulta com cursor não bufferizado (SSDictCursor) e gera os
+    resultados em lotes de até `batch_size` linhas.
+
+    Usa uma conexão própria (fora da sessão da requisição), mantida até o
+    gerador terminar. Se o consumidor parar antes do fim, a conexão é
+    descartada em vez de voltar ao pool, para não ter de ler o resto do resultado.
+    """
+    connection = None
+    esgotado = False
+    try:
+        logger.debug('Executando query em streaming: %s', query)
+        if params:
+            logger.debug('Parâmetros: %s', params)
+
+        if is_read_query(query) and not _reads_pinned_to_primary():
+            connection = _acquire_read_connection()
+        else:
+            connection = _acquire_connection()
+        # Sem "with": fechar um SSCursor lê todo o resultado restante.
+        cursor = connection.cursor(InstrumentedSSDictCursor)
+        cursor.execute(query, params or ())
+        total = 0
+        while True:
+            lote = cursor.fetchmany(batch_size)
+            if not lote:
+                break
+            total += len(lote)
+            yield lote
+        cursor.close()
+        esgotado = True
+        logger.debug('Query em streaming retornou %s registros', total)
+    except GeneratorExit:
+        logger.debug('Streaming interrompido antes do fim do resultado')
+        raise
+    except Exception as e:
+        logger.error('Erro ao executar query em streaming: %s', e)
+        raise
+    finally:
+        if connection:
+            if esgotado:
+                connection.close()
+            else:
+                _discard_connection(connection)
+
+def _discard_connection(connection):
+    """Fecha de fato uma conexão (mesmo emprestada do pool) em estado inconsistente."""
+    if isinstance(connection, PooledConnection):
+        connection.discard()
+    else:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+def execute_procedure(procedure_name, params=None):
+    """Executa uma stored procedure e retorna os resultados."""
+    connection = None
+    try:
+        logger.debug('Executando procedure: %s', procedure_name)
+        if params:
+            logger.debug('Parâmetros: %s', params)
+        
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.callproc(procedure_name, params or ())
+            result = cursor.fetchall()
+            logger.debug('Procedure retornou %s registros', len(result))
+            return result
+    except Exception as e:
+        logger.error('Erro ao executar procedure: %s', e)
+        raise
+    finally:
+        if connection:
+            connection.close()
+            logger.debug('Conexão com o banco de dados fechada')
+
+def execute_transaction(queries):
+    """Executa múltiplas consultas em uma transação."""
+    connection = None
+    try:
+        logger.debug('Iniciando transação com %s queries', len(queries))
+        connection = get_connection()
+        connection.begin()
+        
+        with connection.cursor() as cursor:
+            results = []
+            for i, (query, params) in enumerate(queries):
+                logger.debug('Executando query %s/%s: %s', i + 1, len(queries), query)
+                if params:
+                    logger.debug('Parâmetros: %s', params)
+                
+                cursor.execute(query, params or ())
+                if cursor.rowcount > 0:
+                    result = cursor.fetchall()
+                    results.append(result)
+                    logger.debug('Query %s retornou %s registros', i + 1, len(result))
+                else:
+                    results.append(None)
+                    logger.debug('Query %s não retornou registros', i + 1)
+            
+            connection.commit()
+            logger.info('Transação commitada com sucesso')
+            return results
+    except Exception as e:
+        if connection:
+            connection.rollback()
+            logger.error('Erro na transação, realizando rollback: %s', e)
+        raise
+    finally:
+        if connection:
+            connection.close()
+            logger.debug('Conexão com o banco de dados fechada')
+
+def run_transaction(func, retries=None):
+    """
+    Executa func(cursor) em uma transação no primário e faz commit no fim,
+    retornando o resultado de func. Em deadlock ou lock wait timeout faz
+    rollback e repete func do início (até `retries` vezes, com espera
+    exponencial e aleatória); func não deve ter efeitos fora do banco.
+    """
+    retries = Config.DB_DEADLOCK_RETRIES if retries is None else retries
+    connection = None
+    try:
+        connection = get_connection()
+        for tentativa in range(retries + 1):
+            try:
+                connection.begin()
+                with connection.cursor() as cursor:
+                    resultado = func(cursor)
+                connection.commit()
+                return resultado
+            except pymysql.err.OperationalError as e:
+                connection.rollback()
+                if e.args[0] not in RETRYABLE_LOCK_ERRORS or tentativa == retries:
+                    raise
+                espera = random.uniform(0, Config.DB_DEADLOCK_BACKOFF_MS * 2 ** tentativa) / 1000
+                logger.warning('Conflito de lock (%s), repetindo a transação em %.0f ms (tentativa %s/%s)',
+                               e.args[0], espera * 1000, tentativa + 1, retries)
+                time.sleep(espera)
+            except Exception:
+                connection.rollback()
+                raise
+    finally:
+        if connection:
+            connection.close()
+
+def insert_record(table, data):
+    """Insere um registro em uma tabela e retorna o ID inserido."""
+    connection = None
+    try:
+        columns = ', '.join(data.keys())
+        placeholders = ', '.join(['%s'] * len(data))
+        query = f"INSERT INTO {table} ({columns}) VALUES ({placeholders})"
+        
+        logger.debug('Inserindo registro na tabela %s', table)
+        logger.debug('Query: %s', query)
+        logger.debug('Dados: %s', data)
+        
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(query, list(data.values()))
+            last_id = cursor.lastrowid
+            logger.info('Registro inserido com sucesso na tabela %s. ID: %s', table, last_id)
+            return last_id
+    except Exception as e:
+        logger.error('Erro ao inserir registro na tabela %s: %s', table, e)
+        raise
+    finally:
+        if connection:
+            connection.close()
+            logger.debug('Conexão com o banco de dados fechada')
+
+def _obter_max_allowed_packet(cursor):
+    # Lido uma vez por processo: a variável só muda com SET GLOBAL e vale para conexões novas.
+    global _max_allowed_packet
+    if _max_allowed_packet is None:
+        cursor.execute("SELECT @@max_allowed_packet AS max_packet")
+        _max_allowed_packet = int(cursor.fetchone()['max_packet'])
+    return _max_allowed_packet
+
+def _bulk_insert(table, rows, chunk_size, sufixo=''):
+    """
+    Executa INSERTs multi-linha em uma única transação.
+
+    As linhas são agrupadas em lotes de até `chunk_size` linhas, respeitando
+    também o @@max_allowed_packet do servidor. Retorna, por lote, a tupla
+    (lastrowid, rowcount, quantidade_de_linhas).
+
+    Usa uma conexão própria do pool, nunca a sessão da requisição: o begin()
+    e o commit() do lote não podem confirmar nem encerrar a transação de quem
+    chamou. Por isso as linhas são gravadas de forma independente dela.
+    """
+    if not rows:
+        return []
+
+    columns = list(rows[0].keys())
+    for row in rows:
+        if list(row.keys()) != columns:
+            raise ValueError(f'Todas as linhas devem ter as mesmas colunas, na mesma ordem ({", ".join(columns)}).')
+
+    cabecalho = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    placeholders = '(' + ', '.join(['%s'] * len(columns)) + ')'
+
+    connection = None
+    try:
+        logger.debug('Inserção em lote na tabela %s: %s linhas, lotes de até %s', table, len(rows), chunk_size)
+        connection = _acquire_connection()
+        with connection.cursor() as cursor:
+            # Folga para o cabeçalho do protocolo e para o sufixo ON DUPLICATE KEY.
+            limite_bytes = int(_obter_max_allowed_packet(cursor) * 0.9) - len(cabecalho) - len(sufixo)
+
+            connection.begin()
+            resultados = []
+            lote, tamanho_lote = [], 0
+            for row in rows:
+                valores = cursor.mogrify(placeholders, [row[c] for c in columns])
+                tamanho = len(valores.encode('utf-8')) + 1
+                if lote and (len(lote) >= chunk_size or tamanho_lote + tamanho > limite_bytes):
+                    cursor.execute(cabecalho + ','.join(lote) + sufixo)
+                    resultados.append((cursor.lastrowid, cursor.rowcount, len(lote)))
+                    lote, tamanho_lote = [], 0
+                lote.append(valores)
+                tamanho_lote += tamanho
+            cursor.execute(cabecalho + ','.join(lote) + sufixo)
+            resultados.append((cursor.lastrowid, cursor.rowcount, len(lote)))
+
+            connection.commit()
+            logger.info('%s linhas gravadas na tabela %s em %s lote(s)', len(rows), table, len(resultados))
+            return resultados
+    except Exception as e:
+        if connection:
+            connection.rollback()
+        logger.error('Erro na inserção em lote na tabela %s, realizando rollback: %s', table, e)
+        raise
+    finally:
+        if connection:
+            connection.close()
+
+def insert_many(table, rows, chunk_size=1000):
+    """
+    Insere várias linhas (lista de dicts com as mesmas chaves) em uma transação.
+
+    Retorna, por lote, a tupla (primeiro_id, quantidade_de_linhas). Os IDs de
+    um lote não são necessariamente consecutivos: com innodb_autoinc_lock_mode=2
+    (padrão do MySQL 8) inserções concorrentes podem intercalar IDs. Quem
+    precisa dos IDs de cada linha deve relê-los por uma chave natural.
+    """
+    resultados = _bulk_insert(table, rows, chunk_size)
+    return [(primeiro_id, quantidade) for primeiro_id, _, quantidade in resultados]
+
+def upsert_many(table, rows, update_columns=None, chunk_size=1000):
+    """
+    Insere ou atualiza várias linhas com INSERT ... ON DUPLICATE KEY UPDATE.
+
+    `update_columns` define as colunas sobrescritas quando a chave já existe
+    (padrão: todas as colunas das linhas). Retorna o total de linhas afetadas
+    informado pelo MySQL (1 por linha inserida, 2 por linha alterada).
+    """
+    if not rows:
+        return 0
+    update_columns = update_columns or list(rows[0].keys())
+    sufixo = ' ON DUPLICATE KEY UPDATE ' + ', '.join(f"{c} = VALUES({c})" for c in update_columns)
+    resultados = _bulk_insert(table, rows, chunk_size, sufixo)
+    return sum(rowcount for _, rowcount, _ in resultados)
+
+def update_record(table, data, condition):
+    """Atualiza registros em uma tabela com base em uma condição."""
+    connection = None
+    try:
+        set_clause = ', '.join([f"{key} = %s" for key in data.keys()])
+        where_clause = ' AND '.join([f"{key} = %s" for key in condition.keys()])
+        query = f"UPDATE {table} SET {set_clause} WHERE {where_clause}"
+        
+        logger.debug('Atualizando registros na tabela %s', table)
+        logger.debug('Query: %s', query)
+        logger.debug('Dados: %s', data)
+        logger.debug('Condição: %s', condition)
+        
+        params = list(data.values()) + list(condition.values())
+        
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(query, params)
+            affected_rows = cursor.rowcount
+            logger.info('%s registros atualizados na tabela %s', affected_rows, table)
+            return affected_rows
+    except Exception as e:
+        logger.error('Erro ao atualizar registros na tabela %s: %s', table, e)
+        raise
+    finally:
+        if connection:
+            connection.close()
+            logger.debug('Conexão com o banco de dados fechada')
+
+def delete_record(table, condition):
+    """Exclui registros de uma tabela com base em uma condição."""
+    connection = None
+    try:
+        where_clause = ' AND '.join([f"{key} = %s" for key in condition.keys()])
+        query = f"DELETE FROM {table} WHERE {where_clause}"
+        
+        logger.debug('Excluindo registros da tabela %s', table)
+        logger.debug('Query: %s', query)
+        logger.debug('Condição: %s', condition)
+        
+        connection = get_connection()
+        with connection.cursor() as cursor:
+            cursor.execute(query, list(condition.values()))
+            affected_rows = cursor.rowcount
+            logger.info('%s registros excluídos da tabela %s', affected_rows, table)
+            return affected_rows
+    except Exception as e:
+        logger.error('Erro ao excluir registros da tabela %s: %s', table, e)
+        raise
+    finally:
+        if connection:
+            connection.close()
             logger.debug('Conexão com o banco de dados fechada')
\ No newline at end of file
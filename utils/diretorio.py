@@ -0,0 +1,182 @@
+import heapq
+import threading
+import time
+import uuid
+from bisect import bisect_left
+
+from config import Config
+from utils.busca import PESOS_CAMPOS, IndiceBusca, dobrar
+from utils.db import get_connection
+from utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+# Colunas da listagem pública de atendentes (GET /api/atendentes), também usada
+# pela rota quando o filtro de situação não é ATIVO.
+CONSULTA_ATENDENTES = """
+        SELECT
+            u.id_usuario, u.nome_completo, u.nome_social, u.email, u.identidade_genero,
+            ad.area_atuacao, ad.qualificacao_descricao, ad.especialidades,
+            ad.registro_profissional, ad.anos_experiencia, ad.curriculo_link,
+            ad.aceita_atendimento_online, ad.aceita_atendimento_presencial,
+            ad.duracao_padrao_atendimento_min,
+            notas.media_avaliacoes, COALESCE(notas.total_avaliacoes, 0) AS total_avaliacoes,
+            u.data_criacao AS data_criacao_usuario, u.situacao AS situacao_usuario
+
+        FROM usuario u
+        JOIN atendente_detalhes ad ON u.id_usuario = ad.id_usuario
+        LEFT JOIN atendente_avaliacao_resumo notas ON notas.id_atendente = u.id_usuario
+        WHERE u.tipo_usuario = 'ATENDENTE'
+"""
+
+class _Registro:
+    __slots__ = ('id', 'dados', 'chave', 'area')
+
+    def __init__(self, dados):
+        self.id = dados['id_usuario']
+        self.dados = dados
+        media = dados['media_avaliacoes']
+        # Mesma ordem do ORDER BY media_avaliacoes DESC, nome_completo ASC (NULL por último).
+        self.chave = (media is None, -(media or 0), dobrar(dados['nome_completo']), self.id)
+        self.area = dados['area_atuacao']
+
+
+class _Snapshot:
+    __slots__ = ('registros', 'por_id', 'por_area', 'etag', 'expira_em')
+
+    def __init__(self, registros, etag, ttl):
+        self.registros = registros
+        self.por_id = {registro.id: registro for registro in registros}
+        self.por_area = {}
+        for registro in registros:
+            self.por_area.setdefault(registro.area, []).append(registro)
+        self.etag = etag
+        self.expira_em = time.monotonic() + ttl
+
+
+class DiretorioAtendentes:
+    """
+    Listagem pública dos atendentes ATIVO em memória, já ordenada pela
+    avaliação e pelo nome, com uma lista por área de atuação e um índice de
+    busca (utils/busca.IndiceBusca) dos perfis.
+
+    Leitores usam o snapshot atual sem lock; cada mudança monta um snapshot
+    novo. Quem altera perfil, situação ou avaliações chama `atualizar(id)`
+    depois do commit. Como cada processo tem o seu diretório, ele também é
+    recarregado inteiro a cada `ttl` segundos.
+    """
+
+    def __init__(self, ttl=60):
+        self.ttl = ttl
+        self._snapshot = None
+        self._indice = IndiceBusca()
+        self._lock = threading.Lock()
+        # O ETag muda a cada snapshot e nunca se repete entre processos.
+        self._processo = uuid.uuid4().hex[:8]
+        self._versao = 0
+
+    def _novo_snapshot(self, registros):
+        self._versao += 1
+        return _Snapshot(registros, f'diretorio-{self._processo}-{self._versao}', self.ttl)
+
+    def _consultar(self, filtro='', params=()):
+        connection = get_connection()
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(CONSULTA_ATENDENTES + " AND u.situacao = 'ATIVO'" + filtro, params)
+                return [_Registro(linha) for linha in cursor.fetchall()]
+        finally:
+            connection.close()
+
+    def snapshot(self):
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.expira_em > time.monotonic():
+            return snapshot
+        # Com um snapshot vencido em mãos, só uma thread recarrega; as outras seguem com o anterior.
+        if not self._lock.acquire(blocking=snapshot is None):
+            return snapshot
+        try:
+            if self._snapshot is snapshot:
+                inicio = time.perf_counter()
+                registros = sorted(self._consultar(), key=lambda registro: registro.chave)
+                if snapshot is None:
+                    self._indice = IndiceBusca.construir((registro.id, registro.dados) for registro in registros)
+                else:
+                    self._reindexar(snapshot, registros)
+                self._snapshot = self._novo_snapshot(registros)
+                logger.info('Diretório de atendentes carregado: %s atendentes em %.1f ms',
+                            len(registros), (time.perf_counter() - inicio) * 1000)
+            return self._snapshot
+        finally:
+            self._lock.release()
+
+    def _reindexar(self, anterior, registros):
+        # Recarga periódica: só os perfis alterados (em geral por outro worker) voltam ao índice.
+        for registro in registros:
+            antigo = anterior.por_id.get(registro.id)
+            if antigo is None or any(antigo.dados[campo] != registro.dados[campo] for campo in PESOS_CAMPOS):
+                self._indice.adicionar(registro.id, registro.dados)
+        ids_atuais = {registro.id for registro in registros}
+        for id_usuario in anterior.por_id.keys() - ids_atuais:
+            self._indice.remover(id_usuario)
+
+    def atualizar(self, id_usuario):
+        """Relê um atendente do banco e o coloca (ou tira) do diretório. Chamar depois do commit."""
+        with self._lock:
+            # A leitura acontece com o lock: o último snapshot montado é sempre o da leitura mais recente.
+            if self._snapshot is None:
+                return
+            novos = self._consultar(" AND u.id_usuario = %s", (id_usuario,))
+            registros = [registro for registro in self._snapshot.registros if registro.id != id_usuario]
+            self._indice.remover(id_usuario)
+            chaves = [registro.chave for registro in registros]
+            for registro in novos:
+                posicao = bisect_left(chaves, registro.chave)
+                chaves.insert(posicao, registro.chave)
+                registros.insert(posicao, registro)
+                self._indice.adicionar(registro.id, registro.dados)
+            snapshot = self._novo_snapshot(registros)
+            snapshot.expira_em = self._snapshot.expira_em
+            self._snapshot = snapshot
+        logger.debug('Diretório de atendentes: atendente %s atualizado', id_usuario)
+
+    def listar(self, area=None, busca=None, limite=None):
+        """
+        Retorna (registros filtrados, ETag do snapshot). Sem busca, na ordem da
+        listagem; com busca, pela relevância e, no empate, na ordem da listagem.
+        """
+        snapshot = self.snapshot()
+        pontuacoes = self._indice.buscar(busca) if busca else None
+        if pontuacoes is None:
+            registros = snapshot.por_area.get(area, []) if area else snapshot.registros
+        else:
+            # Só os documentos encontrados são ordenados; o empate segue a ordem da listagem.
+            registros = [snapshot.por_id[id_usuario] for id_usuario in pontuacoes if id_usuario in snapshot.por_id]
+            if area:
+                registros = [registro for registro in registros if registro.area == area]
+            registros.sort(key=lambda registro: (-pontuacoes[registro.id], registro.chave))
+        if limite is not None:
+            registros = registros[:limite]
+        return [registro.dados for registro in registros], snapshot.etag
+
+    def sugerir(self, texto, limite=8):
+        """Sugestões de autocompletar: os atendentes mais relevantes para o que já foi digitado."""
+        snapshot = self.snapshot()
+        pontuacoes = self._indice.buscar(texto)
+        if not pontuacoes:
+            return [], snapshot.etag
+        encontrados = [snapshot.por_id[id_usuario] for id_usuario in pontuacoes if id_usuario in snapshot.por_id]
+        melhores = heapq.nsmallest(limite, encontrados, key=lambda registro: (-pontuacoes[registro.id], registro.chave))
+        sugestoes = [
+            {
+                'id_usuario': registro.id,
+                'nome': registro.dados['nome_social'] or registro.dados['nome_completo'],
+                'area_atuacao': registro.area,
+            }
+            for registro in melhores
+        ]
+        return sugestoes, snapshot.etag
+
+
+diretorio_atendentes = DiretorioAtendentes(Config.ATENDENTES_DIRETORIO_TTL)
@@ -1,56 +1,176 @@
-import logging
-import os
-from logging.handlers import RotatingFileHandler
-from datetime import datetime
-
-
-LOG_DIR = 'logs'
-if not os.path.exists(LOG_DIR):
-    os.makedirs(LOG_DIR)
-
-
-LOG_FILE = os.path.join(LOG_DIR, f'app_{datetime.now().strftime("%Y%m")}.log')
-
-def setup_logger(name):
-    """
-    Configura e retorna um logger personalizado.
-    
-    Args:
-        name: Nome do logger (geralmente __name__ do módulo)
-    
-    Returns:
-        Logger configurado
-    """
-
-    logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
-
-
-    if logger.handlers:
-        return logger
-
-
-    formatter = logging.Formatter(
-        '%(asctime)s [%(levelname)s] %(module)s:%(lineno)d - %(message)s',
-        datefmt='%d/%m/%Y %H:%M:%S'
-    )
-
-    file_handler = RotatingFileHandler(
-        LOG_FILE,
-        maxBytes=5*1024*1024,
-        backupCount=5,
-        encoding='utf-8'
-    )
-    file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
-
-
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.DEBUG)
-    console_handler.setFormatter(formatter)
-
-
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-
-    return logger 
\ No newline at end of file
+import atexit
+import copy
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from datetime import datetime
+from config import Config
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava entre processos (servidor de desenvolvimento roda em um processo só)
+    fcntl = None
+
+
+LOG_DIR = Config.LOG_DIR
+if not os.path.exists(LOG_DIR):
+    os.makedirs(LOG_DIR)
+
+
+LOG_FILE = os.path.join(LOG_DIR, f'app_{datetime.now().strftime("%Y%m")}.log')
+
+_handlers = {}
+_listeners = []
+_loggers = set()
+_lock = threading.Lock()
+
+
+class InterProcessRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler seguro com vários processos (ex.: workers do gunicorn).
+
+    Cada escrita (e a eventual rotação) acontece sob um flock em `<arquivo>.lock`,
+    e o processo reabre o arquivo quando percebe que outro processo já o rotacionou.
+    """
+
+    def __init__(self, filename, *args, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self._lock_file = open(self.baseFilename + '.lock', 'a') if fcntl else None
+
+    def emit(self, record):
+        if self._lock_file is None:
+            return super().emit(record)
+        fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+        try:
+            self._reabrir_se_rotacionado()
+            super().emit(record)
+        finally:
+            fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _reabrir_se_rotacionado(self):
+        if self.stream is None:
+            return
+        try:
+            rotacionado = os.stat(self.baseFilename).st_ino != os.fstat(self.stream.fileno()).st_ino
+        except FileNotFoundError:
+            rotacionado = True
+        if rotacionado:
+            self.stream.close()
+            self.stream = self._open()
+
+    def close(self):
+        super().close()
+        if self._lock_file is not None:
+            self._lock_file.close()
+            self._lock_file = None
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler que deixa o layout (Config.LOG_FORMAT) e a escrita para a
+    thread do QueueListener.
+
+    A mensagem e o texto da exceção são montados aqui, na thread da
+    requisição, e só para registros que passaram do nível: os argumentos podem
+    ser dicts/listas que a requisição ainda vai alterar, e o traceback manteria
+    os frames vivos até a escrita.
+    """
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _formatador_excecoes.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_formatador_excecoes = logging.Formatter()
+
+
+def _build_handlers(log_file):
+    formatter = logging.Formatter(Config.LOG_FORMAT, datefmt=Config.LOG_DATE_FORMAT)
+
+    file_handler = InterProcessRotatingFileHandler(
+        os.path.join(LOG_DIR, log_file) if log_file else LOG_FILE,
+        maxBytes=Config.LOG_MAX_SIZE,
+        backupCount=Config.LOG_BACKUP_COUNT,
+        encoding='utf-8'
+    )
+    file_handler.setFormatter(formatter)
+
+    console_handler = logging.StreamHandler()
+    console_handler.setFormatter(formatter)
+
+    return [file_handler, console_handler]
+
+
+def _get_handlers(log_file):
+    """Handlers compartilhados por todos os loggers que escrevem no mesmo arquivo."""
+    with _lock:
+        if log_file not in _handlers:
+            destinos = _build_handlers(log_file)
+            if Config.LOG_ASYNC:
+                fila = queue.SimpleQueue()
+                listener = QueueListener(fila, *destinos, respect_handler_level=True)
+                listener.start()
+                _listeners.append(listener)
+                _handlers[log_file] = [DeferredQueueHandler(fila)]
+            else:
+                _handlers[log_file] = destinos
+        return _handlers[log_file]
+
+
+def stop_listeners():
+    """Esvazia as filas de log e encerra as threads de escrita."""
+    with _lock:
+        while _listeners:
+            _listeners.pop().stop()
+
+
+atexit.register(stop_listeners)
+
+
+def set_log_level(level):
+    """Altera em tempo de execução o nível de todos os loggers configurados."""
+    for name in list(_loggers):
+        logging.getLogger(name).setLevel(level)
+
+
+def setup_logger(name, log_file=None):
+    """
+    Configura e retorna um logger personalizado.
+
+    O nível vem de Config.LOG_LEVEL; mensagens abaixo dele são descartadas
+    antes de qualquer formatação. Com Config.LOG_ASYNC a escrita em disco e no
+    console é feita por uma thread de fundo (QueueListener).
+
+    Use argumentos no estilo %s (logger.debug('x: %s', valor)) em vez de
+    f-strings, para que a mensagem só seja montada se o nível estiver ativo.
+
+    Args:
+        name: Nome do logger (geralmente __name__ do módulo)
+        log_file: Arquivo dentro de LOG_DIR para este logger (padrão: log geral da aplicação)
+
+    Returns:
+        Logger configurado
+    """
+
+    logger = logging.getLogger(name)
+    logger.setLevel(Config.LOG_LEVEL)
+    _loggers.add(name)
+
+
+    if logger.handlers:
+        return logger
+
+
+    for handler in _get_handlers(log_file):
+        logger.addHandler(handler)
+    logger.propagate = False
+
+    return logger
@@ -0,0 +1,200 @@
+import threading
+import time
+from collections import deque
+
+from pymysql.constants import SERVER_STATUS
+from utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Nenhuma conexão ficou livre dentro do tempo de espera do pool."""
+
+
+class PooledConnection:
+    """
+    Conexão emprestada de um ConnectionPool.
+
+    Repassa todos os atributos para a conexão PyMySQL original, mas close()
+    devolve a conexão ao pool em vez de encerrá-la. Assim o código que já faz
+    `connection.close()` no `finally` continua funcionando sem alterações.
+    """
+
+    def __init__(self, pool, raw, created_at):
+        self._pool = pool
+        self._raw = raw
+        self._created_at = created_at
+        self._released = False
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._released:
+            return
+        self._released = True
+        self._pool.release(self)
+
+    def discard(self):
+        """Encerra a conexão em vez de devolvê-la para reuso."""
+        if self._released:
+            return
+        try:
+            self._raw.close()
+        except Exception:
+            pass
+        self.close()
+
+
+class ConnectionPool:
+    """
+    Pool de conexões thread-safe com tamanho mínimo/máximo.
+
+    - Conexões ociosas além de `min_size` são fechadas após `idle_timeout` segundos.
+    - Conexões com mais de `max_lifetime` segundos são recicladas na devolução.
+    - Toda conexão reaproveitada recebe um ping antes de ser entregue.
+    - Quando `max_size` conexões estão emprestadas, acquire() espera até
+      `checkout_timeout` segundos e então levanta PoolTimeoutError.
+    """
+
+    def __init__(self, factory, min_size=2, max_size=20, idle_timeout=300,
+                 max_lifetime=3600, checkout_timeout=10, name='default'):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError('Tamanhos de pool inválidos.')
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.max_lifetime = max_lifetime
+        self.checkout_timeout = checkout_timeout
+        self.name = name
+
+        self._idle = deque()  # (conexão, criada_em, devolvida_em)
+        self._size = 0
+        self._cond = threading.Condition(threading.Lock())
+        self._closed = False
+
+    def acquire(self):
+        """Empresta uma conexão do pool, criando uma nova se houver espaço."""
+        deadline = time.monotonic() + self.checkout_timeout
+        descartar = []
+        entry = None
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError(f'Pool {self.name} está fechado.')
+                self._prune_idle_locked(time.monotonic(), descartar)
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error('Timeout aguardando conexão do pool %s (%s em uso)', self.name, self.max_size)
+                    raise PoolTimeoutError(f'Nenhuma conexão livre no pool {self.name} após {self.checkout_timeout}s.')
+                self._cond.wait(remaining)
+
+        for raw in descartar:
+            self._close_raw(raw)
+
+        if entry is not None:
+            raw, created_at, _ = entry
+            if self._is_alive(raw):
+                return PooledConnection(self, raw, created_at)
+            logger.warning('Conexão ociosa do pool %s não respondeu ao ping; abrindo outra', self.name)
+            self._close_raw(raw)
+
+        try:
+            raw = self.factory()
+        except Exception:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            raise
+        return PooledConnection(self, raw, time.monotonic())
+
+    def release(self, conn):
+        """Devolve uma conexão ao pool (chamado por PooledConnection.close)."""
+        raw = conn._raw
+        now = time.monotonic()
+        reusable = not self._closed and raw.open and now - conn._created_at < self.max_lifetime
+        if reusable:
+            try:
+                self._reset(raw)
+            except Exception as e:
+                logger.warning('Falha ao limpar conexão devolvida ao pool %s: %s', self.name, e)
+                reusable = False
+
+        with self._cond:
+            if reusable:
+                self._idle.append((raw, conn._created_at, now))
+            else:
+                self._size -= 1
+            self._cond.notify()
+
+        if not reusable:
+            self._close_raw(raw)
+
+    def close(self):
+        """Fecha todas as conexões ociosas e impede novos empréstimos."""
+        with self._cond:
+            self._closed = True
+            descartar = [raw for raw, _, _ in self._idle]
+            self._size -= len(descartar)
+            self._idle.clear()
+            self._cond.notify_all()
+        for raw in descartar:
+            self._close_raw(raw)
+
+    def stats(self):
+        with self._cond:
+            return {
+                'nome': self.name,
+                'abertas': self._size,
+                'ociosas': len(self._idle),
+                'em_uso': self._size - len(self._idle),
+                'max': self.max_size,
+            }
+
+    def _prune_idle_locked(self, now, descartar):
+        # As conexões mais antigas ficam à esquerda; as reaproveitadas saem pela direita.
+        while self._idle and self._size > self.min_size:
+            raw, created_at, returned_at = self._idle[0]
+            if now - returned_at < self.idle_timeout and now - created_at < self.max_lifetime:
+                break
+            self._idle.popleft()
+            self._size -= 1
+            descartar.append(raw)
+
+    @staticmethod
+    def _reset(raw):
+        # Transação esquecida aberta ou autocommit alterado não podem vazar para o próximo uso.
+        if raw.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+            raw.rollback()
+        if not raw.get_autocommit():
+            raw.autocommit(True)
+
+    @staticmethod
+    def _is_alive(raw):
+        try:
+            raw.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _close_raw(raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
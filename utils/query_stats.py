@@ -0,0 +1,150 @@
+import functools
+import random
+import re
+import time
+
+from flask import g, has_request_context, request
+from pymysql.cursors import DictCursor, SSDictCursor
+from config import Config
+from utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+slow_logger = setup_logger('slow_query', log_file='slow_queries.log')
+
+_COMENTARIOS = re.compile(r'/\*.*?\*/|--[^\n]*|#[^\n]*', re.S)
+_STRINGS = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.)*\"")
+_NUMEROS = re.compile(r'\b\d+(?:\.\d+)?\b')
+_PLACEHOLDERS = re.compile(r'%s|%\([^)]+\)s')
+_ESPACOS = re.compile(r'\s+')
+_LISTAS = re.compile(r'\(\s*\?(?:\s*,\s*\?)+\s*\)')
+_TUPLAS_REPETIDAS = re.compile(r'\(\?\+\)(?:\s*,\s*\(\?\+\))+')
+
+
+def _normalizar(query):
+    texto = _COMENTARIOS.sub(' ', query)
+    texto = _STRINGS.sub('?', texto)
+    texto = _NUMEROS.sub('?', texto)
+    texto = _PLACEHOLDERS.sub('?', texto)
+    texto = _ESPACOS.sub(' ', texto).strip()
+    texto = _LISTAS.sub('(?+)', texto)
+    return _TUPLAS_REPETIDAS.sub('(?+)...', texto)
+
+
+@functools.lru_cache(maxsize=512)
+def _normalizar_cache(query):
+    return _normalizar(query)
+
+
+def fingerprint(query):
+    """
+    Normaliza um statement para agrupar execuções equivalentes: literais e
+    placeholders viram '?', listas IN (...) e VALUES multi-linha são colapsadas
+    e espaços/comentários são removidos.
+    """
+    if isinstance(query, bytes):
+        query = query.decode('utf-8', 'replace')
+    # Templates curtos se repetem muito; statements enormes (inserts em lote) não valem o cache.
+    if len(query) <= 4096:
+        return _normalizar_cache(query)
+    return _normalizar(query)
+
+
+def _request_query_stats():
+    if 'query_stats' not in g:
+        g.query_stats = {'total': 0, 'tempo_ms': 0.0, 'por_fingerprint': {}}
+    return g.query_stats
+
+
+def get_request_query_stats():
+    """Resumo das queries da requisição atual: total, tempo e contagem por fingerprint."""
+    if not has_request_context():
+        return None
+    return _request_query_stats()
+
+
+def _registrar(cursor, query, args, inicio, permite_explain):
+    tempo_ms = (time.perf_counter() - inicio) * 1000
+    fp = fingerprint(query)
+
+    if has_request_context():
+        stats = _request_query_stats()
+        stats['total'] += 1
+        stats['tempo_ms'] += tempo_ms
+        por_fp = stats['por_fingerprint'].setdefault(fp, [0, 0.0])
+        por_fp[0] += 1
+        por_fp[1] += tempo_ms
+
+    if tempo_ms >= Config.DB_SLOW_QUERY_MS:
+        rota = f' [{request.method} {request.path}]' if has_request_context() else ''
+        slow_logger.warning('Query lenta (%.1f ms)%s: %s', tempo_ms, rota, fp)
+        if permite_explain and random.random() < Config.DB_SLOW_QUERY_EXPLAIN_SAMPLE_RATE:
+            _explain(cursor, query, args)
+
+
+def _explain(cursor, query, args):
+    texto = query.decode('utf-8', 'replace') if isinstance(query, bytes) else query
+    if not texto.lstrip(' \t\r\n(').upper().startswith('SELECT'):
+        return
+    try:
+        with cursor.connection.cursor(DictCursor) as explain_cursor:
+            explain_cursor.execute('EXPLAIN ' + texto, args)
+            for linha in explain_cursor.fetchall():
+                slow_logger.warning('  EXPLAIN: %s', linha)
+    except Exception as e:
+        slow_logger.warning('  EXPLAIN falhou: %s', e)
+
+
+class _InstrumentedCursorMixin:
+    """Mede o tempo de cada statement e registra no resumo da requisição/slow-query log."""
+
+    _permite_explain = True
+
+    def execute(self, query, args=None):
+        inicio = time.perf_counter()
+        try:
+            return super().execute(query, args)
+        finally:
+            _registrar(self, query, args, inicio, self._permite_explain)
+
+    def callproc(self, procname, args=()):
+        inicio = time.perf_counter()
+        try:
+            return super().callproc(procname, args)
+        finally:
+            _registrar(self, f'CALL {procname}', None, inicio, False)
+
+
+class InstrumentedDictCursor(_InstrumentedCursorMixin, DictCursor):
+    pass
+
+
+class InstrumentedSSDictCursor(_InstrumentedCursorMixin, SSDictCursor):
+    # Com cursor não bufferizado o resultado ainda está pendente na conexão, então não dá para rodar EXPLAIN.
+    _permite_explain = False
+
+
+def _iniciar_cronometro():
+    g.inicio_requisicao = time.perf_counter()
+
+
+def _finalizar_requisicao(response):
+    stats = g.get('query_stats')
+    partes = []
+    if stats:
+        partes.append(f'db;dur={stats["tempo_ms"]:.1f};desc="{stats["total"]} queries"')
+        for fp, (quantidade, tempo_ms) in stats['por_fingerprint'].items():
+            if quantidade > Config.DB_N_PLUS_ONE_THRESHOLD:
+                logger.warning('Possível N+1 em %s %s: %sx (%.1f ms) %s', request.method, request.path, quantidade, tempo_ms, fp)
+                partes.append(f'n-plus-one;dur={tempo_ms:.1f};desc="{quantidade}x"')
+    if 'inicio_requisicao' in g:
+        partes.append(f'app;dur={(time.perf_counter() - g.inicio_requisicao) * 1000:.1f}')
+    if partes:
+        response.headers['Server-Timing'] = ', '.join(partes)
+    return response
+
+
+def init_query_stats(app):
+    """Registra na aplicação o resumo de queries por requisição (Server-Timing e detecção de N+1)."""
+    app.before_request(_iniciar_cronometro)
+    app.after_request(_finalizar_requisicao)
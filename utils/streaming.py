@@ -0,0 +1,47 @@
+from flask import Response, json, request, stream_with_context
+from utils.logger import setup_logger
+
+
+logger = setup_logger(__name__)
+
+
+def wants_ndjson():
+    """Indica se o cliente pediu NDJSON (?formato=ndjson ou Accept: application/x-ndjson)."""
+    if request.args.get('formato') == 'ndjson':
+        return True
+    return request.accept_mimetypes.best == 'application/x-ndjson'
+
+
+def stream_json_object(sections, status=200):
+    """
+    Gera uma resposta JSON em partes (chunked) no formato
+    {"chave1": [...], "chave2": [...]}.
+
+    `sections` é uma lista de (chave, lotes), onde lotes é um iterável de
+    listas de linhas, como o retornado por utils.db.iter_query. Cada linha é
+    serializada ao ser lida, então a memória não cresce com o tamanho do resultado.
+    """
+    def gerar():
+        yield '{'
+        for i, (chave, lotes) in enumerate(sections):
+            yield ('' if i == 0 else ',') + json.dumps(chave) + ':['
+            primeiro = True
+            for lote in lotes:
+                parte = ','.join(json.dumps(linha) for linha in lote)
+                if parte:
+                    yield parte if primeiro else ',' + parte
+                    primeiro = False
+            yield ']'
+        yield '}'
+
+    return Response(stream_with_context(gerar()), status=status, mimetype='application/json')
+
+
+def stream_ndjson(lotes, status=200):
+    """Gera uma resposta NDJSON (um objeto JSON por linha) a partir de lotes de linhas."""
+    def gerar():
+        for lote in lotes:
+            if lote:
+                yield ''.join(json.dumps(linha) + '\n' for linha in lote)
+
+    return Response(stream_with_context(gerar()), status=status, mimetype='application/x-ndjson')